@@ -0,0 +1,196 @@
+"""
+A pluggable JSON codec, used to encode request bodies and to decode response bodies.
+
+The codec is selected with the ``GLOBUS_SDK_JSON_BACKEND`` environment variable.
+By default, the standard library ``json`` module is used. With ``auto``, the fastest of
+the supported libraries which is installed is used instead.
+
+Third-party libraries do not handle every document in exactly the same way as the
+standard library. When one of them fails to encode or decode a document, the codec
+falls back to the standard library, so that the only difference which a backend can
+make is in speed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import typing as t
+
+from globus_sdk import config
+
+if t.TYPE_CHECKING:
+    from requests import Response
+
+log = logging.getLogger(__name__)
+
+# the order in which backends are tried, when the backend is "auto"
+_AUTO_ORDER = ("orjson", "msgspec", "ujson")
+# encodings in which a body can be passed to the codec as bytes
+_BYTES_ENCODINGS = ("utf-8", "utf8", "ascii", "us-ascii")
+
+
+class JSONCodec:
+    """
+    A JSON codec backed by the standard library. Subclasses use faster libraries by
+    overriding ``_dumps`` and ``_loads``.
+    """
+
+    name = "stdlib"
+
+    def _dumps(self, data: t.Any) -> bytes:
+        return json.dumps(data, allow_nan=False).encode("utf-8")
+
+    def _loads(self, data: bytes | str) -> t.Any:
+        return json.loads(data)
+
+    def dumps(self, data: t.Any) -> bytes:
+        """
+        Serialize data to UTF-8 encoded JSON.
+
+        :param data: The data to serialize
+        """
+        try:
+            return self._dumps(data)
+        except (TypeError, ValueError, OverflowError):
+            if type(self) is JSONCodec:
+                raise
+            return JSONCodec._dumps(self, data)
+
+    def loads(self, data: bytes | str) -> t.Any:
+        """
+        Deserialize a JSON document, raising ``ValueError`` if it is not valid JSON.
+
+        :param data: The document to deserialize
+        """
+        try:
+            return self._loads(data)
+        except ValueError:
+            if type(self) is JSONCodec:
+                raise
+            return JSONCodec._loads(self, data)
+
+
+class _OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._module = importlib.import_module("orjson")
+
+    def _dumps(self, data: t.Any) -> bytes:
+        return t.cast(bytes, self._module.dumps(data))
+
+    def _loads(self, data: bytes | str) -> t.Any:
+        return self._module.loads(data)
+
+
+class _MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        msgspec = importlib.import_module("msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._encode_error: type[Exception] = msgspec.EncodeError
+        self._decode_error: type[Exception] = msgspec.DecodeError
+
+    def _dumps(self, data: t.Any) -> bytes:
+        try:
+            return t.cast(bytes, self._encoder.encode(data))
+        except self._encode_error as err:
+            raise TypeError(str(err)) from err
+
+    def _loads(self, data: bytes | str) -> t.Any:
+        # msgspec errors are not ValueErrors, which callers of the codec expect
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as err:
+            raise ValueError(str(err)) from err
+
+
+class _UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def __init__(self) -> None:
+        self._module = importlib.import_module("ujson")
+
+    def _dumps(self, data: t.Any) -> bytes:
+        return t.cast(
+            bytes, self._module.dumps(data, ensure_ascii=False).encode("utf-8")
+        )
+
+    def _loads(self, data: bytes | str) -> t.Any:
+        return self._module.loads(data)
+
+
+_CODEC_CLASSES: dict[str, type[JSONCodec]] = {
+    "stdlib": JSONCodec,
+    "orjson": _OrjsonCodec,
+    "msgspec": _MsgspecCodec,
+    "ujson": _UjsonCodec,
+}
+
+_CODEC: JSONCodec | None = None
+
+
+def load_codec(backend: str) -> JSONCodec:
+    """
+    Load the codec for a named backend. ``"auto"`` selects the first installed backend
+    of ``orjson``, ``msgspec``, and ``ujson``, or the standard library.
+
+    :param backend: The name of the backend
+    :raises ValueError: If the backend is unknown
+    :raises ImportError: If the library for an explicitly named backend is not
+        installed
+    """
+    if backend == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return _CODEC_CLASSES[name]()
+            except ImportError:
+                continue
+        return JSONCodec()
+    if backend not in _CODEC_CLASSES:
+        raise ValueError(
+            f"Unknown JSON backend '{backend}'. "
+            f"Supported backends are: auto, {', '.join(_CODEC_CLASSES)}"
+        )
+    return _CODEC_CLASSES[backend]()
+
+
+def get_codec() -> JSONCodec:
+    """
+    Get the codec in use, loading it on first use based on the configured backend.
+    """
+    global _CODEC
+    if _CODEC is None:
+        _CODEC = load_codec(config.get_json_backend())
+        log.debug("using JSON backend: %s", _CODEC.name)
+    return _CODEC
+
+
+def dumps(data: t.Any) -> bytes:
+    return get_codec().dumps(data)
+
+
+def loads(data: bytes | str) -> t.Any:
+    return get_codec().loads(data)
+
+
+def loads_response(response: Response) -> t.Any:
+    """
+    Decode the body of a response as JSON, raising ``ValueError`` if it is not valid
+    JSON. This is equivalent to ``response.json()``, but uses the configured codec.
+
+    :param response: The response to decode
+    """
+    content = response.content
+    # requests leaves the content of a response which has no body as None
+    if not content:
+        raise ValueError("response has no body to decode as JSON")
+    encoding = response.encoding
+    if encoding is None or encoding.lower() in _BYTES_ENCODINGS:
+        return loads(content)
+    # a body in any other declared encoding must be decoded to text first
+    return loads(response.text)
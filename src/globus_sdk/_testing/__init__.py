@@ -1,11 +1,19 @@
+from .fake import FakeTransport
 from .helpers import construct_error, get_last_request
 from .models import RegisteredResponse, ResponseList, ResponseSet
+from .recording import (
+    RecordingTransport,
+    ReplayTransport,
+    dump_recording,
+    load_recording,
+)
 from .registry import (
     get_response_set,
     load_response,
     load_response_set,
     register_response_set,
 )
+from .server import StandInServer
 
 __all__ = (
     "get_last_request",
@@ -17,4 +25,10 @@ __all__ = (
     "load_response",
     "get_response_set",
     "register_response_set",
+    "FakeTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "dump_recording",
+    "load_recording",
+    "StandInServer",
 )
@@ -0,0 +1,153 @@
+"""
+A transport which answers requests from the registered mock responses, in process.
+
+The ``FakeTransport`` looks up responses in the registry of a ``responses`` mock, where
+``load_response`` and ``load_response_set`` register them, but it does not send
+requests through ``requests`` sessions and adapters, which the ``responses`` library
+patches. Responses are built directly as lightweight ``requests.Response`` objects.
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+import typing as t
+
+import requests
+import responses
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from globus_sdk.transport import RequestsTransport
+
+from .recording import _request_params
+
+# the registry of a `responses` mock is guarded by a lock held by the mock, which is
+# private, so lookups made by fake transports are guarded by this lock instead
+_LOOKUP_LOCK = threading.Lock()
+
+
+def _response_parts(
+    match: responses.BaseResponse, request: requests.PreparedRequest
+) -> tuple[int, t.Mapping[str, str], bytes]:
+    # get the status, headers, and body of a mock response
+    if type(match) is responses.Response:
+        if isinstance(match.body, Exception):
+            match.body.request = request  # type: ignore[attr-defined]
+            raise match.body
+        body: t.Any = match.body
+        if hasattr(body, "read"):
+            body = body.read()
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return match.status, match.get_headers(), body or b""
+    # other types of mock response, like callbacks, are built by `responses`
+    raw = match.get_response(request)
+    return raw.status, raw.headers, raw.read()
+
+
+class _FakeSession:
+    """
+    An object which stands in for the session of a transport, answering requests from
+    the registry of a ``responses`` mock.
+    """
+
+    def __init__(self, requests_mock: responses.RequestsMock) -> None:
+        self.requests_mock = requests_mock
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: t.Any
+    ) -> requests.Response:
+        # set the attributes which `responses` sets on requests, and which its
+        # matchers read
+        request.params = _request_params(str(request.url))  # type: ignore[attr-defined]
+        request.req_kwargs = kwargs  # type: ignore[attr-defined]
+        if hasattr(request.body, "read"):
+            request.body = request.body.read()  # type: ignore[union-attr]
+
+        with _LOOKUP_LOCK:
+            match, _ = self.requests_mock.get_registry().find(request)
+        if match is None:
+            error = requests.ConnectionError(
+                "Connection refused by FakeTransport - the call doesn't match any "
+                f"registered mock: {request.method} {request.url}"
+            )
+            error.request = request
+            self.requests_mock.calls.add(request, error)
+            raise error
+
+        try:
+            status, headers, body = _response_parts(match, request)
+        except BaseException as error:
+            call = responses.Call(request, error)
+            self.requests_mock.calls.add_call(call)
+            match.calls.add_call(call)
+            raise
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response._content_consumed = True
+        response.url = str(request.url)
+        response.request = request
+        response.elapsed = datetime.timedelta(0)
+
+        call = responses.Call(request, response)  # type: ignore[arg-type]
+        self.requests_mock.calls.add_call(call)
+        match.calls.add_call(call)
+        return response
+
+    def head(
+        self, url: str, *, headers: dict[str, str] | None = None, **kwargs: t.Any
+    ) -> requests.Response:
+        return self.send(
+            requests.Request("HEAD", url, headers=headers).prepare(), **kwargs
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class FakeTransport(RequestsTransport):
+    """
+    A transport which answers requests with the mock responses registered in the
+    ``responses`` library, e.g. by ``load_response``, without using ``requests``
+    sessions or adapters. This is much faster than mocking requests with
+    ``responses``, and is meant for large test suites.
+
+    Responses are chosen exactly as ``responses`` would choose them, and each request
+    and response is recorded in the ``calls`` of the mock, so ``get_last_request()``
+    works as usual. The ``responses`` mock does not need to be started. Everything
+    else that a ``RequestsTransport`` does, from encoding requests to running retry
+    checks, happens as usual. As with ``responses``, a request which does not match
+    any response raises a ``ConnectionError``.
+
+    Use it as the ``transport_class`` of a client. Responses built by the fake
+    transport are not read from a socket, so their ``raw`` attribute is ``None``, and
+    redirects are not followed.
+
+    :param requests_mock: The ``responses`` mock in which responses are registered.
+        Defaults to the default mock of the ``responses`` library
+    :param kwargs: Other parameters are passed to ``RequestsTransport``
+
+    **Examples**
+
+    >>> class FakeTransferClient(TransferClient):
+    ...     transport_class = FakeTransport
+    ...
+    >>> load_response(TransferClient.get_task)
+    >>> FakeTransferClient().get_task(task_id)
+    """
+
+    def __init__(
+        self, *, requests_mock: responses.RequestsMock | None = None, **kwargs: t.Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.fake_session = _FakeSession(
+            requests_mock if requests_mock is not None else responses.mock
+        )
+
+    def _get_session(self, url: str) -> requests.Session:
+        return t.cast(requests.Session, self.fake_session)
@@ -0,0 +1,379 @@
+"""
+Record HTTP exchanges made by SDK clients, and replay them without a network.
+
+A recording is a list of ``RegisteredResponse`` objects, saved as JSON. Replaying it
+runs every part of the SDK (request encoding, retry checks, response wrapping, and
+pagination) except for the network I/O, which makes replay suitable for measuring
+the overhead of the SDK itself.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import itertools
+import json
+import os
+import threading
+import typing as t
+import urllib.parse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from globus_sdk.transport import RequestsTransport
+
+from .models import RegisteredResponse, ResponseList, ResponseSet
+
+#: the version of the format of recording files
+RECORDING_FORMAT_VERSION = 1
+
+# response headers which are not recorded, because they describe the encoding of a
+# body on the wire, rather than the (decoded) body which is recorded, or because they
+# may hold secrets
+_UNRECORDED_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding", "set-cookie")
+)
+
+ReplaySource = t.Union[
+    ResponseList, ResponseSet, t.Iterable[t.Union[RegisteredResponse, ResponseList]]
+]
+
+
+def dump_recording(
+    responses: t.Iterable[RegisteredResponse], path: str | os.PathLike[str]
+) -> None:
+    """
+    Save responses to a recording file. The file is compact JSON, compressed with gzip
+    if its name ends in ``.gz``.
+
+    Only the URL, method, status, headers, and body of each response are saved.
+    Matchers and metadata are not.
+
+    :param responses: The responses to save
+    :param path: The path of the file to write
+    """
+    doc = {
+        "version": RECORDING_FORMAT_VERSION,
+        "responses": [_response_to_dict(r) for r in responses],
+    }
+    data = json.dumps(doc, separators=(",", ":")).encode("utf-8")
+    if str(path).endswith(".gz"):
+        data = gzip.compress(data)
+    with open(path, "wb") as fp:
+        fp.write(data)
+
+
+def load_recording(path: str | os.PathLike[str]) -> ResponseList:
+    """
+    Load the responses saved in a recording file, as a ``ResponseList``.
+
+    The responses may be replayed with a ``ReplayTransport``, or activated in the
+    ``responses`` library like any other ``ResponseList``.
+
+    :param path: The path of the file to read
+    """
+    with open(path, "rb") as fp:
+        data = fp.read()
+    if str(path).endswith(".gz"):
+        data = gzip.decompress(data)
+    doc = json.loads(data)
+    if doc.get("version") != RECORDING_FORMAT_VERSION:
+        raise ValueError(f"unsupported recording format version: {doc.get('version')}")
+    return ResponseList(*(RegisteredResponse(**r) for r in doc["responses"]))
+
+
+def _response_to_dict(response: RegisteredResponse) -> dict[str, t.Any]:
+    doc: dict[str, t.Any] = {
+        "path": response.full_url,
+        "method": response.method,
+        "status": response.status,
+    }
+    if response.headers:
+        doc["headers"] = response.headers
+    if response.content_type is not None:
+        doc["content_type"] = response.content_type
+    if response.json is not None:
+        doc["json"] = response.json
+    elif response.body is not None:
+        doc["body"] = response.body
+    return doc
+
+
+def _strip_query(url: str) -> str:
+    return urllib.parse.urlsplit(url)._replace(query="", fragment="").geturl()
+
+
+def _query_params(url: str) -> list[tuple[str, str]]:
+    return sorted(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+
+
+def _request_params(url: str) -> dict[str, t.Any]:
+    # the query parameters of a request, in the form which `responses` matchers expect
+    params: dict[str, t.Any] = {}
+    for key, group in itertools.groupby(
+        urllib.parse.parse_qsl(
+            urllib.parse.urlsplit(url).query, keep_blank_values=True
+        ),
+        lambda kv: kv[0],
+    ):
+        values = [v for _, v in group]
+        params[key] = values[0] if len(values) == 1 else values
+    return params
+
+
+def _flatten(source: ReplaySource) -> list[RegisteredResponse]:
+    if isinstance(source, ResponseList):
+        return list(source.responses)
+    flat: list[RegisteredResponse] = []
+    for item in source:
+        if isinstance(item, ResponseList):
+            flat.extend(item.responses)
+        else:
+            flat.append(item)
+    return flat
+
+
+class _ReplayRoutes:
+    """
+    A table of responses, from which requests are answered in the same way as the
+    ``responses`` library would answer them.
+
+    Responses are matched by method and URL, ignoring the query string unless the
+    registered URL has one, and by any ``match`` functions. When several responses
+    match a request, the first is removed, so a sequence of responses for the same
+    URL is served in order, and the last one is repeated.
+    """
+
+    def __init__(self, responses: t.Iterable[RegisteredResponse]) -> None:
+        self._responses = list(responses)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes: dict[tuple[str, str], list[RegisteredResponse]] = {}
+            self._used: set[int] = set()
+            for response in self._responses:
+                key = (response.method, _strip_query(response.full_url))
+                self._routes.setdefault(key, []).append(response)
+
+    def lookup(self, request: requests.PreparedRequest) -> RegisteredResponse:
+        url = str(request.url)
+        key = (str(request.method), _strip_query(url))
+        with self._lock:
+            candidates = self._routes.get(key, [])
+            found: RegisteredResponse | None = None
+            for response in candidates:
+                if not self._matches(response, request, url):
+                    continue
+                if found is None:
+                    found = response
+                    continue
+                # several responses match: the first is removed, and it is used unless
+                # it was used before, in which case the next one is used
+                candidates.remove(found)
+                if id(found) in self._used:
+                    found = response
+                break
+            if found is None:
+                raise LookupError(f"no response to replay for {key[0]} {url}")
+            self._used.add(id(found))
+            return found
+
+    @staticmethod
+    def _matches(
+        response: RegisteredResponse, request: requests.PreparedRequest, url: str
+    ) -> bool:
+        if urllib.parse.urlsplit(response.full_url).query and _query_params(
+            response.full_url
+        ) != _query_params(url):
+            return False
+        return all(matcher(request)[0] for matcher in response.match or ())
+
+
+def _encode_body(response: RegisteredResponse) -> tuple[bytes, str]:
+    # get the body of a response, and its default content type
+    if response.json is not None:
+        return json.dumps(response.json).encode("utf-8"), "application/json"
+    if response.body is None:
+        return b"", "text/plain"
+    # recorded bodies which were not valid UTF-8 are stored with escapes
+    return response.body.encode("utf-8", "surrogateescape"), "text/plain"
+
+
+def _drain_body(body: t.Any) -> None:
+    # consume a streamed request body, as sending it would, so that the cost of
+    # producing the body is included when replaying
+    if body is not None and not isinstance(body, (bytes, str)):
+        for _ in body:
+            pass
+
+
+class _ReplayAdapter(HTTPAdapter):
+    """
+    An adapter which answers requests from a table of responses, without a network.
+    """
+
+    def __init__(self, routes: _ReplayRoutes) -> None:
+        super().__init__()
+        self.routes = routes
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: t.Any
+    ) -> requests.Response:
+        _drain_body(request.body)
+        # `responses` matchers read these attributes, which `responses` sets on requests
+        request.params = _request_params(str(request.url))  # type: ignore[attr-defined]
+        request.req_kwargs = kwargs  # type: ignore[attr-defined]
+        registered = self.routes.lookup(request)
+        if isinstance(registered.body, Exception):
+            raise registered.body
+
+        body, default_content_type = _encode_body(registered)
+        headers = dict(registered.headers or {})
+        if not any(k.lower() == "content-type" for k in headers):
+            headers["Content-Type"] = registered.content_type or default_content_type
+        headers["Content-Length"] = str(len(body))
+        raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=registered.status,
+            reason=http.client.responses.get(registered.status),
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+
+class _RecordingAdapter(HTTPAdapter):
+    """
+    An adapter which sends requests over the network, and records their responses.
+    """
+
+    def __init__(self, recording: ResponseList) -> None:
+        super().__init__()
+        self.recording = recording
+        self._lock = threading.Lock()
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: t.Any
+    ) -> requests.Response:
+        response = super().send(request, **kwargs)
+        # read the whole body, even when streaming, so that it can be recorded
+        # the body remains available to the caller, from memory
+        content = response.content
+        recorded = RegisteredResponse(
+            path=str(request.url),
+            method=t.cast(t.Any, str(request.method)),
+            status=response.status_code,
+            headers={
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _UNRECORDED_HEADERS
+            },
+            body=content.decode("utf-8", "surrogateescape"),
+        )
+        with self._lock:
+            self.recording.responses.append(recorded)
+            recorded.parent = self.recording
+        return response
+
+
+class RecordingTransport(RequestsTransport):
+    """
+    A transport which sends requests normally, and records every response it receives,
+    including the responses to retried attempts, in ``recording``.
+
+    Use it as the ``transport_class`` of a client, then save the recording with
+    ``save()``, or with ``dump_recording``, for later replay. Recorded bodies are
+    decoded, so compressed responses are replayed uncompressed. Request headers,
+    including ``Authorization``, are never recorded, but response bodies are recorded
+    as they are, so only share recordings of data which may be shared.
+
+    All requests are sent with the ``session`` of the transport, so that they can be
+    recorded. A ``connection_pools`` registry is not used.
+
+    :param recording: The ``ResponseList`` to which responses are added. By default,
+        the transport creates a new one.
+    :param kwargs: Other parameters are passed to ``RequestsTransport``
+
+    **Examples**
+
+    >>> class RecordingTransferClient(TransferClient):
+    ...     transport_class = RecordingTransport
+    ...
+    >>> tc = RecordingTransferClient(authorizer=...)
+    >>> tc.task_list()
+    >>> tc.transport.save("task_list.json.gz")
+    """
+
+    def __init__(
+        self, *, recording: ResponseList | None = None, **kwargs: t.Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.recording = recording if recording is not None else ResponseList()
+        adapter = _RecordingAdapter(self.recording)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get_session(self, url: str) -> requests.Session:
+        return self.session
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Save the recorded responses to a file.
+
+        :param path: The path of the file to write, see ``dump_recording``
+        """
+        dump_recording(self.recording.responses, path)
+
+
+class ReplayTransport(RequestsTransport):
+    """
+    A transport which answers requests with recorded or registered responses, without
+    using the network. Everything else that a ``RequestsTransport`` does, from
+    encoding requests to running retry checks, happens as usual.
+
+    Responses are chosen in the same way as the ``responses`` library chooses
+    them, so the ``_testing`` response sets of the SDK can be replayed as well as
+    recordings. A request with no matching response raises a ``LookupError``.
+
+    Replay is deterministic, and ``reset()`` restores the initial state of the
+    responses, so that a workload can be repeated exactly.
+
+    :param replay: The responses to replay, e.g. from ``load_recording``, or a
+        ``ResponseSet``
+    :param kwargs: Other parameters are passed to ``RequestsTransport``
+
+    **Examples**
+
+    >>> class ReplayTransferClient(TransferClient):
+    ...     transport_class = ReplayTransport
+    ...
+    >>> tc = ReplayTransferClient(
+    ...     transport_params={"replay": load_recording("task_list.json.gz")}
+    ... )
+    >>> tc.task_list()
+    """
+
+    def __init__(self, *, replay: ReplaySource, **kwargs: t.Any) -> None:
+        super().__init__(**kwargs)
+        self.routes = _ReplayRoutes(_flatten(replay))
+        adapter = _ReplayAdapter(self.routes)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get_session(self, url: str) -> requests.Session:
+        return self.session
+
+    def reset(self) -> None:
+        """
+        Restore the responses which were used up by earlier requests, so that replay
+        starts over.
+        """
+        self.routes.reset()
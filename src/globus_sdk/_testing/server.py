@@ -0,0 +1,569 @@
+"""
+A local HTTP server which stands in for Globus services, for load and concurrency
+testing of applications which use the SDK.
+
+The server answers requests with the ``_testing`` response fixtures of the SDK, and
+with large paginated listings. It can add latency to responses, and inject errors,
+so that retries, rate limiting, and pagination can be exercised under real
+concurrency, over real connections, without touching production services.
+"""
+
+from __future__ import annotations
+
+import collections
+import gzip
+import http.server
+import importlib
+import json
+import logging
+import pkgutil
+import random
+import socket
+import ssl
+import struct
+import threading
+import time
+import typing as t
+import urllib.parse
+
+import requests
+
+from .models import RegisteredResponse, ResponseList, ResponseSet
+from .recording import _encode_body, _query_params, _request_params, _strip_query
+
+log = logging.getLogger(__name__)
+
+#: the injected fault which resets the connection instead of responding
+RESET = "reset"
+
+Fault = t.Union[int, t.Literal["reset"]]
+ListingStyle = t.Literal["limit_offset", "marker", "next_token", "last_key"]
+
+# the services whose fixtures are served, and the base URLs of those fixtures
+_SERVICE_URLS: dict[str, str] = dict(RegisteredResponse._url_map)
+
+
+def _origin(url: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _iter_fixture_sets() -> t.Iterator[ResponseSet]:
+    import globus_sdk._testing.data
+
+    for module_info in pkgutil.walk_packages(
+        globus_sdk._testing.data.__path__, prefix="globus_sdk._testing.data."
+    ):
+        module = importlib.import_module(module_info.name)
+        response_set = getattr(module, "RESPONSES", None)
+        if isinstance(response_set, ResponseSet):
+            yield response_set
+
+
+def _iter_responses(
+    item: RegisteredResponse | ResponseList,
+) -> t.Iterator[RegisteredResponse]:
+    if isinstance(item, ResponseList):
+        yield from item.responses
+    else:
+        yield item
+
+
+class _Listing:
+    """
+    A paginated listing of items, served one page at a time in the style expected by
+    one of the SDK's paginators.
+    """
+
+    def __init__(
+        self,
+        items: t.Sequence[t.Any],
+        *,
+        items_key: str,
+        style: ListingStyle,
+        page_size: int,
+        extra: dict[str, t.Any],
+    ) -> None:
+        self.items = items
+        self.items_key = items_key
+        self.style = style
+        self.page_size = page_size
+        self.extra = extra
+
+    def page(self, params: dict[str, t.Any]) -> dict[str, t.Any]:
+        def param(name: str, default: int) -> int:
+            value = params.get(name)
+            return int(value) if value not in (None, "") else default
+
+        total = len(self.items)
+        if self.style == "limit_offset":
+            start = param("offset", 0)
+            limit = param("limit", self.page_size)
+        else:
+            start = param(self.style, 0)
+            limit = param("limit", self.page_size)
+        end = min(start + limit, total)
+        has_next_page = end < total
+        next_key = str(end) if has_next_page else None
+
+        page: dict[str, t.Any] = {**self.extra, self.items_key: self.items[start:end]}
+        if self.style == "limit_offset":
+            page.update(
+                offset=start, limit=limit, total=total, has_next_page=has_next_page
+            )
+        elif self.style == "next_token":
+            page["next_token"] = next_key
+        else:
+            page.update({self.style: next_key, "has_next_page": has_next_page})
+        return page
+
+
+class _Routes:
+    """
+    A table of the responses served for each method and URL.
+
+    Unlike replay, serving is stateless: responses are never used up. A response whose
+    URL has a query string, or which has ``match`` functions, is preferred when it
+    matches, over a response which matches any request to its URL.
+    """
+
+    def __init__(self) -> None:
+        self._routes: dict[tuple[str, str], list[RegisteredResponse]] = (
+            collections.defaultdict(list)
+        )
+        self._listings: dict[tuple[str, str], _Listing] = {}
+
+    def add(self, response: RegisteredResponse, *, first: bool = False) -> None:
+        routes = self._routes[(response.method, _strip_query(response.full_url))]
+        if first:
+            routes.insert(0, response)
+        else:
+            routes.append(response)
+
+    def add_listing(self, method: str, url: str, listing: _Listing) -> None:
+        self._listings[(method, _strip_query(url))] = listing
+
+    def lookup(
+        self, request: requests.PreparedRequest
+    ) -> RegisteredResponse | _Listing | None:
+        url = str(request.url)
+        key = (str(request.method), _strip_query(url))
+        if key in self._listings:
+            return self._listings[key]
+
+        fallback = None
+        for response in self._routes.get(key, ()):
+            specific = bool(
+                urllib.parse.urlsplit(response.full_url).query or response.match
+            )
+            if not specific:
+                if fallback is None:
+                    fallback = response
+                continue
+            if urllib.parse.urlsplit(response.full_url).query and _query_params(
+                response.full_url
+            ) != _query_params(url):
+                continue
+            if all(matcher(request)[0] for matcher in response.match or ()):
+                return response
+        return fallback
+
+
+class StandInServer:
+    """
+    A local HTTP server which stands in for Globus services.
+
+    By default, it serves all of the ``_testing`` response fixtures of the SDK. Each
+    service is served under its own path prefix, e.g. ``/transfer/``. Point clients
+    at the server with ``base_url=server.url_for("transfer")``, or set the
+    environment variables from ``environ()`` before creating clients.
+
+    The server runs in a background thread, and handles each connection in a thread
+    of its own. Connections are kept alive, as they would be by a real service.
+
+    Unlike mocked responses, fixtures are never used up, so any number of clients can
+    send the same requests concurrently. When several fixtures match a request, the
+    more specific one is served, i.e. one which matches the query string or body of
+    the request.
+
+    Faults are injected at random, before a request is answered. Each fault is
+    either a status code, answered with an error document (and a ``Retry-After``
+    header, for 429 and 503), or ``"reset"``, which resets the connection.
+
+    :param host: The host on which to listen
+    :param port: The port on which to listen. By default, a free port is chosen
+    :param latency: The delay, in seconds, before each response is sent. Either a
+        fixed number, or a callable which draws delays from a distribution, using the
+        ``random.Random`` which it is passed
+    :param faults: A mapping of faults to the probability of injecting each into a
+        response, e.g. ``{429: 0.05, 503: 0.01, "reset": 0.01}``
+    :param retry_after: The value of the ``Retry-After`` header of injected 429 and
+        503 responses
+    :param seed: A seed for the random choice of faults and latencies, for
+        reproducible runs
+    :param load_fixtures: Whether to serve the ``_testing`` response fixtures
+    :param ssl_context: An ``ssl.SSLContext`` with which to serve HTTPS instead of
+        HTTP, e.g. for the ``GCSClient``, which requires an ``https://`` address
+
+    **Examples**
+
+    Serve fixtures slowly and unreliably, and page through a large listing:
+
+    >>> server = StandInServer(
+    ...     latency=lambda rng: rng.lognormvariate(-3, 0.5),
+    ...     faults={429: 0.05, "reset": 0.01},
+    ... )
+    >>> server.add_listing(
+    ...     "transfer",
+    ...     "/v0.10/task_list",
+    ...     items=[{"task_id": str(uuid.uuid4())} for _ in range(10_000)],
+    ...     items_key="DATA",
+    ...     style="limit_offset",
+    ...     page_size=1000,
+    ... )
+    >>> with server:
+    ...     tc = TransferClient(base_url=server.url_for("transfer"))
+    ...     tasks = list(tc.paginated.task_list().items())
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float | t.Callable[[random.Random], float] | None = None,
+        faults: t.Mapping[Fault, float] | None = None,
+        retry_after: int = 1,
+        seed: int | None = None,
+        load_fixtures: bool = True,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self.latency = latency
+        self.faults = dict(faults or {})
+        if sum(self.faults.values()) > 1:
+            raise ValueError("the probabilities of faults must not add up to over 1")
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._statuses: collections.Counter[int] = collections.Counter()
+        self._faults: collections.Counter[Fault] = collections.Counter()
+
+        self._routes = _Routes()
+        if load_fixtures:
+            for response_set in _iter_fixture_sets():
+                # the default case of a set is preferred over other cases
+                cases = sorted(response_set.cases(), key=lambda c: c != "default")
+                for case in cases:
+                    for response in _iter_responses(response_set.lookup(case)):
+                        self._routes.add(response)
+
+        self._httpd = http.server.ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        if ssl_context is not None:
+            self._httpd.socket = ssl_context.wrap_socket(
+                self._httpd.socket, server_side=True
+            )
+        self._scheme = "https" if ssl_context is not None else "http"
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        The root URL of the server.
+        """
+        host, port = self._httpd.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"{self._scheme}://{host}:{port}/"
+
+    def url_for(self, service: str) -> str:
+        """
+        Get the base URL of a service on the server, to use as the ``base_url`` of a
+        client. For services like Transfer, the client adds its own base path.
+
+        :param service: The name of the service, e.g. ``"transfer"``
+        """
+        if service not in _SERVICE_URLS:
+            raise LookupError(f"{service} is not served by the stand-in server")
+        return f"{self.url}{service}/"
+
+    def environ(self) -> dict[str, str]:
+        """
+        Get the ``GLOBUS_SDK_SERVICE_URL_*`` environment variables which point
+        clients at the server, for every service which it serves.
+        """
+        return {
+            f"GLOBUS_SDK_SERVICE_URL_{service.upper()}": self.url_for(service)
+            for service in _SERVICE_URLS
+        }
+
+    def add_response(self, response: RegisteredResponse) -> None:
+        """
+        Serve a response. It is preferred over fixtures with the same method and URL.
+        The response must be for a known service, given either as its ``service``,
+        or as the host of its URL.
+
+        :param response: The response to serve
+        """
+        self._routes.add(response, first=True)
+
+    def add_listing(
+        self,
+        service: str,
+        path: str,
+        *,
+        items: t.Sequence[t.Any],
+        items_key: str,
+        style: ListingStyle,
+        page_size: int = 100,
+        method: str = "GET",
+        extra: dict[str, t.Any] | None = None,
+    ) -> None:
+        """
+        Serve a listing of items, in as many pages as needed, in the style of one of
+        the SDK's paginators. Listings are preferred over fixtures.
+
+        In the ``limit_offset`` style, pages are requested with the ``limit`` and
+        ``offset`` query parameters, and have ``offset``, ``limit``, ``total`` and
+        ``has_next_page`` keys, for the ``LimitOffsetTotalPaginator`` and
+        ``HasNextPaginator``. In the ``marker``, ``next_token`` and ``last_key``
+        styles, the query parameter and the key of the page of the same name holds
+        the position of the next page, for the ``MarkerPaginator``,
+        ``NextTokenPaginator`` and ``LastKeyPaginator``.
+
+        :param service: The name of the service, e.g. ``"transfer"``
+        :param path: The path of the listing on the service, including any base path
+            of the service, e.g. ``"/v0.10/task_list"``
+        :param items: The items to list
+        :param items_key: The key of the items in each page
+        :param style: The style of pagination
+        :param page_size: The number of items in each page, unless the request has a
+            ``limit`` query parameter
+        :param method: The HTTP method of the listing
+        :param extra: Other keys to include in every page
+        """
+        if service not in _SERVICE_URLS:
+            raise LookupError(f"{service} is not served by the stand-in server")
+        url = _origin(_SERVICE_URLS[service]) + "/" + path.lstrip("/")
+        self._routes.add_listing(
+            method.upper(),
+            url,
+            _Listing(
+                items,
+                items_key=items_key,
+                style=style,
+                page_size=page_size,
+                extra=extra or {},
+            ),
+        )
+
+    def stats(self) -> dict[str, t.Any]:
+        """
+        Get the number of ``requests`` received, and counts of the ``status_codes``
+        of responses and of the ``faults`` injected.
+        """
+        with self._stats_lock:
+            return {
+                "requests": self._requests,
+                "status_codes": dict(self._statuses),
+                "faults": dict(self._faults),
+            }
+
+    def start(self) -> None:
+        """
+        Start serving, in a background thread.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            # poll often, so that the server stops promptly
+            kwargs={"poll_interval": 0.05},
+            name="globus-sdk-stand-in-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving, and close the server's socket.
+        """
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> StandInServer:
+        self.start()
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.stop()
+
+    # the following methods are used by the request handler
+
+    def _choose_fault(self) -> Fault | None:
+        if not self.faults:
+            return None
+        with self._random_lock:
+            roll = self._random.random()
+        for fault, probability in self.faults.items():
+            if roll < probability:
+                return fault
+            roll -= probability
+        return None
+
+    def _delay(self) -> None:
+        if self.latency is None:
+            return
+        if callable(self.latency):
+            with self._random_lock:
+                delay = self.latency(self._random)
+        else:
+            delay = self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _record(self, status: int | None, fault: Fault | None) -> None:
+        with self._stats_lock:
+            self._requests += 1
+            if status is not None:
+                self._statuses[status] += 1
+            if fault is not None:
+                self._faults[fault] += 1
+
+    def _respond(
+        self, method: str, path: str, headers: t.Mapping[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes] | None:
+        # answer a request, returning the status, headers and body of the response,
+        # or None if the connection should be reset
+        fault = self._choose_fault()
+        self._delay()
+        if fault == RESET:
+            self._record(None, fault)
+            return None
+        if fault is not None:
+            status = int(fault)
+            error_headers = {"Content-Type": "application/json"}
+            if status in (429, 503):
+                error_headers["Retry-After"] = str(self.retry_after)
+            error_body = json.dumps(
+                {"code": "InjectedFault", "message": f"injected {status} error"}
+            ).encode()
+            self._record(status, fault)
+            return status, error_headers, error_body
+
+        result = self._lookup(method, path, headers, body)
+        self._record(result[0] if result else None, None)
+        return result
+
+    def _lookup(
+        self, method: str, path: str, headers: t.Mapping[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes] | None:
+        not_found = (
+            404,
+            {"Content-Type": "application/json"},
+            json.dumps(
+                {"code": "NotFound", "message": f"no fixture for {method} {path}"}
+            ).encode(),
+        )
+        service, _, rest = path.lstrip("/").partition("/")
+        if service not in _SERVICE_URLS:
+            return not_found
+
+        url = _origin(_SERVICE_URLS[service]) + "/" + rest
+        request = requests.Request(
+            method, url, headers=dict(headers), data=body or None
+        ).prepare()
+        request.params = _request_params(url)  # type: ignore[attr-defined]
+        request.req_kwargs = {}  # type: ignore[attr-defined]
+
+        found = self._routes.lookup(request)
+        if found is None:
+            return not_found
+        if isinstance(found, _Listing):
+            page = json.dumps(found.page(_request_params(url)))
+            return 200, {"Content-Type": "application/json"}, page.encode()
+        # the body of a fixture may be an exception, for a network error
+        fixture_body: t.Any = found.body
+        if isinstance(fixture_body, Exception):
+            return None
+
+        response_body, default_content_type = _encode_body(found)
+        response_headers = dict(found.headers or {})
+        if not any(k.lower() == "content-type" for k in response_headers):
+            response_headers["Content-Type"] = (
+                found.content_type or default_content_type
+            )
+        return found.status, response_headers, response_body
+
+
+def _make_handler(
+    server: StandInServer,
+) -> type[http.server.BaseHTTPRequestHandler]:
+    class _Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        server_version = "GlobusStandIn"
+        # responses are written in two parts, headers and body, which must not be
+        # delayed waiting for acknowledgements
+        disable_nagle_algorithm = True
+
+        def _read_body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                chunks = []
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    if size == 0:
+                        # skip any trailers, up to the final blank line
+                        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                            pass
+                        break
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+                body = b"".join(chunks)
+            else:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return body
+
+        def _handle(self) -> None:
+            body = self._read_body()
+            headers = {
+                k: v
+                for k, v in self.headers.items()
+                if k.lower() not in ("content-encoding", "transfer-encoding")
+            }
+            result = server._respond(self.command, self.path, headers, body)
+            if result is None:
+                self._reset()
+                return
+            status, response_headers, response_body = result
+            self.send_response(status)
+            for name, value in response_headers.items():
+                if name.lower() not in ("content-length", "transfer-encoding"):
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(response_body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(response_body)
+
+        def _reset(self) -> None:
+            # close with a zero linger time, which sends a TCP reset
+            self.close_connection = True
+            try:
+                self.connection.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                )
+            except OSError:
+                pass
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+        def log_message(self, format: str, *args: t.Any) -> None:
+            log.debug("stand-in server: " + format, *args)
+
+    return _Handler
@@ -0,0 +1,235 @@
+"""
+Optional tracing of SDK activity with OpenTelemetry.
+
+When the ``opentelemetry-api`` package is installed, the SDK creates spans, with the
+tracer named ``globus_sdk``, for client requests, for each attempt to send a request,
+for pagination, and for token refreshes. Otherwise, tracing does nothing.
+
+The OpenTelemetry API records nothing on its own. Spans are only exported if the
+application configures a tracer provider, e.g. with the ``opentelemetry-sdk`` package.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import importlib
+import re
+import typing as t
+import urllib.parse
+
+from globus_sdk.version import __version__
+
+if t.TYPE_CHECKING:
+    from globus_sdk.transport import AttemptMetrics
+
+PageT = t.TypeVar("PageT")
+
+_TRACER_NAME = "globus_sdk"
+
+# path segments which identify a resource rather than a route, replaced in route
+# templates so that spans for the same route share a name
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+)$",
+    re.IGNORECASE,
+)
+
+# the opentelemetry.trace module, False if it is not installed, or None if it has not
+# been imported yet
+_TRACE_MODULE: t.Any = None
+_TRACER: t.Any = None
+
+
+class _RequestTrace:
+    # the state of a traced client request, which counts the attempts made by the
+    # transport on its behalf
+    def __init__(self, span: t.Any) -> None:
+        self.span = span
+        self.attempts = 0
+
+
+_ACTIVE_REQUEST: contextvars.ContextVar[_RequestTrace | None] = contextvars.ContextVar(
+    "globus_sdk_active_request", default=None
+)
+
+
+def _get_trace_module() -> t.Any:
+    global _TRACE_MODULE
+    if _TRACE_MODULE is None:
+        try:
+            _TRACE_MODULE = importlib.import_module("opentelemetry.trace")
+        except ImportError:
+            _TRACE_MODULE = False
+    return _TRACE_MODULE
+
+
+def get_tracer() -> t.Any:
+    """
+    Get the tracer used by the SDK, or ``None`` if OpenTelemetry is not installed.
+    """
+    global _TRACER
+    trace = _get_trace_module()
+    if not trace:
+        return None
+    if _TRACER is None:
+        _TRACER = trace.get_tracer(_TRACER_NAME, __version__)
+    return _TRACER
+
+
+def route_template(url: str) -> str:
+    """
+    Get the route of a URL, as a path in which the segments which are IDs (UUIDs and
+    integers) are replaced with ``{id}``.
+
+    :param url: The URL
+    """
+    path = urllib.parse.urlsplit(url).path
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+@contextlib.contextmanager
+def span(name: str, attributes: dict[str, t.Any] | None = None) -> t.Iterator[t.Any]:
+    """
+    Run a block of code in a span, which is made the current span. Yields the span,
+    or ``None`` if tracing is not available.
+
+    :param name: The name of the span
+    :param attributes: The attributes of the span
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+@contextlib.contextmanager
+def request_span(
+    method: str, url: str, resource_server: str | None
+) -> t.Iterator[_RequestTrace | None]:
+    """
+    Run a client request in a span. The spans of the attempts which the transport makes
+    to send the request are its children, and the number of retries is recorded on the
+    span when the request is done.
+
+    :param method: The HTTP method of the request
+    :param url: The URL of the request
+    :param resource_server: The resource server of the client sending the request
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+
+    route = route_template(url)
+    attributes = {
+        "http.request.method": method,
+        "url.template": route,
+        "server.address": urllib.parse.urlsplit(url).hostname or "",
+    }
+    if resource_server is not None:
+        attributes["globus.resource_server"] = resource_server
+    with tracer.start_as_current_span(f"{method} {route}", attributes=attributes) as s:
+        request = _RequestTrace(s)
+        token = _ACTIVE_REQUEST.set(request)
+        try:
+            yield request
+        finally:
+            _ACTIVE_REQUEST.reset(token)
+            s.set_attribute("globus.retry_count", max(request.attempts - 1, 0))
+
+
+def set_response_status(request: _RequestTrace | None, status: int) -> None:
+    """
+    Record the status of the final response to a traced request.
+
+    :param request: The traced request, from ``request_span``
+    :param status: The status code of the response
+    """
+    if request is not None:
+        request.span.set_attribute("http.response.status_code", status)
+
+
+def record_attempt(attempt: AttemptMetrics, start_time_ns: int) -> None:
+    """
+    Record a span for an attempt to send a request, which has already been made.
+
+    :param attempt: The measurements of the attempt
+    :param start_time_ns: The time at which the attempt started, in nanoseconds since
+        the epoch
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return
+    request = _ACTIVE_REQUEST.get()
+    if request is not None:
+        request.attempts += 1
+
+    attributes: dict[str, t.Any] = {
+        "http.request.method": attempt.method,
+        "url.full": attempt.url,
+        "server.address": attempt.host,
+    }
+    if attempt.attempt > 0:
+        attributes["http.request.resend_count"] = attempt.attempt
+    if attempt.status is not None:
+        attributes["http.response.status_code"] = attempt.status
+    if attempt.error is not None:
+        attributes["error.type"] = attempt.error
+    elif attempt.status is not None and attempt.status >= 400:
+        attributes["error.type"] = str(attempt.status)
+    if attempt.retry_reason is not None:
+        attributes["globus.retry_reason"] = attempt.retry_reason
+    if attempt.stop_reason is not None:
+        attributes["globus.retry_stop_reason"] = attempt.stop_reason
+
+    trace = _get_trace_module()
+    attempt_span = tracer.start_span(
+        attempt.method,
+        kind=trace.SpanKind.CLIENT,
+        attributes=attributes,
+        start_time=start_time_ns,
+    )
+    if "error.type" in attributes:
+        attempt_span.set_status(trace.Status(trace.StatusCode.ERROR))
+    attempt_span.end(end_time=start_time_ns + int(attempt.total_time * 1e9))
+
+
+def trace_pages(
+    name: str, pages: t.Iterator[PageT], attributes: dict[str, t.Any] | None = None
+) -> t.Iterator[PageT]:
+    """
+    Wrap the pages of a paginator in a span which lasts until the pages are exhausted
+    or closed. The span is only the current span while a page is being fetched, and not
+    while the caller is consuming one, so that the caller's spans are not made children
+    of it.
+
+    :param name: The name of the span
+    :param pages: The pages to wrap
+    :param attributes: The attributes of the span
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield from pages
+        return
+
+    trace = _get_trace_module()
+    pages_span = tracer.start_span(name, attributes=attributes)
+    count = 0
+    try:
+        while True:
+            with trace.use_span(pages_span, end_on_exit=False):
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    return
+            count += 1
+            yield page
+    finally:
+        if isinstance(pages, t.Generator):
+            pages.close()
+        pages_span.set_attribute("globus.page_count", count)
+        pages_span.end()
@@ -5,7 +5,7 @@ import logging
 import time
 import typing as t
 
-from globus_sdk import exc, utils
+from globus_sdk import _tracing, exc, utils
 
 from .base import GlobusAuthorizer
 
@@ -122,7 +122,8 @@ class RenewingAuthorizer(GlobusAuthorizer, t.Generic[ResponseT], metaclass=abc.A
         hash, and call on_refresh
         """
         # get the first (and only) token
-        res = self._get_token_response()
+        with _tracing.span(f"{type(self).__name__} refresh"):
+            res = self._get_token_response()
         token_data = self._extract_token_data(res)
 
         self.expires_at = token_data["expires_at_seconds"]
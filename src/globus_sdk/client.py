@@ -1,24 +1,30 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import logging
 import typing as t
 import urllib.parse
 
-from globus_sdk import GlobusSDKUsageError, config, exc, utils
+from globus_sdk import GlobusSDKUsageError, _tracing, config, exc, utils
 from globus_sdk._types import ScopeCollectionType
 from globus_sdk.authorizers import GlobusAuthorizer
 from globus_sdk.paging import PaginatorTable
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.scopes import Scope, ScopeBuilder
-from globus_sdk.transport import RequestsTransport
+from globus_sdk.transport import RequestsTransport, RequestTemplate
 
 if t.TYPE_CHECKING:
+    import requests
+
     from globus_sdk.globus_app import GlobusApp
 
 log = logging.getLogger(__name__)
 
 _DataParamType = t.Union[None, str, bytes, t.Dict[str, t.Any], utils.PayloadWrapper]
 
+T = t.TypeVar("T")
+
 
 class BaseClient:
     r"""
@@ -478,40 +484,378 @@ class BaseClient:
         # prepare data...
         # copy headers if present
         rheaders = {**headers} if headers else {}
-
-        # if a client is asked to make a request against a full URL, not just the path
-        # component, then do not resolve the path, simply pass it through as the URL
-        if path.startswith("https://") or path.startswith("http://"):
-            url = path
-        else:
-            # if passed a path which has a prefix matching the base_path, strip it
-            # this means that if a client has a base path of `/v1/`, a request for
-            # `/v1/foo` will hit `/v1/foo` rather than `/v1/v1/foo`
-            if path.startswith(self.base_path):
-                path = path[len(self.base_path) :]
-            url = utils.slash_join(self.base_url, urllib.parse.quote(path))
-
-        # either use given authorizer or get one from app
-        if automatic_authorization:
-            authorizer = self.authorizer
-            if self._app and self.resource_server:
-                authorizer = self._app.get_authorizer(self.resource_server)
-        else:
-            authorizer = None
+        url = self._resolve_url(path)
+        authorizer = self._resolve_authorizer(automatic_authorization)
 
         # make the request
         log.debug("request will hit URL: %s", url)
-        r = self.transport.request(
-            method=method,
-            url=url,
+        with _tracing.request_span(method, url, self._trace_resource_server) as trace:
+            r = self.transport.request(
+                method=method,
+                url=url,
+                data=data,
+                query_params=query_params,
+                headers=rheaders,
+                encoding=encoding,
+                authorizer=authorizer,
+                allow_redirects=allow_redirects,
+                stream=stream,
+            )
+            _tracing.set_response_status(trace, r.status_code)
+            return self._handle_response(r)
+
+    async def get_async(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+        automatic_authorization: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a GET request to the specified path, from within an ``asyncio`` event
+        loop.
+
+        See :py:meth:`~.BaseClient.request_async` for details on the various parameters.
+        """
+        log.debug(f"async GET to {path} with query_params {query_params}")
+        return await self.request_async(
+            "GET",
+            path,
+            query_params=query_params,
+            headers=headers,
+            automatic_authorization=automatic_authorization,
+        )
+
+    async def post_async(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: _DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        automatic_authorization: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a POST request to the specified path, from within an ``asyncio`` event
+        loop.
+
+        See :py:meth:`~.BaseClient.request_async` for details on the various parameters.
+        """
+        log.debug(f"async POST to {path} with query_params {query_params}")
+        return await self.request_async(
+            "POST",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+            automatic_authorization=automatic_authorization,
+        )
+
+    async def delete_async(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+        automatic_authorization: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a DELETE request to the specified path, from within an ``asyncio`` event
+        loop.
+
+        See :py:meth:`~.BaseClient.request_async` for details on the various parameters.
+        """
+        log.debug(f"async DELETE to {path} with query_params {query_params}")
+        return await self.request_async(
+            "DELETE",
+            path,
+            query_params=query_params,
+            headers=headers,
+            automatic_authorization=automatic_authorization,
+        )
+
+    async def put_async(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: _DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        automatic_authorization: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a PUT request to the specified path, from within an ``asyncio`` event
+        loop.
+
+        See :py:meth:`~.BaseClient.request_async` for details on the various parameters.
+        """
+        log.debug(f"async PUT to {path} with query_params {query_params}")
+        return await self.request_async(
+            "PUT",
+            path,
+            query_params=query_params,
             data=data,
+            headers=headers,
+            encoding=encoding,
+            automatic_authorization=automatic_authorization,
+        )
+
+    async def patch_async(  # pylint: disable=missing-param-doc
+        self,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: _DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        automatic_authorization: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a PATCH request to the specified path, from within an ``asyncio`` event
+        loop.
+
+        See :py:meth:`~.BaseClient.request_async` for details on the various parameters.
+        """
+        log.debug(f"async PATCH to {path} with query_params {query_params}")
+        return await self.request_async(
+            "PATCH",
+            path,
             query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+            automatic_authorization=automatic_authorization,
+        )
+
+    async def request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: _DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        automatic_authorization: bool = True,
+    ) -> GlobusHTTPResponse:
+        """
+        Send an HTTP request from within an ``asyncio`` event loop.
+
+        This is the asynchronous counterpart to :py:meth:`~.BaseClient.request`, and
+        takes the same parameters. The request is sent via the transport's
+        ``request_async()`` method, so that retries and the sleeps between them do not
+        block the event loop. Only the low level request methods have asynchronous
+        counterparts: the methods of service clients are synchronous.
+
+        :param method: HTTP request method, as an all caps string
+        :param path: Path for the request, with or without leading slash
+        :param query_params: Parameters to be encoded as a query string
+        :param headers: HTTP headers to add to the request. Authorization headers may
+            be overwritten unless ``automatic_authorization`` is False.
+        :param data: Data to send as the request body. May pass through encoding.
+        :param encoding: A way to encode request data. "json", "form", and "text"
+            are all valid values. Custom encodings can be used only if they are
+            registered with the transport. By default, strings get "text" behavior and
+            all other objects get "json".
+        :param allow_redirects: Follow Location headers on redirect response
+            automatically. Defaults to ``True``
+        :param stream: Do not immediately download the response content. Defaults to
+            ``False``
+        :param automatic_authorization: Use this client's ``app`` or ``authorizer``
+            to automatically generate an Authorization header.
+
+        :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
+            request is received and has a status code in the 4xx or 5xx categories
+        """
+        rheaders = {**headers} if headers else {}
+        url = self._resolve_url(path)
+        authorizer = self._resolve_authorizer(automatic_authorization)
+
+        log.debug("async request will hit URL: %s", url)
+        with _tracing.request_span(method, url, self._trace_resource_server) as trace:
+            r = await self.transport.request_async(
+                method=method,
+                url=url,
+                data=data,
+                query_params=query_params,
+                headers=rheaders,
+                encoding=encoding,
+                authorizer=authorizer,
+                allow_redirects=allow_redirects,
+                stream=stream,
+            )
+            _tracing.set_response_status(trace, r.status_code)
+            return self._handle_response(r)
+
+    def compile_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query_params: dict[str, t.Any] | None = None,
+        data: _DataParamType = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        automatic_authorization: bool = True,
+    ) -> CompiledRequest:
+        """
+        Compile a request which will be sent many times, like the request of a
+        polling loop, so that it is encoded only once.
+
+        The path may contain path parameters in ``str.format`` style, like
+        ``{task_id}``, whose values are given each time the request is sent. Only the
+        path parameters and the ``Authorization`` header, which is computed for each
+        send, vary between sends of the request. The other parameters are the same as
+        those of :py:meth:`~.BaseClient.request`.
+
+        See :py:meth:`RequestsTransport.compile_request
+        <globus_sdk.transport.RequestsTransport.compile_request>` for details.
+
+        **Examples**
+
+        >>> tc = TransferClient(...)
+        >>> get_task = tc.compile_request("GET", "/task/{task_id}")
+        >>> while get_task.send(task_id=task_id)["status"] == "ACTIVE":
+        ...     time.sleep(10)
+        """
+        rheaders = {**headers} if headers else {}
+        url = self._resolve_url(path, template=True)
+        template = self.transport.compile_request(
+            method,
+            url,
+            query_params=query_params,
+            data=data,
             headers=rheaders,
             encoding=encoding,
-            authorizer=authorizer,
+        )
+        return CompiledRequest(
+            self,
+            template,
             allow_redirects=allow_redirects,
             stream=stream,
+            automatic_authorization=automatic_authorization,
         )
+
+    def run_many(
+        self,
+        calls: t.Iterable[t.Callable[[], T]],
+        *,
+        max_workers: int = 10,
+    ) -> list[T | Exception]:
+        """
+        Run many calls concurrently, on a pool of threads, and collect their results.
+
+        Each call is a callable which takes no arguments, typically a bound client
+        method wrapped with ``functools.partial`` or a ``lambda``. Calls send their
+        requests via their clients' transports as usual, so retries, rate limiting,
+        and other transport settings apply to each request.
+
+        The results are returned in the same order as ``calls``. If a call raises an
+        error, the error takes the place of its result and the other calls continue.
+
+        :param calls: The calls to run
+        :param max_workers: The maximum number of calls to run at once. The default
+            of 10 matches the number of connections which a transport keeps open to
+            each host.
+
+        **Examples**
+
+        >>> import functools
+        >>> tc = TransferClient(...)
+        >>> results = tc.run_many(
+        ...     functools.partial(tc.get_task, task_id) for task_id in task_ids
+        ... )
+        >>> for task_id, result in zip(task_ids, results):
+        ...     if isinstance(result, Exception):
+        ...         print(f"{task_id}: failed ({result})")
+        ...     else:
+        ...         print(f"{task_id}: {result['status']}")
+        """
+        if max_workers < 1:
+            raise exc.GlobusSDKUsageError("run_many() requires max_workers >= 1")
+
+        calls = list(calls)
+        if not calls:
+            return []
+
+        results: list[T | Exception] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(calls))
+        ) as executor:
+            # each call runs in a copy of the caller's context, so that tracing spans
+            # of the calls are children of the caller's span
+            futures = [
+                executor.submit(contextvars.copy_context().run, call) for call in calls
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as err:
+                    log.debug(f"call in run_many() failed: {err!r}")
+                    results.append(err)
+        return results
+
+    @property
+    def _trace_resource_server(self) -> str | None:
+        # the resource server of some clients (e.g. GCSClient) is looked up with a
+        # request, so tracing only uses the resource server of the client's scopes
+        if self.scopes is None:
+            return None
+        return self.scopes.resource_server
+
+    def warm_up(self, *, connections: int = 1) -> None:
+        """
+        Open connections to this client's service ahead of time, so that the first
+        requests made with the client do not wait for connection setup.
+
+        See :py:meth:`RequestsTransport.warm_up
+        <globus_sdk.transport.RequestsTransport.warm_up>` for details.
+
+        :param connections: The number of connections to open
+
+        **Examples**
+
+        Warm up several clients at once, at the start of a job:
+
+        >>> clients = [auth_client, transfer_client, groups_client]
+        >>> transfer_client.run_many(client.warm_up for client in clients)
+        """
+        self.transport.warm_up([self.base_url], connections=connections)
+
+    def _resolve_url(self, path: str, *, template: bool = False) -> str:
+        # if a client is asked to make a request against a full URL, not just the path
+        # component, then do not resolve the path, simply pass it through as the URL
+        if path.startswith("https://") or path.startswith("http://"):
+            return path
+        # if passed a path which has a prefix matching the base_path, strip it
+        # this means that if a client has a base path of `/v1/`, a request for
+        # `/v1/foo` will hit `/v1/foo` rather than `/v1/v1/foo`
+        if path.startswith(self.base_path):
+            path = path[len(self.base_path) :]
+        # the path parameters of a request template are left unquoted, for the
+        # transport to fill in
+        safe = "/{}" if template else "/"
+        return utils.slash_join(self.base_url, urllib.parse.quote(path, safe=safe))
+
+    def _resolve_authorizer(
+        self, automatic_authorization: bool
+    ) -> GlobusAuthorizer | None:
+        # either use given authorizer or get one from app
+        if not automatic_authorization:
+            return None
+        if self._app and self.resource_server:
+            return self._app.get_authorizer(self.resource_server)
+        return self.authorizer
+
+    def _handle_response(self, r: requests.Response) -> GlobusHTTPResponse:
         log.debug("request made to URL: %s", r.url)
 
         if 200 <= r.status_code < 400:
@@ -520,3 +864,87 @@ class BaseClient:
 
         log.debug(f"request completed with (error) response code: {r.status_code}")
         raise self.error_class(r)
+
+
+class CompiledRequest:
+    """
+    A request compiled by :py:meth:`BaseClient.compile_request
+    <globus_sdk.BaseClient.compile_request>`, which may be sent many times.
+
+    Each send resolves the client's authorizer, and handles the response like any
+    other client request, raising a ``GlobusAPIError`` for an error response.
+
+    :param client: The client which compiled the request
+    :param template: The transport's template of the request
+    :param allow_redirects: Follow Location headers on redirect response
+        automatically
+    :param stream: Do not immediately download the response content
+    :param automatic_authorization: Use the client's ``app`` or ``authorizer`` to
+        generate an Authorization header for each send
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        template: RequestTemplate,
+        *,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        automatic_authorization: bool = True,
+    ) -> None:
+        self.client = client
+        self.template = template
+        self.allow_redirects = allow_redirects
+        self.stream = stream
+        self.automatic_authorization = automatic_authorization
+
+    def send(self, **path_params: t.Any) -> GlobusHTTPResponse:
+        """
+        Send the request.
+
+        :param path_params: The values of the path parameters of the request
+
+        :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
+            request is received and has a status code in the 4xx or 5xx categories
+        """
+        client = self.client
+        authorizer = client._resolve_authorizer(self.automatic_authorization)
+        with self._span() as trace:
+            r = client.transport.send_template(
+                self.template,
+                path_params,
+                authorizer=authorizer,
+                allow_redirects=self.allow_redirects,
+                stream=self.stream,
+            )
+            _tracing.set_response_status(trace, r.status_code)
+            return client._handle_response(r)
+
+    async def send_async(self, **path_params: t.Any) -> GlobusHTTPResponse:
+        """
+        Send the request from within an ``asyncio`` event loop.
+
+        :param path_params: The values of the path parameters of the request
+
+        :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
+            request is received and has a status code in the 4xx or 5xx categories
+        """
+        client = self.client
+        authorizer = client._resolve_authorizer(self.automatic_authorization)
+        with self._span() as trace:
+            r = await client.transport.send_template_async(
+                self.template,
+                path_params,
+                authorizer=authorizer,
+                allow_redirects=self.allow_redirects,
+                stream=self.stream,
+            )
+            _tracing.set_response_status(trace, r.status_code)
+            return client._handle_response(r)
+
+    def _span(self) -> t.ContextManager[_tracing._RequestTrace | None]:
+        # requests sent from a template are traced under the template's URL, in which
+        # path parameters are not filled in
+        return _tracing.request_span(
+            self.template.method, self.template.url, self.client._trace_resource_server
+        )
@@ -1,4 +1,9 @@
-from .env_vars import get_environment_name, get_http_timeout, get_ssl_verify
+from .env_vars import (
+    get_environment_name,
+    get_http_timeout,
+    get_json_backend,
+    get_ssl_verify,
+)
 from .environments import EnvConfig, get_service_url, get_webapp_url
 
 __all__ = (
@@ -6,6 +11,7 @@ __all__ = (
     "get_environment_name",
     "get_ssl_verify",
     "get_http_timeout",
+    "get_json_backend",
     "get_service_url",
     "get_webapp_url",
 )
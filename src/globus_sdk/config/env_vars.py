@@ -19,6 +19,7 @@ T = t.TypeVar("T")
 ENVNAME_VAR = "GLOBUS_SDK_ENVIRONMENT"
 HTTP_TIMEOUT_VAR = "GLOBUS_SDK_HTTP_TIMEOUT"
 SSL_VERIFY_VAR = "GLOBUS_SDK_VERIFY_SSL"
+JSON_BACKEND_VAR = "GLOBUS_SDK_JSON_BACKEND"
 
 
 @t.overload
@@ -111,3 +112,7 @@ def get_http_timeout(value: float | None = None) -> float | None:
     if ret == -1.0:
         return None
     return ret
+
+
+def get_json_backend(value: str | None = None) -> str:
+    return _load_var(JSON_BACKEND_VAR, "stdlib", explicit_value=value).lower()
@@ -4,7 +4,7 @@ import enum
 import logging
 import typing as t
 
-from globus_sdk import _guards
+from globus_sdk import _guards, _json
 
 from .base import GlobusError
 from .err_info import ErrorInfoContainer
@@ -134,7 +134,9 @@ class GlobusAPIError(GlobusError):
                     # technically, this could be a non-dict JSON type, like a list or
                     # string but in those cases the user can just cast -- the "normal"
                     # case is a dict
-                    self._cached_raw_json = self._underlying_response.json()
+                    self._cached_raw_json = _json.loads_response(
+                        self._underlying_response
+                    )
                 except ValueError:
                     log.error(
                         "Error body could not be JSON decoded! "
@@ -0,0 +1,263 @@
+"""
+Writers which stream the items of paginated results to files, one page at a time.
+"""
+
+from __future__ import annotations
+
+import abc
+import csv
+import importlib
+import os
+import typing as t
+
+from globus_sdk import _json, exc
+
+ExportFormat = t.Literal["ndjson", "csv", "parquet"]
+
+_SUFFIX_FORMATS: dict[str, ExportFormat] = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+
+def flatten_item(item: t.Mapping[str, t.Any], separator: str = ".") -> dict[str, t.Any]:
+    """
+    Flatten the nested objects of an item into a single level, joining keys with
+    ``separator``. Arrays are not flattened.
+
+    >>> flatten_item({"id": 1, "owner": {"id": 2, "name": "x"}})
+    {'id': 1, 'owner.id': 2, 'owner.name': 'x'}
+
+    :param item: The item to flatten
+    :param separator: The string which joins the keys of nested objects
+    """
+    flat: dict[str, t.Any] = {}
+    for key, value in item.items():
+        if isinstance(value, t.Mapping) and value:
+            for subkey, subvalue in flatten_item(value, separator).items():
+                flat[f"{key}{separator}{subkey}"] = subvalue
+        else:
+            flat[key] = value
+    return flat
+
+
+def _lookup(item: t.Mapping[str, t.Any], field: str, separator: str) -> t.Any:
+    # a field may be a key of the item, or a path through its nested objects
+    if field in item:
+        return item[field]
+    value: t.Any = item
+    for part in field.split(separator):
+        if not isinstance(value, t.Mapping) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+class _Rows:
+    """
+    Converts the items of a page to rows, by projecting and flattening them.
+    """
+
+    def __init__(
+        self, fields: t.Sequence[str] | None, flatten: bool, separator: str
+    ) -> None:
+        self.fields = fields
+        self.flatten = flatten
+        self.separator = separator
+
+    def __call__(self, items: t.Iterable[t.Any]) -> list[dict[str, t.Any]]:
+        rows = []
+        for item in items:
+            if self.flatten:
+                item = flatten_item(item, self.separator)
+            if self.fields is not None:
+                item = {
+                    field: _lookup(item, field, self.separator) for field in self.fields
+                }
+            rows.append(item)
+        return rows
+
+
+class _Writer(abc.ABC):
+    def __init__(self, destination: str | os.PathLike[str] | t.IO[t.Any]) -> None:
+        self.destination = destination
+
+    @abc.abstractmethod
+    def write(self, rows: list[dict[str, t.Any]]) -> None:
+        """Write the rows of a page."""
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class _TextWriter(_Writer):
+    def __init__(self, destination: str | os.PathLike[str] | t.IO[t.Any]) -> None:
+        super().__init__(destination)
+        if isinstance(destination, (str, os.PathLike)):
+            self.file: t.IO[str] = open(destination, "w", encoding="utf-8", newline="")
+            self._owns_file = True
+        else:
+            self.file = destination
+            self._owns_file = False
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        if self._owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+class _NDJSONWriter(_TextWriter):
+    def write(self, rows: list[dict[str, t.Any]]) -> None:
+        self.file.write(
+            "".join(_json.dumps(row).decode("utf-8") + "\n" for row in rows)
+        )
+
+
+def _check_columns(columns: t.Collection[str], rows: list[dict[str, t.Any]]) -> None:
+    # without explicit fields, the columns are the fields of the first page with
+    # items, and a field which first appears on a later page cannot be written
+    for row in rows:
+        unexpected = [key for key in row if key not in columns]
+        if unexpected:
+            raise exc.GlobusSDKUsageError(
+                f"Cannot export fields {unexpected!r}, which are not fields of the "
+                "items of the first page. Pass 'fields' to choose the columns."
+            )
+
+
+def _csv_value(value: t.Any) -> t.Any:
+    # nested values are written as JSON
+    if isinstance(value, (dict, list)):
+        return _json.dumps(value).decode("utf-8")
+    return value
+
+
+class _CSVWriter(_TextWriter):
+    def __init__(
+        self,
+        destination: str | os.PathLike[str] | t.IO[t.Any],
+        fields: t.Sequence[str] | None,
+    ) -> None:
+        super().__init__(destination)
+        self.fields = fields
+        self._writer: csv.DictWriter[str] | None = None
+        self._columns: frozenset[str] = frozenset()
+
+    def write(self, rows: list[dict[str, t.Any]]) -> None:
+        # without explicit fields, an empty page has no columns to take, so the
+        # header waits for a page with items
+        if not rows and self.fields is None:
+            return
+        if self._writer is None:
+            # without explicit fields, the columns are the keys of the first page
+            # with items
+            fields = self.fields
+            if fields is None:
+                fields = list(dict.fromkeys(key for row in rows for key in row))
+            self._writer = csv.DictWriter(self.file, fieldnames=fields)
+            self._columns = frozenset(fields)
+            self._writer.writeheader()
+        if self.fields is None:
+            _check_columns(self._columns, rows)
+        self._writer.writerows(
+            {key: _csv_value(value) for key, value in row.items()} for row in rows
+        )
+
+
+class _ParquetWriter(_Writer):
+    def __init__(self, destination: str | os.PathLike[str] | t.IO[t.Any]) -> None:
+        super().__init__(destination)
+        try:
+            self._pa = importlib.import_module("pyarrow")
+            self._pq = importlib.import_module("pyarrow.parquet")
+        except ImportError as e:
+            raise ImportError(
+                "Exporting items as Parquet requires the 'pyarrow' library"
+            ) from e
+        self._writer: t.Any = None
+        self._schema: t.Any = None
+        self._columns: frozenset[str] = frozenset()
+
+    def write(self, rows: list[dict[str, t.Any]]) -> None:
+        if not rows:
+            return
+        if self._writer is None:
+            # the schema is inferred from the first page, with columns which are
+            # always null in it taken to be strings
+            schema = self._pa.Table.from_pylist(rows).schema
+            for index, field in enumerate(schema):
+                if self._pa.types.is_null(field.type):
+                    schema = schema.set(index, field.with_type(self._pa.string()))
+            self._schema = schema
+            self._columns = frozenset(schema.names)
+            self._writer = self._pq.ParquetWriter(self.destination, schema)
+        _check_columns(self._columns, rows)
+        # each page is written as a row group
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _resolve_format(
+    destination: str | os.PathLike[str] | t.IO[t.Any], format: ExportFormat | None
+) -> ExportFormat:
+    if format is not None:
+        if format not in ("ndjson", "csv", "parquet"):
+            raise ValueError(f"Unknown export format '{format}'")
+        return format
+    if isinstance(destination, (str, os.PathLike)):
+        suffix = os.path.splitext(os.fspath(destination))[1].lower()
+        if suffix in _SUFFIX_FORMATS:
+            return _SUFFIX_FORMATS[suffix]
+    raise ValueError(
+        f"Cannot determine the export format of {destination!r}, pass 'format'"
+    )
+
+
+def export_items(
+    pages: t.Iterable[t.Any],
+    items_key: str,
+    destination: str | os.PathLike[str] | t.IO[t.Any],
+    *,
+    format: ExportFormat | None = None,
+    fields: t.Sequence[str] | None = None,
+    flatten: bool = False,
+    separator: str = ".",
+) -> int:
+    """
+    Write the items of pages to a file, one page at a time, and return the number of
+    items which were written. See ``Paginator.export_items()``.
+    """
+    resolved_format = _resolve_format(destination, format)
+    writer: _Writer
+    if resolved_format == "ndjson":
+        writer = _NDJSONWriter(destination)
+    elif resolved_format == "csv":
+        writer = _CSVWriter(destination, fields)
+    else:
+        writer = _ParquetWriter(destination)
+
+    to_rows = _Rows(fields, flatten, separator)
+    count = 0
+    try:
+        for page in pages:
+            rows = to_rows(page[items_key])
+            writer.write(rows)
+            # each page is flushed once it is written, so that a checkpoint reported
+            # after it has been processed does not get ahead of the file
+            writer.flush()
+            count += len(rows)
+    finally:
+        writer.close()
+    return count
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+import typing as t
+
+T = t.TypeVar("T")
+
+# set while pages are being fetched by a prefetching thread, so that a paginator whose
+# `pages()` calls another `pages()` (e.g. via `super()`) does not prefetch twice
+_PREFETCHING: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_PREFETCHING", default=False
+)
+
+
+class _Done:
+    pass
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def is_prefetching() -> bool:
+    return _PREFETCHING.get()
+
+
+def prefetch(pages: t.Iterator[T], depth: int) -> t.Iterator[T]:
+    """
+    Iterate over pages which are fetched ahead of time on a background thread.
+
+    Up to ``depth`` pages are fetched ahead of the page which the consumer is
+    processing, and are held in a queue until they are consumed. An error raised while
+    fetching is raised to the consumer once the pages before it have been consumed.
+    When the consumer stops early, the thread stops once any request which it is
+    sending is done, and the remaining pages are discarded.
+
+    :param pages: The pages to fetch
+    :param depth: The maximum number of pages to fetch ahead
+    """
+    buffer: queue.Queue[T | _Done | _Failure] = queue.Queue()
+    # the pages which may be fetched ahead are bounded by slots, each of which is
+    # taken before a page is fetched, and given back when the page is consumed
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        _PREFETCHING.set(True)
+        try:
+            while True:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    buffer.put(_Done())
+                    return
+                buffer.put(page)
+        # any error, including one which is not an Exception, ends the pages, so that
+        # the consumer does not wait forever for a page which will never come
+        except BaseException as err:
+            buffer.put(_Failure(err))
+        finally:
+            close = getattr(pages, "close", None)
+            if close is not None:
+                close()
+
+    # the thread runs in a copy of the consumer's context, so that tracing spans of the
+    # requests it sends are children of the consumer's span
+    thread = threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(produce,),
+        name="globus-sdk-prefetch",
+        daemon=True,
+    )
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            slots.release()
+            if isinstance(item, _Done):
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        # wake the thread, if it is waiting to fetch a page, so that it sees that it
+        # has been stopped
+        stopped.set()
+        slots.release()
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import concurrent.futures
+import contextvars
 import functools
 import inspect
+import os
 import sys
 import typing as t
 
+from globus_sdk import _tracing
 from globus_sdk.response import GlobusHTTPResponse
 
+from . import _export, _prefetch
+
 if sys.version_info >= (3, 10):
     from typing import ParamSpec
 else:
@@ -17,6 +24,10 @@ PageT = t.TypeVar("PageT", bound=GlobusHTTPResponse)
 P = ParamSpec("P")
 R = t.TypeVar("R", bound=GlobusHTTPResponse)
 C = t.TypeVar("C", bound=t.Callable[..., GlobusHTTPResponse])
+PaginatorT = t.TypeVar("PaginatorT", bound="Paginator[t.Any]")
+
+# returned by `next()` when the pages of an asynchronous iteration are exhausted
+_NO_MORE_PAGES = object()
 
 
 # stub for mypy
@@ -27,6 +38,64 @@ class _PaginatedFunc(t.Generic[PageT]):
     _paginator_params: dict[str, t.Any]
 
 
+def _wrapped_pages(
+    pages: t.Callable[[Paginator[PageT]], t.Iterator[PageT]],
+) -> t.Callable[[Paginator[PageT]], t.Iterator[PageT]]:
+    if getattr(pages, "_is_wrapped", False):
+        return pages
+
+    @functools.wraps(pages)
+    def wrapped_pages(self: Paginator[PageT]) -> t.Iterator[PageT]:
+        name = getattr(self.method, "__qualname__", type(self).__name__)
+        traced = _tracing.trace_pages(
+            f"{name} pages", pages(self), {"globus.paginator": type(self).__name__}
+        )
+        prefetch = self.prefetch_pages and not _prefetch.is_prefetching()
+        if self.on_checkpoint is None:
+            if prefetch:
+                return _prefetch.prefetch(traced, self.prefetch_pages)
+            return traced
+
+        # the checkpoint after each page is taken as soon as the page is fetched,
+        # which may be ahead of the consumer if pages are prefetched, and reported
+        # once the consumer is done with the page
+        positioned = _with_checkpoints(self, traced)
+        if prefetch:
+            positioned = _prefetch.prefetch(positioned, self.prefetch_pages)
+        return _report_checkpoints(positioned, self.on_checkpoint)
+
+    wrapped_pages._is_wrapped = True  # type: ignore[attr-defined]
+    return wrapped_pages
+
+
+def _close(iterator: t.Iterator[t.Any]) -> None:
+    close = getattr(iterator, "close", None)
+    if close is not None:
+        close()
+
+
+def _with_checkpoints(
+    paginator: Paginator[PageT], pages: t.Iterator[PageT]
+) -> t.Iterator[tuple[PageT, dict[str, t.Any]]]:
+    try:
+        for page in pages:
+            yield page, paginator.checkpoint()
+    finally:
+        _close(pages)
+
+
+def _report_checkpoints(
+    positioned: t.Iterator[tuple[PageT, dict[str, t.Any]]],
+    on_checkpoint: t.Callable[[dict[str, t.Any]], t.Any],
+) -> t.Iterator[PageT]:
+    try:
+        for page, checkpoint in positioned:
+            yield page
+            on_checkpoint(checkpoint)
+    finally:
+        _close(positioned)
+
+
 class Paginator(t.Iterable[PageT], metaclass=abc.ABCMeta):
     """
     Base class for all paginators.
@@ -64,10 +133,120 @@ class Paginator(t.Iterable[PageT], metaclass=abc.ABCMeta):
         self.items_key = items_key
         self.client_args = client_args
         self.client_kwargs = client_kwargs
+        self.prefetch_pages = 0
+        # whether the last page has been fetched
+        self.exhausted = False
+        self.on_checkpoint: t.Callable[[dict[str, t.Any]], t.Any] | None = None
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # trace the pages of every concrete paginator as a single span, and prefetch
+        # them if the paginator is set to do so
+        pages = cls.__dict__.get("pages")
+        if pages is not None and not getattr(pages, "__isabstractmethod__", False):
+            cls.pages = _wrapped_pages(pages)  # type: ignore[method-assign,assignment]
 
     def __iter__(self) -> t.Iterator[PageT]:
         yield from self.pages()
 
+    def __aiter__(self) -> t.AsyncIterator[PageT]:
+        return self.pages_async()
+
+    def prefetch(self: PaginatorT, pages: int = 1) -> PaginatorT:
+        """
+        Fetch pages ahead of time on a background thread, so that the next pages are
+        being fetched while the current page is being processed. Returns the paginator,
+        so that it can be chained with a paginated call:
+
+        >>> for task in tc.paginated.task_list().prefetch(2).items():
+        ...     process(task)
+
+        At most ``pages`` pages are fetched ahead of the page being processed. An error
+        raised while fetching a page is raised when that page would have been yielded.
+        If iteration stops early, no more pages are fetched once the request in flight,
+        if any, is done.
+
+        :param pages: The maximum number of pages to fetch ahead. ``0`` turns
+            prefetching off.
+        """
+        if pages < 0:
+            raise ValueError("prefetch() requires pages >= 0")
+        self.prefetch_pages = pages
+        return self
+
+    def checkpoint(self) -> dict[str, t.Any]:
+        """
+        Get the position of the paginator, as a small dict of strings, numbers, and
+        booleans, which may be serialized (e.g. as JSON) and passed to ``resume()`` to
+        continue paging from the same position, in a different process.
+
+        The position is that of the page after the last page which was yielded, or
+        ``"exhausted"`` if there are no more pages. Note that, if pages are being
+        prefetched, pages after the one being processed may already have been fetched.
+        Use ``on_checkpoint`` with ``resume()`` to get the checkpoint after each page
+        which has been processed.
+        """
+        return {**self._get_position(), "exhausted": self.exhausted}
+
+    def resume(
+        self: PaginatorT,
+        checkpoint: dict[str, t.Any] | None = None,
+        *,
+        on_checkpoint: t.Callable[[dict[str, t.Any]], t.Any] | None = None,
+    ) -> PaginatorT:
+        """
+        Continue paging from a ``checkpoint()`` of a paginator for the same call, and
+        optionally, report a new checkpoint after each page. Returns the paginator, so
+        that it can be chained with a paginated call. For example, a long export may be
+        restarted where it stopped with
+
+        >>> def save(checkpoint):
+        ...     pathlib.Path("checkpoint.json").write_text(json.dumps(checkpoint))
+        ...
+        >>> checkpoint = None
+        >>> if os.path.exists("checkpoint.json"):
+        ...     checkpoint = json.loads(pathlib.Path("checkpoint.json").read_text())
+        >>> paginator = tc.paginated.task_successful_transfers(task_id).resume(
+        ...     checkpoint, on_checkpoint=save
+        ... )
+        >>> for item in paginator.items():
+        ...     process(item)
+
+        :param checkpoint: A checkpoint to resume from. If ``None``, paging starts from
+            the current position of the paginator.
+        :param on_checkpoint: A callback which is passed the checkpoint after each
+            page, once that page has been processed, i.e. when the next page (or the
+            end of the pages) is requested
+
+        :raises ValueError: if the checkpoint is not a checkpoint of this type of
+            paginator
+        """
+        if checkpoint is not None:
+            try:
+                self._set_position(checkpoint)
+                self.exhausted = bool(checkpoint["exhausted"])
+            except (KeyError, TypeError) as e:
+                raise ValueError(
+                    f"Invalid checkpoint for {type(self).__name__}: {checkpoint!r}"
+                ) from e
+        self.on_checkpoint = on_checkpoint
+        return self
+
+    @abc.abstractmethod
+    def _get_position(self) -> dict[str, t.Any]:
+        """
+        Get the position of the paginator, for ``checkpoint()``, as a dict of the
+        parameters which select the next page.
+        """
+
+    @abc.abstractmethod
+    def _set_position(self, position: dict[str, t.Any]) -> None:
+        """
+        Set the position of the paginator from a ``checkpoint()``.
+
+        :param position: The checkpoint
+        """
+
     @abc.abstractmethod
     def pages(self) -> t.Iterator[PageT]:
         """``pages()`` yields GlobusHTTPResponse objects, each one representing a page
@@ -90,6 +269,120 @@ class Paginator(t.Iterable[PageT], metaclass=abc.ABCMeta):
         for page in self.pages():
             yield from page[self.items_key]
 
+    def _get_async_executor(self) -> concurrent.futures.Executor | None:
+        # the executor of the transport of the client whose method is paginated, or,
+        # for a method which is not a client method, the event loop's default executor
+        client = getattr(self.method, "__self__", None)
+        transport = getattr(client, "transport", None)
+        return t.cast(
+            t.Optional[concurrent.futures.Executor],
+            getattr(transport, "async_executor", None),
+        )
+
+    async def pages_async(self) -> t.AsyncIterator[PageT]:
+        """
+        ``pages_async()`` is the asynchronous counterpart of ``pages()``, for use within
+        an ``asyncio`` event loop. It yields the same pages, each of which is fetched
+        on the ``async_executor`` of the client's transport, as with the ``_async``
+        request methods of clients, so that paging does not block the event loop.
+
+        Iterating on a Paginator with ``async for`` is equivalent to iterating on its
+        ``pages_async()``.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_async_executor()
+        pages = self.pages()
+        try:
+            while True:
+                # each page is fetched in a copy of the caller's context, so that
+                # tracing spans of its requests are children of the caller's span
+                fetch = functools.partial(
+                    contextvars.copy_context().run, next, pages, _NO_MORE_PAGES
+                )
+                page = await loop.run_in_executor(executor, fetch)
+                if page is _NO_MORE_PAGES:
+                    return
+                yield t.cast(PageT, page)
+        finally:
+            close = getattr(pages, "close", None)
+            try:
+                if close is not None:
+                    close()
+            # a page may still be being fetched, if iteration was cancelled while it
+            # was awaited, in which case the pages are closed when they are collected
+            except ValueError:
+                pass
+
+    async def items_async(self) -> t.AsyncIterator[t.Any]:
+        """
+        ``items_async()`` is the asynchronous counterpart of ``items()``, yielding each
+        item in each page of results from ``pages_async()``.
+
+        Like ``items()``, it may raise a ``ValueError`` if the paginator was constructed
+        without identifying a key for use within each page of results.
+        """
+        if self.items_key is None:
+            raise ValueError(
+                "Cannot provide items_async() iteration on a paginator where "
+                "'items_key' is not set."
+            )
+        async for page in self.pages_async():
+            for item in page[self.items_key]:
+                yield item
+
+    def export_items(
+        self,
+        destination: str | os.PathLike[str] | t.IO[t.Any],
+        *,
+        format: _export.ExportFormat | None = None,
+        fields: t.Sequence[str] | None = None,
+        flatten: bool = False,
+        separator: str = ".",
+    ) -> int:
+        """
+        Write the items of each page of results to a file, and return the number of
+        items which were written. Pages are written as they are fetched, so that no
+        more than one page of items is held in memory at a time.
+
+        >>> paginator = tc.paginated.task_list()
+        >>> paginator.export_items("tasks.csv", fields=["task_id", "status"])
+
+        Items may be written as newline-delimited JSON (``"ndjson"``), as CSV
+        (``"csv"``), or, if ``pyarrow`` is installed, as Parquet (``"parquet"``), with
+        one row group per page.
+
+        Like ``items()``, it raises a ``ValueError`` if the paginator was constructed
+        without identifying a key for use within each page of results.
+
+        :param destination: The path of the file to write, or a file object. Files
+            are overwritten. A text file object is required for NDJSON and CSV.
+        :param format: The format to write. By default, it is inferred from the
+            suffix of the path: ``.ndjson`` or ``.jsonl``, ``.csv``, or ``.parquet``.
+        :param fields: The fields of each item to write, in order. A field may name
+            a nested value with ``separator``, e.g. ``"owner.id"``. By default, all
+            fields are written, and the columns of CSV and Parquet files are the
+            fields of the items of the first page with items. A field which first
+            appears on a later page raises a ``GlobusSDKUsageError``.
+        :param flatten: Whether to flatten nested objects into fields whose names
+            are joined with ``separator``, e.g. ``{"owner": {"id": 1}}`` is written
+            as ``{"owner.id": 1}``
+        :param separator: The separator of the names of nested fields
+        """
+        if self.items_key is None:
+            raise ValueError(
+                "Cannot provide export_items() on a paginator where 'items_key' "
+                "is not set."
+            )
+        return _export.export_items(
+            self.pages(),
+            self.items_key,
+            destination,
+            format=format,
+            fields=fields,
+            flatten=flatten,
+            separator=separator,
+        )
+
     @classmethod
     def wrap(cls, method: t.Callable[P, R]) -> t.Callable[P, Paginator[R]]:
         """
@@ -24,12 +24,17 @@ class LastKeyPaginator(Paginator[PageT]):
         )
         self.last_key: str | None = None
 
+    def _get_position(self) -> dict[str, t.Any]:
+        return {"last_key": self.last_key}
+
+    def _set_position(self, position: dict[str, t.Any]) -> None:
+        self.last_key = position["last_key"]
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self.exhausted:
             if self.last_key:
                 self.client_kwargs["last_key"] = self.last_key
             current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
             self.last_key = current_page.get("last_key")
-            has_next_page = current_page["has_next_page"]
+            self.exhausted = not current_page["has_next_page"]
+            yield current_page
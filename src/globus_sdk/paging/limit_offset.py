@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
+import functools
 import typing as t
 
 from .base import PageT, Paginator
 
+LimitOffsetTotalPaginatorT = t.TypeVar(
+    "LimitOffsetTotalPaginatorT", bound="LimitOffsetTotalPaginator[t.Any]"
+)
+
 
 class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-method
     _REQUIRES_METHOD_KWARGS = ("limit", "offset")
@@ -30,6 +37,14 @@ class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-
         self.limit = page_size
         self.offset = 0
 
+    def _get_position(self) -> dict[str, t.Any]:
+        return {"offset": self.offset, "limit": self.limit}
+
+    def _set_position(self, position: dict[str, t.Any]) -> None:
+        self.offset = int(position["offset"])
+        self.limit = int(position["limit"])
+        self.client_kwargs["offset"] = self.offset
+
     def _update_limit(self) -> None:
         if (
             self.max_total_results is not None
@@ -48,23 +63,149 @@ class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-
 
 class HasNextPaginator(_LimitOffsetBasedPaginator[PageT]):
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self.exhausted:
             self._update_limit()
             current_page = self.method(*self.client_args, **self.client_kwargs)
+            self.exhausted = (
+                self._update_and_check_offset(current_page)
+                or not current_page["has_next_page"]
+            )
             yield current_page
-            if self._update_and_check_offset(current_page):
-                return
-            has_next_page = current_page["has_next_page"]
 
 
 class LimitOffsetTotalPaginator(_LimitOffsetBasedPaginator[PageT]):
+    """
+    A paginator which uses ``limit`` and ``offset`` query params, and stops when the
+    ``total`` number of results in payloads has been reached.
+
+    The total is known once the first page has been fetched, and with it the offsets
+    of all of the remaining pages. A paginator made ``parallel()`` uses this to fetch
+    the remaining pages concurrently.
+    """
+
+    def __init__(self, method: t.Callable[..., t.Any], **kwargs: t.Any) -> None:
+        super().__init__(method, **kwargs)
+        self.max_workers = 1
+        self.ordered = True
+
+    def parallel(
+        self: LimitOffsetTotalPaginatorT, max_workers: int = 4, *, ordered: bool = True
+    ) -> LimitOffsetTotalPaginatorT:
+        """
+        Fetch the pages after the first one concurrently, on a pool of threads.
+        Returns the paginator, so that it can be chained with a paginated call:
+
+        >>> for task in tc.paginated.task_list().parallel(8).items():
+        ...     print(task["task_id"])
+
+        At most ``max_workers`` pages are fetched, or held waiting to be yielded, at
+        once. If iteration stops early, or a page cannot be fetched, pages which have
+        not been requested yet are not fetched.
+
+        :param max_workers: The maximum number of pages to fetch at once. ``1`` turns
+            parallel fetching off.
+        :param ordered: Yield pages in the order of their offsets. If ``False``, pages
+            are yielded as soon as they have been fetched.
+        """
+        if max_workers < 1:
+            raise ValueError("parallel() requires max_workers >= 1")
+        self.max_workers = max_workers
+        self.ordered = ordered
+        return self
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        if self.max_workers > 1:
+            yield from self._parallel_pages()
+            return
+        while not self.exhausted:
             self._update_limit()
             current_page = self.method(*self.client_args, **self.client_kwargs)
+            self.exhausted = (
+                self._update_and_check_offset(current_page)
+                or self.offset >= current_page["total"]
+            )
             yield current_page
-            if self._update_and_check_offset(current_page):
-                return
-            has_next_page = self.offset < current_page["total"]
+
+    def _parallel_pages(self) -> t.Iterator[PageT]:
+        if self.exhausted:
+            return
+        self._update_limit()
+        first_page = self.method(*self.client_args, **self.client_kwargs)
+        start = self.offset
+        self.exhausted = self._update_and_check_offset(first_page)
+        # the remaining pages are as large as the first one, which may be smaller than
+        # the requested limit if the service caps the page size
+        stride = self.offset - start
+        end = first_page["total"]
+        if self.max_total_results is not None:
+            end = min(end, self.max_total_results)
+        if stride <= 0 or self.offset >= end:
+            self.exhausted = True
+        yield first_page
+        if self.exhausted:
+            return
+
+        windows = [
+            (offset, min(stride, end - offset))
+            for offset in range(self.offset, end, stride)
+        ]
+        for count, (window, page) in enumerate(self._fetch_windows(windows), 1):
+            # pages which are yielded in order advance the position of the paginator
+            # one at a time, but pages which are yielded as they are fetched only
+            # advance it once all of them have been fetched
+            if self.ordered:
+                self.offset = sum(window)
+            if count == len(windows):
+                self.offset = end
+                self.exhausted = True
+            self.client_kwargs["offset"] = self.offset
+            yield page
+
+    def _fetch_windows(
+        self, windows: list[tuple[int, int]]
+    ) -> t.Iterator[tuple[tuple[int, int], PageT]]:
+        def fetch(offset: int, limit: int) -> PageT:
+            return t.cast(
+                PageT,
+                self.method(
+                    *self.client_args,
+                    **{**self.client_kwargs, "offset": offset, "limit": limit},
+                ),
+            )
+
+        remaining = iter(windows)
+        pending: dict[concurrent.futures.Future[PageT], tuple[int, int]] = {}
+
+        def submit_next() -> None:
+            window = next(remaining, None)
+            if window is not None:
+                # each page is fetched in a copy of the consumer's context, so that
+                # tracing spans of its requests are children of the consumer's span
+                context = contextvars.copy_context()
+                call = functools.partial(fetch, *window)
+                pending[executor.submit(context.run, call)] = window
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(windows))
+        )
+        try:
+            for _ in range(self.max_workers):
+                submit_next()
+            while pending:
+                done: t.Iterable[concurrent.futures.Future[PageT]]
+                if self.ordered:
+                    # futures are kept in the order in which they were submitted
+                    done = [next(iter(pending))]
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                for future in done:
+                    page = future.result()
+                    window = pending.pop(future)
+                    submit_next()
+                    yield window, page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
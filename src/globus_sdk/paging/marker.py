@@ -36,15 +36,20 @@ class MarkerPaginator(Paginator[PageT]):
     def _check_has_next_page(self, page: dict[str, t.Any]) -> bool:
         return bool(page.get("has_next_page", False))
 
+    def _get_position(self) -> dict[str, t.Any]:
+        return {"marker": self.marker}
+
+    def _set_position(self, position: dict[str, t.Any]) -> None:
+        self.marker = position["marker"]
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self.exhausted:
             if self.marker:
                 self.client_kwargs["marker"] = self.marker
             current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
             self.marker = current_page.get(self.marker_key)
-            has_next_page = self._check_has_next_page(current_page)
+            self.exhausted = not self._check_has_next_page(current_page)
+            yield current_page
 
 
 class NullableMarkerPaginator(MarkerPaginator[PageT]):
@@ -32,12 +32,17 @@ class NextTokenPaginator(Paginator[PageT]):
         )
         self.next_token: str | None = None
 
+    def _get_position(self) -> dict[str, t.Any]:
+        return {"next_token": self.next_token}
+
+    def _set_position(self, position: dict[str, t.Any]) -> None:
+        self.next_token = position["next_token"]
+
     def pages(self) -> t.Iterator[PageT]:
-        has_next_page = True
-        while has_next_page:
+        while not self.exhausted:
             if self.next_token:
                 self.client_kwargs["next_token"] = self.next_token
             current_page = self.method(*self.client_args, **self.client_kwargs)
-            yield current_page
             self.next_token = current_page.get("next_token")
-            has_next_page = current_page.get("next_token") is not None
+            self.exhausted = self.next_token is None
+            yield current_page
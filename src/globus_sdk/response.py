@@ -5,7 +5,7 @@ import json
 import logging
 import typing as t
 
-from globus_sdk import _guards
+from globus_sdk import _guards, _json
 
 log = logging.getLogger(__name__)
 
@@ -28,6 +28,10 @@ class GlobusHTTPResponse:
     ``data``, otherwise ``data`` will be ``None`` and ``text`` should
     be used instead.
 
+    The body is parsed on first access to ``data`` (including via item access,
+    ``get``, and iteration), so responses which are only used for their status,
+    headers, or raw content never pay the cost of parsing.
+
     The most common response data is a JSON dictionary. To make
     handling this type of response as seamless as possible, the
     ``GlobusHTTPResponse`` object implements the immutable mapping protocol for
@@ -55,9 +59,6 @@ class GlobusHTTPResponse:
             self._response: Response | None = None
             self.client: globus_sdk.BaseClient = self._wrapped.client
 
-            # copy parsed JSON data off of '_wrapped'
-            self._parsed_json: t.Any = self._wrapped._parsed_json
-
         # init on a Response object, this is the "normal" case
         # _wrapped is None
         else:
@@ -67,6 +68,17 @@ class GlobusHTTPResponse:
             self._response = response
             self.client = client
 
+        # JSON data is parsed lazily, on first use
+        self._json_is_parsed = False
+        self._json_data: t.Any = None
+
+    @property
+    def _parsed_json(self) -> t.Any:
+        # wrapped responses share the parsed data of the response they wrap
+        if self._wrapped is not None:
+            return self._wrapped._parsed_json
+
+        if not self._json_is_parsed:
             # JSON decoding may raise a ValueError due to an invalid JSON
             # document. In the case of trying to fetch the "data" on an HTTP
             # response, this means we didn't get a JSON response.
@@ -75,10 +87,12 @@ class GlobusHTTPResponse:
             # if the caller *really* wants the raw body of the response, they can
             # always use `text`
             try:
-                self._parsed_json = self._response.json()
+                self._json_data = _json.loads_response(self._raw_response)
             except ValueError:
                 log.warning("response data did not parse as JSON, data=None")
-                self._parsed_json = None
+                self._json_data = None
+            self._json_is_parsed = True
+        return self._json_data
 
     @property
     def _raw_response(self) -> Response:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import typing as t
+import warnings
 
 import jwt
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
@@ -13,6 +14,9 @@ from globus_sdk.exc.warnings import warn_deprecated
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.scopes import AuthScopes, TransferScopes, scopes_to_str
 
+if t.TYPE_CHECKING:
+    from globus_sdk.transport import RequestsTransport
+
 log = logging.getLogger(__name__)
 
 _DEFAULT_REQUESTED_SCOPES = (
@@ -113,3 +117,27 @@ class SupportsJWKMethods(t.Protocol):
         *,
         as_pem: bool = False,
     ) -> RSAPublicKey | dict[str, t.Any]: ...
+
+
+def prefetch_oidc_metadata(
+    *,
+    transport: RequestsTransport,
+    get_openid_configuration: t.Callable[[], GlobusHTTPResponse],
+    fget: _JWKGetCallbackProto,
+) -> None:
+    """
+    Fetch the OpenID Connect configuration and JWK of Globus Auth ahead of time,
+    so that the ``ResponseCache`` of a client's transport holds them.
+
+    Without a cache there is nowhere to keep them, so nothing is fetched, and a
+    warning is emitted instead.
+    """
+    if transport.response_cache is None:
+        warnings.warn(
+            "prefetch_metadata=True has no effect, because the client's transport "
+            "has no ResponseCache in which to store the metadata",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return
+    get_jwk_data(fget=fget, openid_configuration=get_openid_configuration())
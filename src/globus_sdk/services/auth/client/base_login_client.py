@@ -11,7 +11,7 @@ from globus_sdk.authorizers import GlobusAuthorizer, NullAuthorizer
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.scopes import AuthScopes, Scope
 
-from .._common import get_jwk_data, pem_decode_jwk_data
+from .._common import get_jwk_data, pem_decode_jwk_data, prefetch_oidc_metadata
 from ..errors import AuthAPIError
 from ..flow_managers import GlobusOAuthFlowManager
 from ..response import (
@@ -77,6 +77,29 @@ class AuthLoginClient(client.BaseClient):
             "use AuthClient instead."
         )
 
+    # FYI: this warm_up method is duplicated in AuthClient
+    # if this code is modified, please update that copy as well
+    def warm_up(self, *, connections: int = 1, prefetch_metadata: bool = False) -> None:
+        """
+        Open connections to Globus Auth ahead of time, and optionally fetch its
+        OpenID Connect configuration and JWK.
+
+        :param connections: The number of connections to open
+        :param prefetch_metadata: Also fetch the OpenID Connect configuration and JWK.
+            This only helps if the client's transport has a ``ResponseCache`` which
+            keeps these responses fresh, because of their caching headers or a
+            ``route_ttls`` entry, so that later calls to ``get_openid_configuration()``
+            and ``get_jwk()`` are served from it. Without a cache, nothing is fetched,
+            and a ``RuntimeWarning`` is emitted.
+        """
+        super().warm_up(connections=connections)
+        if prefetch_metadata:
+            prefetch_oidc_metadata(
+                transport=self.transport,
+                get_openid_configuration=self.get_openid_configuration,
+                fget=self.get,
+            )
+
     # FYI: this get_openid_configuration method is duplicated in AuthClient
     # if this code is modified, please update that copy as well
     #
@@ -3,6 +3,7 @@ Custom Transport class for the TransferClient that overrides
 default_check_transient_error
 """
 
+from globus_sdk import _json
 from globus_sdk.transport import RequestsTransport, RetryCheckResult, RetryContext
 
 
@@ -20,7 +21,7 @@ class TransferRequestsTransport(RequestsTransport):
             ctx.response.status_code in self.TRANSIENT_ERROR_STATUS_CODES
         ):
             try:
-                code = ctx.response.json()["code"]
+                code = _json.loads_response(ctx.response)["code"]
             except (ValueError, KeyError):
                 code = ""
 
@@ -1,5 +1,25 @@
+from ._circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
 from ._clientinfo import GlobusClientInfo
-from .encoders import FormRequestEncoder, JSONRequestEncoder, RequestEncoder
+from ._coalescing import RequestCoalescer
+from ._connection_pools import ConnectionPoolRegistry
+from ._hedging import HedgingPolicy
+from ._metrics import AttemptMetrics, TransportMetrics
+from ._rate_limiter import AdaptiveRateLimiter, RateLimitedError
+from ._response_cache import (
+    CacheEntry,
+    CacheStorage,
+    FileCacheStorage,
+    MemoryCacheStorage,
+    ResponseCache,
+)
+from ._retry_budget import RetryBudget
+from ._templates import RequestTemplate
+from .encoders import (
+    FormRequestEncoder,
+    JSONRequestEncoder,
+    RequestEncoder,
+    StreamingJSONBody,
+)
 from .requests import RequestsTransport
 from .retry import (
     RetryCheck,
@@ -21,5 +41,23 @@ __all__ = (
     "RequestEncoder",
     "JSONRequestEncoder",
     "FormRequestEncoder",
+    "StreamingJSONBody",
     "GlobusClientInfo",
+    "ConnectionPoolRegistry",
+    "AdaptiveRateLimiter",
+    "RateLimitedError",
+    "RetryBudget",
+    "HedgingPolicy",
+    "RequestCoalescer",
+    "TransportMetrics",
+    "AttemptMetrics",
+    "ResponseCache",
+    "CacheEntry",
+    "CacheStorage",
+    "MemoryCacheStorage",
+    "FileCacheStorage",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "RequestTemplate",
 )
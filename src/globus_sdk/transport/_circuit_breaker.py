@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import collections
+import enum
+import logging
+import threading
+import time
+import typing as t
+import urllib.parse
+
+import requests
+
+from globus_sdk import exc
+
+from .retry import RetryCheckResult, RetryContext
+
+log = logging.getLogger(__name__)
+
+
+class CircuitState(enum.Enum):
+    #: requests are sent normally
+    closed = enum.auto()
+    #: requests fail fast, without being sent
+    open = enum.auto()
+    #: a limited number of probe requests are sent to test if the host has recovered
+    half_open = enum.auto()
+
+
+class CircuitOpenError(exc.GlobusError):
+    """
+    A ``CircuitOpenError`` is raised instead of sending a request when the
+    ``CircuitBreaker`` for the host of that request is open.
+
+    :ivar host: The host for which the circuit is open
+    :ivar retry_after: The number of seconds until the circuit will allow a probe
+        request to be sent
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(
+            f"circuit is open for {host}, requests will be allowed again "
+            f"in {retry_after:.2f}s"
+        )
+
+
+class _HostCircuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.closed
+        # (timestamp, failed) pairs, within the sliding window
+        self.outcomes: collections.deque[tuple[float, bool]] = collections.deque()
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+
+    def open(self, now: float) -> None:
+        self.state = CircuitState.open
+        self.opened_at = now
+        self.probes_in_flight = 0
+        self.outcomes.clear()
+
+    def close(self) -> None:
+        self.state = CircuitState.closed
+        self.probes_in_flight = 0
+        self.outcomes.clear()
+
+
+class CircuitBreaker:
+    """
+    A ``CircuitBreaker`` tracks the failure rate of requests to each host, across all
+    requests which pass through it, and stops sending requests to a host which is
+    failing.
+
+    A circuit starts *closed*. When at least ``minimum_requests`` requests have been
+    seen within the last ``window`` seconds and at least ``failure_threshold`` of them
+    failed, the circuit *opens*. While open, requests to the host raise
+    ``CircuitOpenError`` without being sent, and requests which are already in
+    progress are not retried.
+
+    After ``reset_timeout`` seconds, the circuit becomes *half-open*, and allows up to
+    ``half_open_max_requests`` probe requests through. If a probe succeeds, the
+    circuit closes again. If it fails, the circuit reopens.
+
+    Network errors and responses with a status in ``failure_status_codes`` are
+    failures. All other responses are successes.
+
+    A breaker is safe to share between threads, and between transports. Attach it to a
+    transport with the ``circuit_breaker`` transport parameter.
+
+    A ``CircuitBreaker`` is also a retry check. The transport registers it ahead of
+    all other checks, so that it sees the outcome of every attempt and can stop
+    retries against an open circuit.
+
+    :param failure_threshold: The fraction of requests, between 0 and 1, which must fail
+        within the window for the circuit to open
+    :param minimum_requests: The minimum number of requests within the window before
+        the circuit may open
+    :param window: The length of the sliding window of outcomes, in seconds
+    :param reset_timeout: The amount of time, in seconds, that a circuit stays open
+        before allowing probe requests
+    :param half_open_max_requests: The number of probe requests which may be in
+        progress at once while the circuit is half-open
+    :param failure_status_codes: Response status codes which are counted as failures
+
+    **Examples**
+
+    >>> breaker = CircuitBreaker(failure_threshold=0.5, reset_timeout=30)
+    >>> tc = TransferClient(transport_params={"circuit_breaker": breaker})
+    >>> try:
+    ...     tc.get_task(task_id)
+    ... except CircuitOpenError as err:
+    ...     print(f"transfer is unavailable, try again in {err.retry_after}s")
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        minimum_requests: int = 10,
+        window: float = 60.0,
+        reset_timeout: float = 30.0,
+        half_open_max_requests: int = 1,
+        failure_status_codes: tuple[int, ...] = (500, 502, 503, 504),
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be between 0 and 1")
+        self.failure_threshold = failure_threshold
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_requests = half_open_max_requests
+        self.failure_status_codes = failure_status_codes
+
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _HostCircuit] = collections.defaultdict(_HostCircuit)
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _update_state(self, circuit: _HostCircuit, now: float) -> None:
+        # an open circuit becomes half-open after the reset timeout
+        # a half-open circuit whose probes never reported an outcome also has its
+        # probes reset after the timeout, so that it cannot be stuck half-open
+        if (
+            circuit.state is not CircuitState.closed
+            and now - circuit.opened_at >= self.reset_timeout
+        ):
+            circuit.state = CircuitState.half_open
+            circuit.opened_at = now
+            circuit.probes_in_flight = 0
+
+    def state(self, url: str) -> CircuitState:
+        """
+        Get the current state of the circuit for the host of a URL.
+
+        :param url: A URL on the host to check
+        """
+        with self._lock:
+            circuit = self._circuits[self._host(url)]
+            self._update_state(circuit, time.monotonic())
+            return circuit.state
+
+    def before_request(self, url: str) -> None:
+        """
+        Check whether a request may be sent, raising ``CircuitOpenError`` if it may
+        not. While the circuit is half-open, an allowed request is a probe.
+
+        :param url: The URL to which the request will be sent
+        """
+        host = self._host(url)
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuits[host]
+            self._update_state(circuit, now)
+            if circuit.state is CircuitState.closed:
+                return
+            if (
+                circuit.state is CircuitState.half_open
+                and circuit.probes_in_flight < self.half_open_max_requests
+            ):
+                log.debug("circuit half-open for %s, sending probe request", host)
+                circuit.probes_in_flight += 1
+                return
+            retry_after = max(0.0, circuit.opened_at + self.reset_timeout - now)
+        raise CircuitOpenError(host, retry_after)
+
+    def _is_failure(self, ctx: RetryContext) -> bool:
+        if ctx.response is not None:
+            return ctx.response.status_code in self.failure_status_codes
+        return isinstance(ctx.exception, requests.RequestException)
+
+    def record(self, url: str, ctx: RetryContext) -> None:
+        """
+        Record the outcome of an attempt to send a request.
+
+        :param url: The URL to which the request was sent
+        :param ctx: The retry context describing the outcome of the attempt
+        """
+        failed = self._is_failure(ctx)
+        host = self._host(url)
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuits[host]
+            self._update_state(circuit, now)
+
+            if circuit.state is CircuitState.half_open:
+                if failed:
+                    log.warning("circuit probe failed for %s, reopening", host)
+                    circuit.open(now)
+                else:
+                    log.debug("circuit probe succeeded for %s, closing", host)
+                    circuit.close()
+                return
+            if circuit.state is CircuitState.open:
+                return
+
+            circuit.outcomes.append((now, failed))
+            while circuit.outcomes and circuit.outcomes[0][0] < now - self.window:
+                circuit.outcomes.popleft()
+            total = len(circuit.outcomes)
+            failures = sum(1 for _, f in circuit.outcomes if f)
+            if (
+                total >= self.minimum_requests
+                and failures / total >= self.failure_threshold
+            ):
+                log.warning(
+                    "circuit opened for %s (%d of %d recent requests failed)",
+                    host,
+                    failures,
+                    total,
+                )
+                circuit.open(now)
+
+    def __call__(self, ctx: RetryContext) -> RetryCheckResult:
+        """
+        A retry check which prevents retries to a host whose circuit is open.
+
+        :param ctx: The context object which describes the state of the request and the
+            retries which may already have been attempted.
+        """
+        if ctx.response is not None:
+            url: str | None = ctx.response.url
+        elif isinstance(ctx.exception, requests.RequestException) and (
+            ctx.exception.request is not None
+        ):
+            url = t.cast(str, ctx.exception.request.url)
+        else:
+            url = None
+        if url and self.state(url) is not CircuitState.closed:
+            return RetryCheckResult.do_not_retry
+        return RetryCheckResult.no_decision
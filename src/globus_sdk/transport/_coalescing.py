@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import logging
+import threading
+import typing as t
+
+import requests
+
+from ._request_keys import authorization_identity
+
+log = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.response: requests.Response | None = None
+        self.error: BaseException | None = None
+        self.callbacks: list[t.Callable[[], object]] = []
+
+
+def _set_done(future: asyncio.Future[None]) -> None:
+    # a waiter which was cancelled no longer needs to be woken
+    if not future.done():
+        future.set_result(None)
+
+
+class RequestCoalescer:
+    """
+    A ``RequestCoalescer`` merges identical requests which are in flight at the same
+    time. The first caller sends the request, and the others wait for it and receive
+    a copy of its response, or the same error, without sending requests of their
+    own.
+
+    Requests are identical when they have the same method, URL (including the query
+    string), and ``Authorization`` header. Only requests with idempotent ``methods``,
+    whose responses are not streamed, are coalesced.
+
+    Callers are merged before any attempt to send the request is made, and wait for
+    the whole of the first caller's request, including its retries. Only the first
+    caller's request is paced by a rate limiter, checked by a circuit breaker, and
+    recorded in the metrics of its transport.
+
+    A coalescer is safe to share between threads, and between transports. It is most
+    useful when many threads read the same resources at once, e.g. when several
+    watchers poll the same task, or when many workers start up together.
+
+    :param methods: The HTTP methods of requests which may be coalesced
+
+    **Examples**
+
+    >>> coalescer = RequestCoalescer()
+    >>> tc = TransferClient(transport_params={"request_coalescer": coalescer})
+    """
+
+    def __init__(self, methods: tuple[str, ...] = ("GET", "HEAD")) -> None:
+        self.methods = tuple(m.upper() for m in methods)
+        self._lock = threading.Lock()
+        self._calls: dict[tuple[str, str, str], _InFlightCall] = {}
+
+    def applies_to(self, method: str) -> bool:
+        """
+        Check whether requests with a given method may be coalesced.
+
+        :param method: An HTTP method
+        """
+        return method.upper() in self.methods
+
+    def get_key(self, request: requests.PreparedRequest) -> tuple[str, str, str]:
+        """
+        Get the key which identifies identical requests.
+
+        :param request: The request
+        """
+        return (
+            str(request.method),
+            str(request.url),
+            authorization_identity(request),
+        )
+
+    def _join(self, key: tuple[str, str, str]) -> tuple[_InFlightCall, bool]:
+        # get the in-flight call for a key, and whether the caller leads it
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _InFlightCall()
+                return call, True
+            call.waiters += 1
+            return call, False
+
+    def _finish(self, key: tuple[str, str, str], call: _InFlightCall) -> None:
+        with self._lock:
+            del self._calls[key]
+            waiters = call.waiters
+            call.done.set()
+            callbacks, call.callbacks = call.callbacks, []
+        if waiters:
+            log.debug("identical request was coalesced for %d callers", waiters)
+        for callback in callbacks:
+            callback()
+
+    def _add_done_callback(
+        self, call: _InFlightCall, callback: t.Callable[[], object]
+    ) -> None:
+        with self._lock:
+            if not call.done.is_set():
+                call.callbacks.append(callback)
+                return
+        callback()
+
+    @staticmethod
+    def _get_outcome(call: _InFlightCall) -> requests.Response:
+        if call.error is not None:
+            raise call.error
+        # each caller gets its own response object, sharing the same content
+        return copy.copy(t.cast(requests.Response, call.response))
+
+    def run(
+        self, key: tuple[str, str, str], send: t.Callable[[], requests.Response]
+    ) -> requests.Response:
+        """
+        Send a request, unless an identical request is already in flight, in which
+        case wait for its outcome instead.
+
+        :param key: The key of the request, from ``get_key``
+        :param send: A callable which sends the request
+        """
+        call, is_leader = self._join(key)
+        if not is_leader:
+            log.debug("waiting for identical in-flight request")
+            call.done.wait()
+            return self._get_outcome(call)
+
+        try:
+            call.response = send()
+            return call.response
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            self._finish(key, call)
+
+    async def run_async(
+        self,
+        key: tuple[str, str, str],
+        send: t.Callable[[], t.Awaitable[requests.Response]],
+    ) -> requests.Response:
+        """
+        The ``asyncio`` version of ``run()``, which waits for an identical request
+        without blocking the event loop.
+
+        :param key: The key of the request, from ``get_key``
+        :param send: An async callable which sends the request
+        """
+        call, is_leader = self._join(key)
+        if not is_leader:
+            log.debug("waiting for identical in-flight request")
+            loop = asyncio.get_running_loop()
+            done: asyncio.Future[None] = loop.create_future()
+            self._add_done_callback(
+                call, functools.partial(loop.call_soon_threadsafe, _set_done, done)
+            )
+            await done
+            return self._get_outcome(call)
+
+        try:
+            call.response = await send()
+            return call.response
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            self._finish(key, call)
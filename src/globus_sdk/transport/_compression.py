@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import typing as t
+import zlib
+
+import requests
+
+log = logging.getLogger(__name__)
+
+# wbits for zlib which select the gzip container format
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+# the size of the slices of a bytes body which are compressed at once
+_SLICE_SIZE = 1024 * 1024
+
+
+def _gzip_chunks(
+    chunks: t.Iterable[bytes | memoryview], level: int
+) -> t.Iterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class _GzipStream:
+    """
+    A request body which gzips an iterable of chunks as it is iterated.
+    """
+
+    def __init__(self, chunks: t.Iterable[bytes], level: int) -> None:
+        self._chunks = chunks
+        self._level = level
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        return _gzip_chunks(self._chunks, self._level)
+
+
+def _slices(body: bytes) -> t.Iterator[memoryview]:
+    view = memoryview(body)
+    for start in range(0, len(view), _SLICE_SIZE):
+        yield view[start : start + _SLICE_SIZE]
+
+
+def compress_request_body(
+    prepared: requests.PreparedRequest, *, threshold: int, level: int
+) -> None:
+    """
+    Gzip the body of a prepared request in place, if it is at least ``threshold``
+    bytes, and set the ``Content-Encoding`` header.
+
+    A body which is in memory is compressed in slices, and replaced with the
+    (much smaller) compressed data. A body which is an iterable of chunks, like a
+    ``StreamingJSONBody``, is compressed as it is sent. Only as many of its chunks as
+    are needed to reach the threshold are read ahead of time. If it ends before the
+    threshold, it is sent uncompressed.
+
+    :param prepared: The request whose body may be compressed
+    :param threshold: The minimum size, in bytes, of a body which is compressed
+    :param level: The compression level, from 1 (fastest) to 9 (smallest)
+    """
+    # the body may be any data accepted by requests, not only bytes or str
+    body: t.Any = prepared.body
+    if body is None or "Content-Encoding" in prepared.headers:
+        return
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if isinstance(body, bytes):
+        if len(body) < threshold:
+            return
+        compressed = b"".join(_gzip_chunks(_slices(body), level))
+        log.debug("compressed request body from %d to %d", len(body), len(compressed))
+        prepared.body = compressed
+        prepared.headers["Content-Length"] = str(len(compressed))
+        prepared.headers["Content-Encoding"] = "gzip"
+        return
+
+    # a body which is some other kind of object (e.g. a file) is left as-is
+    if "Transfer-Encoding" not in prepared.headers:
+        return
+
+    # a streamed body: read ahead until the threshold is reached
+    iterator: t.Iterator[bytes] = iter(body)
+    head: list[bytes] = []
+    size = 0
+    for chunk in iterator:
+        head.append(chunk)
+        size += len(chunk)
+        if size >= threshold:
+            break
+    else:
+        # the body is complete, and under the threshold
+        prepared.body = b"".join(head)
+        del prepared.headers["Transfer-Encoding"]
+        prepared.headers["Content-Length"] = str(size)
+        return
+
+    if iterator is body:
+        # a single-use iterator, which must be resumed after the chunks read ahead
+        chunks: t.Iterable[bytes] = itertools.chain(head, iterator)
+    else:
+        # a re-iterable body is read again from the start, so that the compressed
+        # body can also be sent more than once (e.g. when a request is hedged)
+        chunks = body
+    prepared.body = t.cast(bytes, _GzipStream(chunks, level))
+    prepared.headers["Content-Encoding"] = "gzip"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+import urllib.parse
+
+import requests
+import requests.adapters
+
+log = logging.getLogger(__name__)
+
+
+class ConnectionPoolRegistry:
+    """
+    A ``ConnectionPoolRegistry`` holds ``requests.Session`` objects, one per host, which
+    may be shared by many transports, and therefore by many clients.
+
+    By default, each transport creates its own session and with it, its own connection
+    pools. When several clients talk to the same hosts, they can share a registry so
+    that keep-alive connections are reused across clients rather than being opened
+    (and TLS handshakes repeated) separately by each one.
+
+    A registry is safe to share between threads. Sessions are created lazily, on the
+    first request to a given host.
+
+    A registry owns its sessions: closing a transport which uses a registry does not
+    close them. Use ``close()`` on the registry to release its connections.
+
+    :param pool_connections: The number of urllib3 connection pools to cache in each
+        session
+    :param pool_maxsize: The maximum number of connections to keep open in each
+        connection pool
+    :param pool_block: Whether a session should block when no free connection is
+        available in a pool, rather than opening a new (unpooled) connection
+
+    **Examples**
+
+    Share connections between all clients in a process, via the default registry:
+
+    >>> pools = ConnectionPoolRegistry.get_default()
+    >>> tc = TransferClient(transport_params={"connection_pools": pools})
+    >>> gc = GroupsClient(transport_params={"connection_pools": pools})
+    """
+
+    _default: t.ClassVar[ConnectionPoolRegistry | None] = None
+    _default_lock: t.ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+        pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+        pool_block: bool = requests.adapters.DEFAULT_POOLBLOCK,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._lock = threading.Lock()
+        self._sessions: dict[tuple[str, str], requests.Session] = {}
+
+    @classmethod
+    def get_default(cls) -> ConnectionPoolRegistry:
+        """
+        Get the process-wide default registry, creating it if necessary.
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _session_key(self, url: str) -> tuple[str, str]:
+        parsed = urllib.parse.urlsplit(url)
+        return (parsed.scheme.lower(), parsed.netloc.lower())
+
+    def _make_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Get the session used to send requests to the host of a URL.
+
+        :param url: The URL to which a request will be sent
+        """
+        key = self._session_key(url)
+        # fast path: avoid taking the lock once a session exists
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._lock:
+            if key not in self._sessions:
+                log.debug("creating pooled session for %s://%s", *key)
+                self._sessions[key] = self._make_session()
+            return self._sessions[key]
+
+    def close(self) -> None:
+        """
+        Close all sessions held by this registry. Sessions will be created again if
+        the registry is used after being closed.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import math
+import threading
+
+
+class HedgingPolicy:
+    """
+    A ``HedgingPolicy`` enables hedged requests on a transport. When an attempt to
+    send a request with one of the hedged ``methods`` has not completed within the
+    hedging delay, a second, identical attempt is sent, and whichever response
+    arrives first is used. The other response is discarded.
+
+    Hedging reduces tail latency for reads whose slowness comes from individual slow
+    responses, rather than from failures. Each hedged attempt is still a single
+    attempt as far as the transport is concerned: the same authorization header is
+    used for both requests, and the retry checks run on the winning response.
+
+    The delay is either fixed, or the given ``percentile`` of recently observed
+    response times. With a ``percentile``, no hedge is sent until ``min_samples``
+    response times have been observed, unless a fixed ``delay`` is also given, in
+    which case it is used until then.
+
+    Only idempotent methods should be hedged. Some services offer read-only ``POST``
+    operations (e.g. ``SearchClient.post_search``), and ``"POST"`` may be added to the
+    methods of a policy for clients which only use such operations.
+
+    If the transport has a ``RetryBudget``, each hedge consumes a retry from it, and
+    no hedge is sent when the budget is exhausted.
+
+    :param delay: A fixed delay, in seconds, after which to send a hedge
+    :param percentile: A percentile, between 0 and 100, of observed response times to
+        use as the delay
+    :param methods: The HTTP methods of requests which may be hedged
+    :param min_samples: The number of response times which must be observed before
+        the ``percentile`` is used
+    :param max_samples: The number of most recent response times which are kept
+    :param max_workers: The maximum number of threads used to send hedged requests
+
+    **Examples**
+
+    Send a second request for any read which takes longer than the 95th percentile
+    of recent reads:
+
+    >>> policy = HedgingPolicy(percentile=95)
+    >>> tc = TransferClient(transport_params={"hedging": policy})
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: float | None = None,
+        percentile: float | None = None,
+        methods: tuple[str, ...] = ("GET", "HEAD", "OPTIONS"),
+        min_samples: int = 20,
+        max_samples: int = 200,
+        max_workers: int | None = None,
+    ) -> None:
+        if delay is None and percentile is None:
+            raise ValueError("at least one of delay or percentile must be given")
+        if percentile is not None and not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.delay = delay
+        self.percentile = percentile
+        self.methods = tuple(m.upper() for m in methods)
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._samples: collections.deque[float] = collections.deque(maxlen=max_samples)
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def applies_to(self, method: str) -> bool:
+        """
+        Check whether requests with a given method may be hedged.
+
+        :param method: An HTTP method
+        """
+        return method.upper() in self.methods
+
+    def get_delay(self) -> float | None:
+        """
+        Get the current hedging delay, in seconds, or ``None`` if no hedge should be
+        sent.
+        """
+        if self.percentile is not None:
+            with self._lock:
+                samples = sorted(self._samples)
+            if len(samples) >= self.min_samples:
+                index = math.ceil(self.percentile / 100 * len(samples)) - 1
+                return samples[max(index, 0)]
+        return self.delay
+
+    def record_latency(self, seconds: float) -> None:
+        """
+        Record the time taken to receive a response.
+
+        :param seconds: The response time, in seconds
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Get the thread pool on which hedged requests are sent, creating it on first
+        use.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="globus-sdk-hedge"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool of the policy. Requests which are in progress are
+        allowed to finish.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import bisect
+import collections
+import dataclasses
+import logging
+import threading
+import typing as t
+import urllib.parse
+
+log = logging.getLogger(__name__)
+
+#: the default upper bounds, in seconds, of the buckets of latency histograms
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+AttemptListener = t.Callable[["AttemptMetrics"], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class AttemptMetrics:
+    """
+    The measurements of a single attempt to send a request, passed to the listeners
+    of a ``TransportMetrics`` object.
+
+    Times are in seconds. Values which could not be measured are ``None``. In
+    particular, the time to first byte is not known for attempts which failed
+    without a response, and the size of a request body is not known when the body
+    is streamed.
+
+    :param method: The HTTP method of the request
+    :param url: The URL of the request, including the query string
+    :param host: The host (and port, if any) to which the request was sent
+    :param attempt: The attempt number, starting at 0
+    :param status: The status code of the response
+    :param error: The name of the type of error raised by the attempt, if it failed
+        without a response
+    :param time_to_first_byte: The time from sending the request until the response
+        headers were received
+    :param total_time: The time from sending the request until the response was
+        received, including its body unless the response is streamed
+    :param request_bytes: The size of the request body
+    :param response_bytes: The size of the response body
+    :param retry_reason: The name of the retry check which requested a retry of
+        the request after this attempt, if the request was retried
+    :param sleep: The time slept before the next attempt, if the request was retried
+    :param stop_reason: Why the request was not retried after this attempt,
+        although a retry check requested a retry: ``"max_retries"``,
+        ``"deadline"``, or ``"retry_budget"``
+    """
+
+    method: str
+    url: str
+    host: str
+    attempt: int
+    status: int | None
+    error: str | None
+    time_to_first_byte: float | None
+    total_time: float
+    request_bytes: int | None
+    response_bytes: int | None
+    retry_reason: str | None
+    sleep: float | None
+    stop_reason: str | None = None
+
+    @property
+    def retried(self) -> bool:
+        """
+        Whether the request was retried after this attempt.
+        """
+        return self.sleep is not None and self.stop_reason is None
+
+
+class _Histogram:
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # one bucket per bound, plus a final bucket for values above all bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, t.Any]:
+        # buckets are cumulative, keyed by their upper bounds
+        buckets: dict[float, int] = {}
+        total = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            total += count
+            buckets[bound] = total
+        return {"buckets": buckets, "count": total, "sum": self.sum}
+
+
+class _HostMetrics:
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.attempts = 0
+        self.errors = 0
+        self.retries = 0
+        self.latency = _Histogram(bounds)
+        self.time_to_first_byte = _Histogram(bounds)
+
+    def snapshot(self) -> dict[str, t.Any]:
+        return {
+            "attempts": self.attempts,
+            "errors": self.errors,
+            "retries": self.retries,
+            "latency": self.latency.snapshot(),
+            "time_to_first_byte": self.time_to_first_byte.snapshot(),
+        }
+
+
+class TransportMetrics:
+    """
+    ``TransportMetrics`` collect measurements of the requests sent by a transport.
+
+    Every transport has a ``metrics`` attribute holding one of these objects. It
+    keeps counters and latency histograms, which can be read at any time with
+    ``snapshot()``, and calls its listeners with the ``AttemptMetrics`` of each
+    attempt to send a request, for export to other monitoring systems.
+
+    Metrics are safe to share between threads, and between transports. Pass the
+    same object as the ``metrics`` transport parameter of several clients to
+    aggregate their measurements.
+
+    Listeners are called synchronously, in the thread which sent the request, so
+    they should be fast. Errors raised by listeners are logged and ignored.
+    Listeners are not kept when the metrics are pickled.
+
+    :param latency_buckets: The upper bounds, in seconds, of the buckets of the
+        latency histograms
+    :param listeners: Initial listeners, called with the ``AttemptMetrics`` of each
+        attempt
+
+    **Examples**
+
+    Log every attempt which took longer than a second:
+
+    >>> def log_slow_attempts(attempt):
+    ...     if attempt.total_time > 1:
+    ...         print(f"slow {attempt.method} to {attempt.url}: {attempt.total_time}s")
+    ...
+    >>> tc = TransferClient(...)
+    >>> tc.transport.metrics.add_listener(log_slow_attempts)
+
+    Scrape the counters of a transport:
+
+    >>> tc.transport.metrics.snapshot()["hosts"]["transfer.api.globus.org"]
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets: t.Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        listeners: t.Iterable[AttemptListener] = (),
+    ) -> None:
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self._listeners: list[AttemptListener] = list(listeners)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._requests = 0
+        self._attempts = 0
+        self._errors = 0
+        self._retries = 0
+        self._retry_sleep = 0.0
+        self._request_bytes = 0
+        self._response_bytes = 0
+        self._status_codes: collections.Counter[int] = collections.Counter()
+        self._retry_reasons: collections.Counter[str] = collections.Counter()
+        self._stop_reasons: collections.Counter[str] = collections.Counter()
+        self._hosts: dict[str, _HostMetrics] = {}
+
+    # customize pickling methods to ensure that the object is pickle-safe
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # when pickling, drop the lock and listeners, which may not be picklable
+        d = dict(self.__dict__)  # copy
+        del d["_lock"]
+        d["_listeners"] = []
+        return d
+
+    def __setstate__(self, d: dict[str, t.Any]) -> None:
+        self.__dict__.update(d)
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: AttemptListener) -> AttemptListener:
+        """
+        Add a listener, which will be called with the ``AttemptMetrics`` of each
+        attempt. The listener is returned, so that this may be used as a decorator.
+
+        :param listener: The listener to add
+        """
+        with self._lock:
+            self._listeners.append(listener)
+        return listener
+
+    def remove_listener(self, listener: AttemptListener) -> None:
+        """
+        Remove a listener.
+
+        :param listener: The listener to remove
+        """
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def record_request(self) -> None:
+        """
+        Record that a new request (not a retry) is being sent.
+        """
+        with self._lock:
+            self._requests += 1
+
+    def record_attempt(self, attempt: AttemptMetrics) -> None:
+        """
+        Record the measurements of an attempt, and pass them to the listeners.
+
+        :param attempt: The measurements of the attempt
+        """
+        with self._lock:
+            self._attempts += 1
+            host = self._hosts.get(attempt.host)
+            if host is None:
+                host = self._hosts[attempt.host] = _HostMetrics(self.latency_buckets)
+            host.attempts += 1
+            host.latency.observe(attempt.total_time)
+            if attempt.time_to_first_byte is not None:
+                host.time_to_first_byte.observe(attempt.time_to_first_byte)
+            if attempt.status is not None:
+                self._status_codes[attempt.status] += 1
+            if attempt.error is not None:
+                self._errors += 1
+                host.errors += 1
+            if attempt.retry_reason is not None:
+                self._retry_reasons[attempt.retry_reason] += 1
+            if attempt.stop_reason is not None:
+                self._stop_reasons[attempt.stop_reason] += 1
+            if attempt.sleep is not None:
+                self._retry_sleep += attempt.sleep
+            if attempt.retried:
+                self._retries += 1
+                host.retries += 1
+            self._request_bytes += attempt.request_bytes or 0
+            self._response_bytes += attempt.response_bytes or 0
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(attempt)
+            except Exception:
+                log.exception("error in transport metrics listener")
+
+    def snapshot(self) -> dict[str, t.Any]:
+        """
+        Get a copy of the current counters and histograms, as a dict.
+
+        The dict contains the total numbers of ``requests``, ``attempts``,
+        ``errors`` (attempts which failed without a response), and ``retries``, the
+        total ``retry_sleep`` time, the total ``request_bytes`` and
+        ``response_bytes``, and counts of ``status_codes``, ``retry_reasons``, and
+        ``stop_reasons``.
+
+        Under ``hosts``, it contains the numbers of ``attempts``, ``errors``, and
+        ``retries`` for each host, and histograms of the ``latency`` (total time) and
+        ``time_to_first_byte`` of its attempts. Histograms contain a ``count``, a
+        ``sum``, and cumulative ``buckets``, keyed by their upper bounds.
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "attempts": self._attempts,
+                "errors": self._errors,
+                "retries": self._retries,
+                "retry_sleep": self._retry_sleep,
+                "request_bytes": self._request_bytes,
+                "response_bytes": self._response_bytes,
+                "status_codes": dict(self._status_codes),
+                "retry_reasons": dict(self._retry_reasons),
+                "stop_reasons": dict(self._stop_reasons),
+                "hosts": {name: host.snapshot() for name, host in self._hosts.items()},
+            }
+
+    def reset(self) -> None:
+        """
+        Reset all counters and histograms to zero. Listeners are kept.
+        """
+        with self._lock:
+            self._reset()
+
+
+def _body_size(body: t.Any) -> int | None:
+    if isinstance(body, bytes):
+        return len(body)
+    # a text body is sent encoded as UTF-8, so its size is that of the encoding
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return None
+
+
+def _response_size(response: t.Any, stream: bool) -> int | None:
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None:
+        try:
+            return int(content_length)
+        except ValueError:
+            pass
+    if not stream:
+        return len(response.content)
+    return None
+
+
+def _host(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc.lower()
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+import requests
+
+from globus_sdk import exc
+
+from .retry import _parse_retry_after
+
+log = logging.getLogger(__name__)
+
+
+class RateLimitedError(exc.GlobusError):
+    """
+    A ``RateLimitedError`` is raised instead of sending a request when the
+    ``AdaptiveRateLimiter`` would delay the request past its deadline.
+
+    :ivar delay: The number of seconds for which the request would have been delayed
+    """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        super().__init__(
+            f"rate limiter would delay request by {delay:.2f}s, past its deadline"
+        )
+
+
+class AdaptiveRateLimiter:
+    """
+    An ``AdaptiveRateLimiter`` paces all requests sent through the transports which
+    share it, and adapts its rate to the throttling responses it observes.
+
+    It is a token bucket, refilled at ``rate`` requests per second and holding up to
+    ``burst`` tokens. Each request attempt takes a token, waiting for one if the
+    bucket is empty.
+
+    The rate is adjusted with an additive-increase, multiplicative-decrease (AIMD)
+    policy:
+
+    - when a response has a throttling status (429 or 503 by default), the rate is
+      multiplied by ``decrease_factor``, but not below ``min_rate``. If the response
+      has a ``Retry-After`` header, no request will be sent until that time has
+      elapsed, up to ``max_pause`` seconds
+    - every other response increases the rate by ``additive_increase``, up to
+      ``max_rate``
+
+    Throttling responses which arrive within one second of a decrease do not decrease
+    the rate again, since they typically describe requests sent before that decrease.
+
+    A limiter is safe to share between threads, and between transports. Use one
+    limiter per service to pace all calls to that service.
+
+    :param max_rate: The maximum rate, in requests per second
+    :param min_rate: The minimum rate, in requests per second
+    :param initial_rate: The starting rate, in requests per second. Defaults to
+        ``max_rate``
+    :param burst: The number of requests which may be sent at once, without pacing,
+        when the limiter has been idle
+    :param additive_increase: The amount by which to increase the rate after each
+        response which was not throttled
+    :param decrease_factor: The factor by which to multiply the rate after a throttling
+        response
+    :param throttle_status_codes: The status codes which are treated as throttling
+        responses
+    :param max_pause: The maximum time, in seconds, for which a ``Retry-After``
+        header pauses all requests. Defaults to 10, the default ``max_sleep`` of a
+        transport
+
+    **Examples**
+
+    Share a limiter between all clients of a service:
+
+    >>> limiter = AdaptiveRateLimiter(max_rate=20)
+    >>> tc1 = TransferClient(transport_params={"rate_limiter": limiter})
+    >>> tc2 = TransferClient(transport_params={"rate_limiter": limiter})
+    """
+
+    #: the minimum interval, in seconds, between two decreases of the rate
+    DECREASE_COOLDOWN = 1.0
+
+    def __init__(
+        self,
+        *,
+        max_rate: float,
+        min_rate: float = 0.1,
+        initial_rate: float | None = None,
+        burst: int = 1,
+        additive_increase: float = 0.1,
+        decrease_factor: float = 0.5,
+        throttle_status_codes: tuple[int, ...] = (429, 503),
+        max_pause: float = 10.0,
+    ) -> None:
+        if not 0 < min_rate <= max_rate:
+            raise ValueError("rates must satisfy 0 < min_rate <= max_rate")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if max_pause < 0:
+            raise ValueError("max_pause must be non-negative")
+
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.throttle_status_codes = throttle_status_codes
+        self.max_pause = max_pause
+
+        self._lock = threading.Lock()
+        self._rate = min(max(initial_rate or max_rate, min_rate), max_rate)
+        # the "theoretical arrival time" of the next request, as in the generic cell
+        # rate algorithm, which is an equivalent formulation of a token bucket
+        self._tat = 0.0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+
+    @property
+    def rate(self) -> float:
+        """The current rate, in requests per second."""
+        return self._rate
+
+    def _reserve(self, deadline: float | None = None) -> float:
+        """
+        Take a token, and return the amount of time (in seconds) that the caller must
+        wait before sending its request.
+
+        :param deadline: The deadline of the request, as a ``time.monotonic()`` value.
+            If the wait would go past it, no token is taken and a
+            ``RateLimitedError`` is raised.
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self._rate
+            tolerance = (self.burst - 1) * interval
+            tat = max(self._tat, now, self._paused_until + tolerance)
+            delay = max(0.0, tat - tolerance - now)
+            if deadline is not None and now + delay > deadline:
+                raise RateLimitedError(delay)
+            self._tat = tat + interval
+            return delay
+
+    def acquire(self, deadline: float | None = None) -> None:
+        """
+        Wait until a request may be sent. This blocks the calling thread.
+
+        :param deadline: The deadline of the request, as a ``time.monotonic()`` value.
+            If the request could not be sent before it, ``RateLimitedError`` is
+            raised immediately, rather than waiting.
+        """
+        delay = self._reserve(deadline)
+        if delay > 0:
+            log.debug("rate limiter delaying request by %s", delay)
+            time.sleep(delay)
+
+    async def acquire_async(self, deadline: float | None = None) -> None:
+        """
+        Wait until a request may be sent, without blocking the event loop.
+
+        :param deadline: The deadline of the request, as in ``acquire()``
+        """
+        delay = self._reserve(deadline)
+        if delay > 0:
+            log.debug("rate limiter delaying request by %s", delay)
+            await asyncio.sleep(delay)
+
+    def record_response(self, response: requests.Response) -> None:
+        """
+        Update the rate based on a response which was received.
+
+        :param response: The response to a request which passed through the limiter
+        """
+        with self._lock:
+            now = time.monotonic()
+            if response.status_code not in self.throttle_status_codes:
+                self._rate = min(self.max_rate, self._rate + self.additive_increase)
+                return
+
+            retry_after = _parse_retry_after(response)
+            if retry_after is not None:
+                pause = min(retry_after, self.max_pause)
+                self._paused_until = max(self._paused_until, now + pause)
+            if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+                self._last_decrease = now
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            log.debug(
+                "rate limiter saw throttling response (status=%d), rate=%s",
+                response.status_code,
+                self._rate,
+            )
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import hashlib
+
+import requests
+
+
+def authorization_identity(request: requests.PreparedRequest) -> str:
+    """
+    Get a digest of the ``Authorization`` header of a request, which distinguishes
+    requests sent with different credentials without keeping the credentials.
+
+    :param request: The request
+    """
+    header = request.headers.get("Authorization", "")
+    if isinstance(header, str):
+        header = header.encode("utf-8")
+    return hashlib.sha256(header).hexdigest()
@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import abc
+import base64
+import collections
+import email.utils
+import fnmatch
+import hashlib
+import http
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+import time
+import typing as t
+import urllib.parse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ._request_keys import authorization_identity
+
+log = logging.getLogger(__name__)
+
+
+class CacheEntry:
+    """
+    A response stored in a ``ResponseCache``.
+
+    :param status_code: The status code of the response
+    :param headers: The headers of the response
+    :param content: The body of the response
+    :param url: The URL of the response
+    :param expires_at: The time, as a Unix timestamp, after which the response must be
+        revalidated before it is used again
+    """
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: dict[str, str],
+        content: bytes,
+        url: str,
+        expires_at: float,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.expires_at = expires_at
+
+    @property
+    def etag(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get("Last-Modified")
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "content": base64.b64encode(self.content).decode("ascii"),
+            "url": self.url,
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, t.Any]) -> CacheEntry:
+        return cls(
+            status_code=data["status_code"],
+            headers=data["headers"],
+            content=base64.b64decode(data["content"]),
+            url=data["url"],
+            expires_at=data["expires_at"],
+        )
+
+    def to_response(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Build a response from the entry, as though it had been received for a
+        request.
+
+        :param request: The request for which the response is built
+        """
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = http.HTTPStatus(self.status_code).phrase
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = self.url
+        response.request = request
+        response._content = self.content
+        response._content_consumed = True
+        return response
+
+
+class CacheStorage(abc.ABC):
+    """
+    The storage for the entries of a ``ResponseCache``. Entries are stored under
+    string keys which are safe to use as file names.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Get an entry, or ``None`` if there is no entry for the key.
+
+        :param key: The key of the entry
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry, replacing any entry with the same key.
+
+        :param key: The key of the entry
+        :param entry: The entry to store
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry, if there is one.
+
+        :param key: The key of the entry
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+
+
+class MemoryCacheStorage(CacheStorage):
+    """
+    A ``CacheStorage`` which holds entries in memory, discarding the least recently
+    used entry when it is full.
+
+    :param max_entries: The maximum number of entries to hold
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[str, CacheEntry] = (
+            collections.OrderedDict()
+        )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheStorage(CacheStorage):
+    """
+    A ``CacheStorage`` which stores each entry as a JSON file in a directory, so that
+    entries are shared between processes and kept between runs.
+
+    The directory is created if it does not exist. Entries include the bodies of
+    responses, which may contain sensitive data, so the directory should only be
+    readable by its owner.
+
+    :param directory: The directory in which to store entries
+    """
+
+    def __init__(self, directory: str | pathlib.Path) -> None:
+        self.directory = pathlib.Path(directory).expanduser()
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as fp:
+                return CacheEntry.from_dict(json.load(fp))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            log.debug("discarding unreadable cache entry %s", key)
+            self.delete(key)
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        # write to a temporary file and move it into place, so that a concurrent
+        # reader never sees a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(entry.to_dict(), fp)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+
+
+def _parse_cache_control(value: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for directive in (value or "").split(","):
+        name, _, arg = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+class ResponseCache:
+    """
+    A ``ResponseCache`` stores the responses to ``GET`` requests, and serves later
+    requests for the same URL from the cache instead of the network.
+
+    Responses are stored according to their caching headers:
+
+    - a response with ``Cache-Control: no-store`` is never stored
+    - a response with ``Cache-Control: max-age=N`` or an ``Expires`` header is fresh
+      for that long, and is used without contacting the service while it is fresh
+    - a response with ``Cache-Control: no-cache`` is stored, but always revalidated
+      before it is used
+    - a response with no caching headers is fresh for the TTL of its route, taken
+      from ``route_ttls``, or for the ``default_ttl``
+
+    When a stored response which has an ``ETag`` or ``Last-Modified`` header is no
+    longer fresh, the request is sent with ``If-None-Match`` or ``If-Modified-Since``.
+    If the service replies with ``304 Not Modified``, the stored response is used and
+    its freshness is renewed.
+
+    Entries are keyed by URL, including the query string, and by a hash of the
+    ``Authorization`` header of the request, so that callers with different
+    credentials never share responses. A request with any other method to a URL
+    removes the entry for that URL.
+
+    Because the key includes the credentials themselves, entries stored under an
+    access token are not used once that token is refreshed or replaced. They are
+    not removed either: they expire, or are evicted from a ``MemoryCacheStorage``
+    when it is full. Caching suits responses whose TTLs are short compared to the
+    lifetime of the tokens which fetch them.
+
+    A fresh response is taken from the cache before any attempt to send the request
+    is made, so a cache hit does not wait for a rate limiter, is not refused by a
+    circuit breaker, and is not recorded in the metrics of the transport.
+
+    Responses served from the cache are ordinary responses, and are returned from
+    client methods as usual, as ``GlobusHTTPResponse`` objects.
+
+    :param storage: The storage for entries. Defaults to a ``MemoryCacheStorage``
+    :param default_ttl: The time, in seconds, for which a response without caching
+        headers is fresh, if its route has no TTL in ``route_ttls``
+    :param route_ttls: A mapping of URL path patterns, which may contain ``*``
+        wildcards, to the time, in seconds, for which a response without caching
+        headers for a matching path is fresh. The first matching pattern is used
+
+    **Examples**
+
+    Cache endpoint documents for five minutes, and revalidate other responses
+    according to their headers:
+
+    >>> cache = ResponseCache(route_ttls={"/v0.10/endpoint/*": 300})
+    >>> tc = TransferClient(transport_params={"response_cache": cache})
+    """
+
+    def __init__(
+        self,
+        storage: CacheStorage | None = None,
+        *,
+        default_ttl: float = 0,
+        route_ttls: dict[str, float] | None = None,
+    ) -> None:
+        self.storage = storage if storage is not None else MemoryCacheStorage()
+        self.default_ttl = default_ttl
+        self.route_ttls = route_ttls or {}
+
+    def get_key(self, request: requests.PreparedRequest) -> str:
+        """
+        Get the key under which the response to a request is stored.
+
+        :param request: The request
+        """
+        identity = authorization_identity(request)
+        return hashlib.sha256(f"{request.url}\n{identity}".encode()).hexdigest()
+
+    def get_route_ttl(self, url: str) -> float:
+        """
+        Get the TTL for responses without caching headers for a URL.
+
+        :param url: The URL of a response
+        """
+        path = urllib.parse.urlsplit(url).path
+        for pattern, ttl in self.route_ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    def _get_ttl(self, response: requests.Response) -> float | None:
+        # the time for which a response is fresh, or None if it must not be stored
+        directives = _parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0
+        if directives.get("max-age") is not None:
+            try:
+                max_age = float(t.cast(str, directives["max-age"]))
+            except ValueError:
+                return 0
+            return max_age - float(response.headers.get("Age", 0) or 0)
+        if "Expires" in response.headers:
+            try:
+                expires = email.utils.parsedate_to_datetime(response.headers["Expires"])
+            except (TypeError, ValueError):
+                return 0
+            return expires.timestamp() - time.time()
+        return self.get_route_ttl(response.url or "")
+
+    def lookup(self, request: requests.PreparedRequest) -> requests.Response | None:
+        """
+        Get a fresh stored response to a request, if there is one.
+
+        :param request: The request
+        """
+        if request.method != "GET":
+            return None
+        entry = self.storage.get(self.get_key(request))
+        if entry is None or not entry.is_fresh():
+            return None
+        log.debug("response cache hit for %s", request.url)
+        return entry.to_response(request)
+
+    def add_validators(self, request: requests.PreparedRequest) -> None:
+        """
+        If a stored response to a request can be revalidated, add the conditional
+        headers for it to the request.
+
+        :param request: The request, which is modified
+        """
+        if request.method != "GET":
+            return
+        entry = self.storage.get(self.get_key(request))
+        if entry is None:
+            return
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+
+    def update(
+        self, request: requests.PreparedRequest, response: requests.Response
+    ) -> requests.Response:
+        """
+        Update the cache with the response to a request, and get the response which
+        should be used. This is a stored response if the service replied with
+        ``304 Not Modified``.
+
+        :param request: The request
+        :param response: The response received from the service
+        """
+        key = self.get_key(request)
+        if request.method != "GET":
+            self.storage.delete(key)
+            return response
+
+        if response.status_code == 304:
+            entry = self.storage.get(key)
+            if entry is None:
+                return response
+            log.debug("response cache revalidated %s", request.url)
+            entry.headers.update(
+                {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower()
+                    in ("cache-control", "expires", "etag", "last-modified", "date")
+                }
+            )
+            entry.expires_at = time.time() + (self._get_ttl(response) or 0)
+            self.storage.set(key, entry)
+            response.close()
+            return entry.to_response(request)
+
+        if response.status_code != 200:
+            return response
+        ttl = self._get_ttl(response)
+        validated = "ETag" in response.headers or "Last-Modified" in response.headers
+        if ttl is None or (ttl <= 0 and not validated):
+            self.storage.delete(key)
+            return response
+        self.storage.set(
+            key,
+            CacheEntry(
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                content=response.content,
+                url=response.url,
+                expires_at=time.time() + ttl,
+            ),
+        )
+        return response
+
+    def clear(self) -> None:
+        """
+        Remove all stored responses.
+        """
+        self.storage.clear()
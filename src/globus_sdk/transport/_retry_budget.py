@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+
+class RetryBudget:
+    """
+    A ``RetryBudget`` limits retries to a fraction of all requests, so that retries
+    cannot multiply the load on a service which is already failing.
+
+    Over a sliding window of ``window`` seconds, retries are allowed as long as they
+    do not exceed ``ratio`` times the number of requests sent in that window. In
+    addition, ``min_retries`` retries are always allowed within the window, so that
+    clients which send few requests are still able to retry.
+
+    A budget is safe to share between threads, and between transports. Attach it to a
+    transport with the ``retry_budget`` transport parameter. Once the budget is
+    exhausted, requests which would otherwise be retried return their last response
+    or raise their last error.
+
+    :param ratio: The maximum number of retries, as a fraction of requests
+    :param window: The length of the sliding window, in seconds
+    :param min_retries: The number of retries which are always allowed per window
+
+    **Examples**
+
+    Allow retries to be at most 10% of requests over any 10 second window:
+
+    >>> budget = RetryBudget(ratio=0.1, window=10)
+    >>> tc = TransferClient(transport_params={"retry_budget": budget})
+    """
+
+    def __init__(
+        self, *, ratio: float = 0.1, window: float = 10.0, min_retries: int = 10
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+
+        self._lock = threading.Lock()
+        self._requests: collections.deque[float] = collections.deque()
+        self._retries: collections.deque[float] = collections.deque()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        """
+        Record that a new request (not a retry) is being sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """
+        Check whether a retry is within the budget. If it is, record the retry and
+        return ``True``. Otherwise, return ``False``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                log.debug(
+                    "retry budget exhausted (%d retries, %d requests)",
+                    len(self._retries),
+                    len(self._requests),
+                )
+                return False
+            self._retries.append(now)
+            return True
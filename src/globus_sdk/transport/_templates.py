@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import string
+import typing as t
+import urllib.parse
+
+import requests
+
+from globus_sdk import exc
+
+
+def _path_param_names(url: str) -> list[str]:
+    names = []
+    for _, name, format_spec, conversion in string.Formatter().parse(url):
+        if name is None:
+            continue
+        if not name.isidentifier() or format_spec or conversion:
+            raise exc.GlobusSDKUsageError(
+                f"Invalid path parameter '{{{name}}}' in request template URL: {url}"
+            )
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def _is_reusable_body(body: t.Any) -> bool:
+    # bodies which are in memory, or which may be iterated again (like a
+    # StreamingJSONBody), may be sent any number of times; files and iterators may not
+    if body is None or isinstance(body, (bytes, str)):
+        return True
+    if hasattr(body, "read"):
+        return False
+    return iter(body) is not body
+
+
+class _TemplateRequest(requests.Request):
+    """
+    A request built from a ``RequestTemplate``. It is prepared by copying the
+    template's prepared request, rather than by encoding it again.
+    """
+
+    def __init__(self, template: RequestTemplate, url: str) -> None:
+        super().__init__(
+            method=template.method, url=url, headers=dict(template.headers)
+        )
+        self.template = template
+
+    def prepare(self) -> requests.PreparedRequest:
+        prepared = self.template.prepared.copy()
+        prepared.url = t.cast(str, self.url)
+        # the Authorization header is set on each attempt, and may change between
+        # attempts, as credentials are refreshed
+        authz_header = self.headers.get("Authorization")
+        if authz_header is not None:
+            prepared.headers["Authorization"] = authz_header
+        else:
+            prepared.headers.pop("Authorization", None)
+        return prepared
+
+
+class RequestTemplate:
+    """
+    A request which has been encoded and prepared once, so that it can be sent many
+    times cheaply. Templates are made with ``RequestsTransport.compile_request()``
+    and sent with ``RequestsTransport.send_template()``.
+
+    Sending a template skips the encoding of the request body, the merging of
+    headers, and the preparation of the URL, all of which are done when the
+    template is compiled. Only the ``Authorization`` header, which is set for each
+    attempt, and the path parameters of the URL vary between sends.
+
+    Path parameters are written in the URL in ``str.format`` style, e.g.
+    ``https://transfer.api.globus.org/v0.10/task/{task_id}``, and are filled in when
+    the template is sent. Their values are percent-encoded.
+
+    :param method: The HTTP method of the request
+    :param prepared: The prepared request, with placeholders in its URL
+    :param placeholders: A mapping from the names of path parameters to the
+        placeholders which stand in for them in the prepared URL
+    """
+
+    def __init__(
+        self,
+        method: str,
+        prepared: requests.PreparedRequest,
+        placeholders: dict[str, str],
+    ) -> None:
+        self.method = method
+        self.prepared = prepared
+        self.placeholders = placeholders
+        # the URL of the template, with its path parameters shown as fields
+        self.url = t.cast(str, prepared.url)
+        for name, placeholder in placeholders.items():
+            self.url = self.url.replace(placeholder, f"{{{name}}}")
+        # the headers of requests built from the template, to which authorizers add
+        # an Authorization header
+        self.headers: dict[str, str] = {
+            k: t.cast(str, v) for k, v in prepared.headers.items()
+        }
+
+    @property
+    def path_params(self) -> tuple[str, ...]:
+        """The names of the path parameters of the template."""
+        return tuple(self.placeholders)
+
+    @classmethod
+    def from_request(
+        cls, req: requests.Request, path_params: t.Iterable[str]
+    ) -> RequestTemplate:
+        """
+        Make a template from an encoded request whose URL contains ``str.format``
+        style fields for the given path parameters.
+
+        :param req: The encoded request
+        :param path_params: The names of the path parameters in the URL of the request
+        """
+        placeholders = {
+            name: f"globus-sdk-path-param-{i}-" for i, name in enumerate(path_params)
+        }
+        req.url = t.cast(str, req.url).format(**placeholders)
+        prepared = req.prepare()
+        if not _is_reusable_body(prepared.body):
+            raise exc.GlobusSDKUsageError(
+                "A request template cannot be made for a request whose body may only "
+                "be read once, like a file or an iterator."
+            )
+        return cls(t.cast(str, req.method), prepared, placeholders)
+
+    def build(
+        self, path_params: t.Mapping[str, t.Any] | None = None
+    ) -> requests.Request:
+        """
+        Build a request from the template, to send with the retry handling of a
+        transport.
+
+        :param path_params: The values of the path parameters of the template
+        """
+        path_params = path_params or {}
+        if path_params.keys() != self.placeholders.keys():
+            missing = sorted(self.placeholders.keys() - path_params.keys())
+            unknown = sorted(path_params.keys() - self.placeholders.keys())
+            raise exc.GlobusSDKUsageError(
+                "Request template path parameters do not match "
+                f"(missing: {missing}, unknown: {unknown})"
+            )
+        url = t.cast(str, self.prepared.url)
+        for name, placeholder in self.placeholders.items():
+            url = url.replace(
+                placeholder, urllib.parse.quote(str(path_params[name]), safe="")
+            )
+        return _TemplateRequest(self, url)
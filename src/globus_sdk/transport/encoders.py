@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import enum
+import json.encoder
 import typing as t
 import uuid
 
 import requests
 
-from globus_sdk import utils
+from globus_sdk import _json, utils
 
 
 class RequestEncoder:
@@ -103,12 +104,145 @@ class RequestEncoder:
             return self._format_primitive(data)
 
 
+class StreamingJSONBody:
+    """
+    A JSON request body which is serialized while it is being sent, in a single pass
+    over the data. ``MISSING`` values are omitted and primitives are formatted (as in
+    ``RequestEncoder._prepare_data``) as the data is serialized, so no copy of the data
+    is made, and the whole document is never held in memory.
+
+    Each iteration serializes the data from the start, so the body can be sent again
+    when a request is retried.
+
+    The output is identical to the output of the standard library ``json`` module.
+
+    :param encoder: The encoder whose ``_format_primitive`` is used on each value
+    :param data: The data to serialize
+    :param chunk_size: The approximate size, in bytes, of each chunk of the body
+    """
+
+    def __init__(
+        self, encoder: RequestEncoder, data: t.Any, *, chunk_size: int = 65536
+    ) -> None:
+        self.encoder = encoder
+        self.data = data
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        buffer: list[str] = []
+        size = 0
+        for piece in self._iter_value(self.data):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield "".join(buffer).encode("utf-8")
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer).encode("utf-8")
+
+    def _iter_value(self, value: t.Any) -> t.Iterator[str]:
+        if isinstance(value, (dict, utils.PayloadWrapper)):
+            yield from self._iter_object(value)
+        elif isinstance(value, (list, tuple)):
+            yield from self._iter_array(value)
+        else:
+            yield self._encode_primitive(self.encoder._format_primitive(value))
+
+    # containers collect the encodings of their primitive members, and only yield
+    # when they finish or reach a nested container, to keep the number of yields low
+
+    def _iter_object(self, value: t.Mapping[t.Any, t.Any]) -> t.Iterator[str]:
+        parts = ["{"]
+        separator = ""
+        for key, item in value.items():
+            if item is utils.MISSING:
+                continue
+            parts.append(separator)
+            parts.append(self._encode_key(key))
+            parts.append(": ")
+            separator = ", "
+            if isinstance(item, (dict, utils.PayloadWrapper, list, tuple)):
+                yield "".join(parts)
+                parts = []
+                yield from self._iter_value(item)
+            else:
+                parts.append(
+                    self._encode_primitive(self.encoder._format_primitive(item))
+                )
+        parts.append("}")
+        yield "".join(parts)
+
+    def _iter_array(self, value: t.Sequence[t.Any]) -> t.Iterator[str]:
+        parts = ["["]
+        separator = ""
+        for item in value:
+            if item is utils.MISSING:
+                continue
+            parts.append(separator)
+            separator = ", "
+            if isinstance(item, (dict, utils.PayloadWrapper, list, tuple)):
+                yield "".join(parts)
+                parts = []
+                yield from self._iter_value(item)
+            else:
+                parts.append(
+                    self._encode_primitive(self.encoder._format_primitive(item))
+                )
+        parts.append("]")
+        yield "".join(parts)
+
+    def _encode_key(self, key: t.Any) -> str:
+        # keys are converted to strings, following the rules of the stdlib encoder
+        if isinstance(key, str):
+            return json.encoder.encode_basestring_ascii(key)
+        if key is True or key is False or key is None or isinstance(key, (int, float)):
+            return '"' + self._encode_primitive(key) + '"'
+        raise TypeError(
+            f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+        )
+
+    def _encode_primitive(self, value: t.Any) -> str:
+        if isinstance(value, str):
+            return json.encoder.encode_basestring_ascii(value)
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            if value != value or value in (float("inf"), float("-inf")):
+                raise ValueError(
+                    f"Out of range float values are not JSON compliant: {value!r}"
+                )
+            return float.__repr__(value)
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+
+
 class JSONRequestEncoder(RequestEncoder):
     """
     This encoder prepares the data as JSON. It also ensures that content-type is set, so
     that APIs requiring a content-type of "application/json" are able to read the data.
+
+    Data is serialized with the JSON backend configured by
+    ``GLOBUS_SDK_JSON_BACKEND``.
+
+    With ``stream=True``, the body is a ``StreamingJSONBody``, which is serialized in
+    a single pass while the request is sent, using chunked transfer encoding. This
+    greatly reduces memory use for very large documents, such as a ``TransferData``
+    with many items, at the cost of some CPU time.
+
+    :param stream: Whether to stream the request body
     """
 
+    def __init__(self, *, stream: bool = False) -> None:
+        self.stream = stream
+
     def encode(
         self,
         method: str,
@@ -117,12 +251,29 @@ class JSONRequestEncoder(RequestEncoder):
         data: t.Any,
         headers: dict[str, str],
     ) -> requests.Request:
+        if self.stream and data is not None:
+            return requests.Request(
+                method,
+                url,
+                data=StreamingJSONBody(self, data),
+                params=self._prepare_params(params),
+                headers=self._prepare_headers(
+                    {"Content-Type": "application/json", **headers}
+                ),
+            )
+
+        prepared = self._prepare_data(data)
+        body = None
         if data is not None:
             headers = {"Content-Type": "application/json", **headers}
+            body = _json.dumps(prepared)
+        # the prepared data is kept as `json` on the request for introspection, but
+        # the encoded `data` takes precedence when the request is prepared for sending
         return requests.Request(
             method,
             url,
-            json=self._prepare_data(data),
+            data=body,
+            json=prepared,
             params=self._prepare_params(params),
             headers=self._prepare_headers(headers),
         )
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import contextlib
+import functools
 import logging
 import pathlib
 import random
+import threading
 import time
 import typing as t
 
 import requests
 
-from globus_sdk import config, exc, utils
+from globus_sdk import _tracing, config, exc, utils
 from globus_sdk.authorizers import GlobusAuthorizer
 from globus_sdk.transport.encoders import (
     FormRequestEncoder,
@@ -18,27 +22,66 @@ from globus_sdk.transport.encoders import (
 )
 from globus_sdk.version import __version__
 
+from ._circuit_breaker import CircuitBreaker
 from ._clientinfo import GlobusClientInfo
+from ._coalescing import RequestCoalescer
+from ._compression import compress_request_body
+from ._connection_pools import ConnectionPoolRegistry
+from ._hedging import HedgingPolicy
+from ._metrics import (
+    AttemptMetrics,
+    TransportMetrics,
+    _body_size,
+    _host,
+    _response_size,
+)
+from ._rate_limiter import AdaptiveRateLimiter
+from ._response_cache import ResponseCache
+from ._retry_budget import RetryBudget
+from ._templates import RequestTemplate, _path_param_names
 from .retry import (
     RetryCheck,
     RetryCheckFlags,
     RetryCheckResult,
     RetryCheckRunner,
     RetryContext,
+    _parse_retry_after,
     set_retry_check_flags,
 )
 
 log = logging.getLogger(__name__)
 
 
-def _parse_retry_after(response: requests.Response) -> int | None:
-    val = response.headers.get("Retry-After")
-    if not val:
-        return None
-    try:
-        return int(val)
-    except ValueError:
-        return None
+def _close_response(future: concurrent.futures.Future[requests.Response]) -> None:
+    # release the connection of a response which lost a hedging race
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class _AttemptTiming:
+    # the timing of a single attempt to send a request, and why the request was not
+    # retried after it, if a retry was requested, for metrics
+    def __init__(self) -> None:
+        self.start = time.monotonic()
+        self.start_time_ns = time.time_ns()
+        self.end: float | None = None
+        self.sleep: float | None = None
+        self.stop_reason: str | None = None
+
+    def finish(self) -> None:
+        self.end = time.monotonic()
+
+    @property
+    def total_time(self) -> float:
+        return (self.end if self.end is not None else time.monotonic()) - self.start
+
+
+# the steps of the retry loop which block, and so are run differently by the
+# synchronous and asynchronous request paths
+_ACQUIRE = "acquire"
+_SEND = "send"
+_SLEEP = "sleep"
+_RetryStep = t.Tuple[str, t.Any]
 
 
 def _exponential_backoff(ctx: RetryContext) -> float:
@@ -66,6 +109,10 @@ class RequestsTransport:
     If the maximum number of retries is reached, the final response or exception will
     be returned or raised.
 
+    Requests are sent with ``request()``, or, from within an ``asyncio`` event loop,
+    with ``request_async()``. Both methods share the same encoders, retry checks, and
+    authorization handling.
+
     :param verify_ssl: Explicitly enable or disable SSL verification,
         or configure the path to a CA certificate bundle to use for SSL verification
     :param http_timeout: Explicitly set an HTTP timeout value in seconds. This parameter
@@ -81,6 +128,51 @@ class RequestsTransport:
         computed sleep time or the backoff requested by a retry check exceeds this
         value, this amount of time will be used instead
     :param max_retries: The maximum number of retries allowed by this transport
+    :param connection_pools: A ``ConnectionPoolRegistry`` from which to get sessions
+        for sending requests. Transports which share a registry share their
+        connections. By default, the transport uses its own session.
+    :param rate_limiter: An ``AdaptiveRateLimiter`` which paces every attempt to send
+        a request. A limiter may be shared between transports, in which case it paces
+        the requests of all of them. A request which the limiter would delay past its
+        deadline fails fast with ``RateLimitedError``.
+    :param circuit_breaker: A ``CircuitBreaker`` which tracks the failure rate of
+        requests to each host, and fails fast with ``CircuitOpenError`` when that rate
+        is too high. It is registered as a retry check, ahead of all other checks.
+    :param retry_budget: A ``RetryBudget`` which limits retries to a fraction of all
+        requests. A budget may be shared between transports.
+    :param request_deadline: The maximum total time, in seconds, that a request may
+        take, including all retries and the sleeps between them. Timeouts for
+        individual attempts are reduced to fit within the deadline, and no retry is
+        started once the deadline has passed. By default, there is no deadline.
+    :param hedging: A ``HedgingPolicy`` which enables hedged requests. When an attempt
+        is slow, a second copy of the request is sent, and the first response to
+        arrive is used.
+    :param stream_json_bodies: Serialize JSON request bodies while they are sent,
+        in a single pass and with chunked transfer encoding, rather than building
+        the whole body in memory first. This is useful for very large payloads, like
+        a ``TransferData`` with many items.
+    :param request_compression_threshold: Gzip request bodies of at least this many
+        bytes, and send them with ``Content-Encoding: gzip``. Streamed bodies are
+        compressed as they are sent. By default, bodies are not compressed.
+    :param request_compression_level: The gzip compression level, from 1 (fastest) to 9
+        (smallest), used for compressed request bodies
+    :param response_cache: A ``ResponseCache`` which stores responses to ``GET``
+        requests, and serves repeated requests from the cache, revalidating stored
+        responses with conditional requests. Streamed responses are never cached
+    :param request_coalescer: A ``RequestCoalescer`` which merges identical ``GET``
+        requests that are in flight at the same time into a single request, whose
+        response is shared by all callers. A coalescer may be shared between
+        transports.
+    :param metrics: A ``TransportMetrics`` object in which to record measurements of
+        every attempt to send a request. By default, the transport creates its own.
+        It is available as the ``metrics`` attribute of the transport.
+    :param async_executor: The executor on which ``request_async()`` sends each
+        attempt. By default, the transport creates a thread pool of
+        ``async_max_workers`` threads when it is first needed. An executor which is
+        passed in is not shut down when the transport is closed.
+    :param async_max_workers: The number of threads in the thread pool which the
+        transport creates for ``request_async()``. This bounds the number of attempts
+        which are in flight at once.
 
     :ivar dict[str, str] headers: The headers which are sent on every request. These
         may be augmented by the transport when sending requests.
@@ -113,8 +205,39 @@ class RequestsTransport:
         retry_checks: list[RetryCheck] | None = None,
         max_sleep: float | int = 10,
         max_retries: int | None = None,
+        connection_pools: ConnectionPoolRegistry | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        request_deadline: float | None = None,
+        hedging: HedgingPolicy | None = None,
+        stream_json_bodies: bool = False,
+        request_compression_threshold: int | None = None,
+        request_compression_level: int = 6,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        metrics: TransportMetrics | None = None,
+        async_executor: concurrent.futures.Executor | None = None,
+        async_max_workers: int = 64,
     ) -> None:
-        self.session = requests.Session()
+        self._session: requests.Session | None = None
+        self._async_executor = async_executor
+        self._owns_async_executor = async_executor is None
+        self._async_executor_lock = threading.Lock()
+        self.async_max_workers = async_max_workers
+        self.connection_pools = connection_pools
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.request_deadline = request_deadline
+        self.hedging = hedging
+        if stream_json_bodies:
+            self.encoders = {**self.encoders, "json": JSONRequestEncoder(stream=True)}
+        self.request_compression_threshold = request_compression_threshold
+        self.request_compression_level = request_compression_level
+        self.response_cache = response_cache
+        self.request_coalescer = request_coalescer
+        self.metrics = metrics if metrics is not None else TransportMetrics()
         self.verify_ssl = config.get_ssl_verify(verify_ssl)
         self.http_timeout = config.get_http_timeout(http_timeout)
         self._user_agent = self.BASE_USER_AGENT
@@ -134,6 +257,9 @@ class RequestsTransport:
             max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
         )
         self.retry_checks = list(retry_checks if retry_checks else [])  # copy
+        # the circuit breaker must see the outcome of every attempt, so it runs first
+        if circuit_breaker is not None:
+            self.retry_checks.insert(0, circuit_breaker)
         # register internal checks
         self.register_default_retry_checks()
 
@@ -141,8 +267,102 @@ class RequestsTransport:
         """
         Closes all resources owned by the transport, primarily the underlying
         network session.
+
+        Sessions from a ``ConnectionPoolRegistry`` are owned by the registry, and are
+        not closed.
+        """
+        if self._session is not None:
+            self._session.close()
+        with self._async_executor_lock:
+            if self._owns_async_executor and self._async_executor is not None:
+                self._async_executor.shutdown(wait=False)
+                self._async_executor = None
+
+    # customize pickling methods to ensure that the object is pickle-safe
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # when pickling, drop the lock, and any thread pool which the transport owns
+        d = dict(self.__dict__)  # copy
+        del d["_async_executor_lock"]
+        if self._owns_async_executor:
+            d["_async_executor"] = None
+        return d
+
+    def __setstate__(self, d: dict[str, t.Any]) -> None:
+        self.__dict__.update(d)
+        self._async_executor_lock = threading.Lock()
+
+    @property
+    def async_executor(self) -> concurrent.futures.Executor:
         """
-        self.session.close()
+        The executor on which ``request_async()`` sends each attempt, and on which
+        paginators fetch pages asynchronously. Unless one was passed to the transport,
+        it is a thread pool which is created when it is first used.
+        """
+        with self._async_executor_lock:
+            if self._async_executor is None:
+                self._async_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.async_max_workers,
+                    thread_name_prefix="globus-sdk-async",
+                )
+            return self._async_executor
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The network session of the transport. It is created when it is first used,
+        so that a transport which gets its sessions from a ``ConnectionPoolRegistry``
+        does not create one.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self._session = value
+
+    @session.deleter
+    def session(self) -> None:
+        self._session = None
+
+    def warm_up(self, urls: t.Iterable[str], *, connections: int = 1) -> None:
+        """
+        Open connections to the hosts of the given URLs ahead of time, so that later
+        requests reuse them instead of waiting for DNS lookups, TCP connections, and
+        TLS handshakes.
+
+        A ``HEAD`` request is sent to each URL, on the session which will send later
+        requests to it, and its connection is then kept alive in the session's
+        connection pool for as long as the server allows. All connections are opened
+        concurrently. Warming up is best-effort: errors are logged and ignored, and no
+        retries are made.
+
+        :param urls: The URLs to which connections should be opened
+        :param connections: The number of connections to open to each URL. At most
+            the pool size of the session (10 by default) are kept.
+        """
+        targets = [url for url in dict.fromkeys(urls) for _ in range(connections)]
+        if not targets:
+            return
+
+        def open_connection(url: str) -> None:
+            try:
+                self._get_session(url).head(
+                    url,
+                    headers=self.headers,
+                    timeout=self.http_timeout,
+                    verify=self.verify_ssl,
+                    allow_redirects=False,
+                )
+            except requests.RequestException as err:
+                log.debug("warm up of %s failed: %r", url, err)
+
+        log.debug("warming up %d connections", len(targets))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(targets), 32), thread_name_prefix="globus-sdk-warm-up"
+        ) as executor:
+            list(executor.map(open_connection, targets))
 
     @property
     def user_agent(self) -> str:
@@ -184,6 +404,7 @@ class RequestsTransport:
         retry_backoff: t.Callable[[RetryContext], float] | None = None,
         max_sleep: float | int | None = None,
         max_retries: int | None = None,
+        request_deadline: float | None = None,
     ) -> t.Iterator[None]:
         """
         Temporarily adjust some of the request sending settings of the transport.
@@ -202,6 +423,8 @@ class RequestsTransport:
             computed sleep time or the backoff requested by a retry check exceeds this
             value, this amount of time will be used instead
         :param max_retries: The maximum number of retries allowed by this transport
+        :param request_deadline: The maximum total time, in seconds, that a request may
+            take, including all retries
 
         **Examples**
 
@@ -219,6 +442,12 @@ class RequestsTransport:
         >>> client = ...  # any client class
         >>> with client.transport.tune(max_retries=0):
         >>>     foo = client.get_foo()
+
+        or to give up on a call, including its retries, after 30 seconds:
+
+        >>> client = ...  # any client class
+        >>> with client.transport.tune(request_deadline=30):
+        >>>     foo = client.get_foo()
         """
         saved_settings = (
             self.verify_ssl,
@@ -226,6 +455,7 @@ class RequestsTransport:
             self.retry_backoff,
             self.max_sleep,
             self.max_retries,
+            self.request_deadline,
         )
         if verify_ssl is not None:
             if isinstance(verify_ssl, bool):
@@ -240,6 +470,8 @@ class RequestsTransport:
             self.max_sleep = max_sleep
         if max_retries is not None:
             self.max_retries = max_retries
+        if request_deadline is not None:
+            self.request_deadline = request_deadline
         yield
         (
             self.verify_ssl,
@@ -247,6 +479,7 @@ class RequestsTransport:
             self.retry_backoff,
             self.max_sleep,
             self.max_retries,
+            self.request_deadline,
         ) = saved_settings
 
     def _encode(
@@ -288,18 +521,426 @@ class RequestsTransport:
             else:
                 req.headers.pop("Authorization", None)  # remove any possible value
 
-    def _retry_sleep(self, ctx: RetryContext) -> None:
+    def _compute_retry_sleep(self, ctx: RetryContext) -> float:
         """
-        Given a retry context, compute the amount of time to sleep and sleep that much
-        This is always the minimum of the backoff (run on the context) and the
-        ``max_sleep``.
+        Given a retry context, compute the amount of time to sleep before the next
+        attempt. This is always the minimum of the backoff (run on the context) and the
+        ``max_sleep``, and never extends past the deadline of the request.
 
         :param ctx: The context object which describes the state of the request and the
             retries which may already have been attempted.
         """
         sleep_period = min(self.retry_backoff(ctx), self.max_sleep)
+        if ctx.deadline is not None:
+            sleep_period = max(0.0, min(sleep_period, ctx.deadline - time.monotonic()))
         log.debug("request retry_sleep(%s) [max=%s]", sleep_period, self.max_sleep)
+        return sleep_period
+
+    def _retry_sleep(self, ctx: RetryContext) -> float:
+        """
+        Given a retry context, compute the amount of time to sleep and sleep that much
+        This is always the minimum of the backoff (run on the context) and the
+        ``max_sleep``. The amount of time slept is returned.
+
+        :param ctx: The context object which describes the state of the request and the
+            retries which may already have been attempted.
+        """
+        sleep_period = self._compute_retry_sleep(ctx)
         time.sleep(sleep_period)
+        return sleep_period
+
+    async def _retry_sleep_async(self, ctx: RetryContext) -> float:
+        """
+        The asynchronous variant of ``_retry_sleep``, which yields control to the
+        event loop instead of blocking the calling thread.
+
+        :param ctx: The context object which describes the state of the request and the
+            retries which may already have been attempted.
+        """
+        sleep_period = self._compute_retry_sleep(ctx)
+        await asyncio.sleep(sleep_period)
+        return sleep_period
+
+    def _get_session(self, url: str) -> requests.Session:
+        """
+        Get the session which will send a request to the given URL.
+
+        :param url: The URL to which a request will be sent
+        """
+        if self.connection_pools is not None:
+            return self.connection_pools.get_session(url)
+        return self.session
+
+    def _send(
+        self,
+        req: requests.Request,
+        *,
+        allow_redirects: bool,
+        stream: bool,
+        deadline: float | None = None,
+    ) -> requests.Response:
+        """
+        Prepare and send a single attempt of a request.
+
+        :param req: The request to send
+        :param allow_redirects: Follow Location headers on redirect response
+            automatically
+        :param stream: Do not immediately download the response content
+        :param deadline: The deadline of the request, to which the timeout of this
+            attempt is reduced
+        """
+        timeout = self.http_timeout
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0.001)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        url = t.cast(str, req.url)
+        method = t.cast(str, req.method)
+        prepared = req.prepare()
+        if self.request_compression_threshold is not None:
+            compress_request_body(
+                prepared,
+                threshold=self.request_compression_threshold,
+                level=self.request_compression_level,
+            )
+        send = functools.partial(
+            self._get_session(url).send,
+            prepared,
+            timeout=timeout,
+            verify=self.verify_ssl,
+            allow_redirects=allow_redirects,
+            stream=stream,
+        )
+        # fresh responses are served before any attempt is made, in
+        # _check_shared_response, so an attempt may only revalidate a stored response
+        cache = self.response_cache if not stream else None
+        if cache is not None:
+            cache.add_validators(prepared)
+
+        if self.hedging is not None and self.hedging.applies_to(method):
+            response = self._send_hedged(self.hedging, send, deadline)
+        else:
+            response = send()
+        if cache is not None:
+            response = cache.update(prepared, response)
+        return response
+
+    def _send_hedged(
+        self,
+        policy: HedgingPolicy,
+        send: t.Callable[[], requests.Response],
+        deadline: float | None,
+    ) -> requests.Response:
+        """
+        Send a single attempt of a request under a hedging policy.
+
+        The attempt is sent in a worker thread. If it has not completed within the
+        hedging delay, a second copy is sent, and the first successful response is
+        returned. If both copies fail, the error from the first copy is raised.
+
+        :param policy: The hedging policy in use
+        :param send: A callable which sends a copy of the request
+        :param deadline: The deadline of the request, past which no hedge is sent
+        """
+        delay = policy.get_delay()
+        if delay is None:
+            return self._timed_send(policy, send)
+
+        executor = policy.get_executor()
+        primary = executor.submit(self._timed_send, policy, send)
+        try:
+            return primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        if self.retry_budget is not None and not self.retry_budget.try_acquire_retry():
+            return primary.result()
+
+        log.debug("request is slow, sending hedge after %s", delay)
+        hedge = executor.submit(
+            self._timed_send, policy, send, pace=True, deadline=deadline
+        )
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            winners = [future for future in done if future.exception() is None]
+            if winners:
+                for future in pending:
+                    future.add_done_callback(_close_response)
+                for future in winners[1:]:
+                    future.result().close()
+                log.debug(
+                    "hedged request won by %s",
+                    "hedge" if winners[0] is hedge else "primary",
+                )
+                return winners[0].result()
+        return primary.result()
+
+    def _timed_send(
+        self,
+        policy: HedgingPolicy,
+        send: t.Callable[[], requests.Response],
+        *,
+        pace: bool = False,
+        deadline: float | None = None,
+    ) -> requests.Response:
+        # a hedge is paced by the rate limiter like any other request
+        # (the primary copy was already paced by the request loop)
+        if pace and self.rate_limiter is not None:
+            self.rate_limiter.acquire(deadline)
+        start = time.monotonic()
+        response = send()
+        policy.record_latency(time.monotonic() - start)
+        return response
+
+    def _before_attempt(self, req: requests.Request) -> None:
+        """
+        Run any checks which must pass before an attempt to send a request.
+
+        :param req: The request which will be sent
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(t.cast(str, req.url))
+
+    def _after_attempt(self, req: requests.Request, ctx: RetryContext) -> None:
+        """
+        Report the outcome of an attempt to any components which track outcomes.
+        This runs before the retry checks for the attempt.
+
+        :param req: The request which was sent
+        :param ctx: The context describing the outcome of the attempt
+        """
+        if self.rate_limiter is not None and ctx.response is not None:
+            self.rate_limiter.record_response(ctx.response)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(t.cast(str, req.url), ctx)
+
+    def _record_attempt(
+        self,
+        req: requests.Request,
+        ctx: RetryContext,
+        checker: RetryCheckRunner,
+        timing: _AttemptTiming,
+        *,
+        stream: bool,
+    ) -> None:
+        """
+        Record the measurements of an attempt in the transport's metrics, and as a
+        tracing span.
+
+        :param req: The request which was sent
+        :param ctx: The context describing the outcome of the attempt
+        :param checker: The retry check runner of the request
+        :param timing: The timing of the attempt
+        :param stream: Whether the response is streamed
+        """
+        response = ctx.response
+        prepared: requests.PreparedRequest | None = (
+            response.request
+            if response is not None
+            else getattr(ctx.exception, "request", None)
+        )
+        # the checks may not run for every attempt, so consume the decision once read
+        retry_check, checker.last_retry_check = checker.last_retry_check, None
+        # a retry reason is only recorded for an attempt which was actually retried
+        if timing.sleep is None or timing.stop_reason is not None:
+            retry_check = None
+        attempt = AttemptMetrics(
+            method=str(req.method),
+            url=str(getattr(prepared, "url", None) or req.url),
+            host=_host(str(req.url)),
+            attempt=ctx.attempt,
+            status=response.status_code if response is not None else None,
+            error=(type(ctx.exception).__name__ if ctx.exception is not None else None),
+            time_to_first_byte=(
+                response.elapsed.total_seconds() if response is not None else None
+            ),
+            total_time=timing.total_time,
+            request_bytes=_body_size(getattr(prepared, "body", None)),
+            response_bytes=(
+                _response_size(response, stream) if response is not None else None
+            ),
+            retry_reason=(
+                getattr(retry_check, "__name__", type(retry_check).__name__)
+                if retry_check is not None
+                else None
+            ),
+            sleep=timing.sleep,
+            stop_reason=timing.stop_reason,
+        )
+        self.metrics.record_attempt(attempt)
+        _tracing.record_attempt(attempt, timing.start_time_ns)
+
+    def _start_request(self) -> float | None:
+        """
+        Record the start of a new request, and compute its deadline.
+        """
+        self.metrics.record_request()
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        if self.request_deadline is None:
+            return None
+        return time.monotonic() + self.request_deadline
+
+    def _retry_stop_reason(self, ctx: RetryContext) -> str | None:
+        """
+        Check limits which apply after the retry checks have decided that a request
+        should be retried: the deadline of the request, and the retry budget.
+        Return the reason why the request may not be retried, or ``None`` if it may.
+
+        :param ctx: The context object which describes the state of the request and the
+            retries which may already have been attempted.
+        """
+        if ctx.deadline is not None:
+            remaining = ctx.deadline - time.monotonic()
+            # an explicit backoff, e.g. from a Retry-After header, which would reach
+            # the deadline means that no retry can be sent in time
+            if remaining <= 0 or (
+                ctx.backoff is not None
+                and min(ctx.backoff, self.max_sleep) >= remaining
+            ):
+                log.debug("request deadline does not allow a retry")
+                return "deadline"
+        if self.retry_budget is not None and not self.retry_budget.try_acquire_retry():
+            return "retry_budget"
+        return None
+
+    def _stop_retrying(self, ctx: RetryContext) -> requests.Response:
+        """
+        End a request which would be retried, but is not allowed to retry, by returning
+        its last response or raising its last error.
+
+        :param ctx: The context object which describes the last attempt
+        """
+        if isinstance(ctx.exception, requests.RequestException):
+            log.warning("request retries stopped, done (fail, error)")
+            raise exc.convert_request_exception(ctx.exception)
+        if ctx.response is None:
+            raise ValueError("Somehow, retries ended without a response")
+        log.warning("request retries stopped, done (fail, response)")
+        return ctx.response
+
+    def _authorize_and_send(
+        self,
+        authorizer: GlobusAuthorizer | None,
+        req: requests.Request,
+        *,
+        allow_redirects: bool,
+        stream: bool,
+        deadline: float | None,
+    ) -> requests.Response:
+        # add Authorization header, or (if it's a NullAuthorizer) possibly
+        # explicitly remove the Authorization header
+        # done fresh for each attempt, to handle potential for refreshed credentials
+        # getting the header may refresh tokens, so the async request path runs it
+        # alongside the send, off of the event loop
+        self._set_authz_header(authorizer, req)
+        return self._send(
+            req, allow_redirects=allow_redirects, stream=stream, deadline=deadline
+        )
+
+    def _check_shared_response(
+        self,
+        req: requests.Request,
+        authorizer: GlobusAuthorizer | None,
+        *,
+        stream: bool,
+    ) -> tuple[requests.Response | None, tuple[str, str, str] | None]:
+        """
+        Check whether a request may use a response shared with other requests: a
+        fresh response from the response cache, or the response of an identical
+        request which is in flight. Return the cached response, if there is one, and
+        the key under which the request may be coalesced, if it may be.
+
+        This is checked once, before the retry loop, so that a request which uses a
+        shared response is not paced by the rate limiter, gated by the circuit
+        breaker, or counted as an attempt.
+        """
+        method = str(req.method).upper()
+        cache = self.response_cache if method == "GET" else None
+        coalescer = self.request_coalescer
+        if coalescer is not None and not coalescer.applies_to(method):
+            coalescer = None
+        if stream or (cache is None and coalescer is None):
+            return None, None
+        # both are keyed by the credentials which the request will be sent with
+        self._set_authz_header(authorizer, req)
+        prepared = req.prepare()
+        if cache is not None:
+            cached = cache.lookup(prepared)
+            if cached is not None:
+                return cached, None
+        return None, (coalescer.get_key(prepared) if coalescer is not None else None)
+
+    def _retry_steps(
+        self,
+        req: requests.Request,
+        authorizer: GlobusAuthorizer | None,
+        *,
+        stream: bool,
+    ) -> t.Generator[_RetryStep, t.Any, requests.Response]:
+        """
+        The retry loop of a request, which is shared by the synchronous and
+        asynchronous request paths.
+
+        The steps which block -- waiting for the rate limiter, sending an attempt, and
+        sleeping before a retry -- are yielded to the caller, which runs them and
+        sends back their results, or throws in their errors. The loop returns the
+        final response.
+        """
+        resp: requests.Response | None = None
+        checker = RetryCheckRunner(self.retry_checks)
+        deadline = self._start_request()
+        log.debug("transport request state initialized")
+        for attempt in range(self.max_retries + 1):
+            log.debug("transport request retry cycle. attempt=%d", attempt)
+            ctx = RetryContext(attempt, authorizer=authorizer, deadline=deadline)
+            # the rate limiter may refuse a request which it would delay past the
+            # deadline, so it is checked before a circuit breaker probe is taken
+            if self.rate_limiter is not None:
+                yield _ACQUIRE, deadline
+            self._before_attempt(req)
+            timing = _AttemptTiming()
+            try:
+                try:
+                    log.debug("request about to send")
+                    resp = ctx.response = yield _SEND, deadline
+                except requests.RequestException as err:
+                    timing.finish()
+                    log.debug("request hit error (RequestException)")
+                    ctx.exception = err
+                    self._after_attempt(req, ctx)
+                    if attempt >= self.max_retries or not checker.should_retry(ctx):
+                        log.warning("request done (fail, error)")
+                        raise exc.convert_request_exception(err)
+                    log.debug("request may retry (should-retry=true)")
+                else:
+                    timing.finish()
+                    self._after_attempt(req, ctx)
+                    log.debug("request success, still check should-retry")
+                    if not checker.should_retry(ctx):
+                        log.debug("request done (success)")
+                        return resp
+                    log.debug("request may retry, will check attempts")
+
+                # the request will be retried, so sleep...
+                if attempt < self.max_retries:
+                    timing.stop_reason = self._retry_stop_reason(ctx)
+                    if timing.stop_reason is not None:
+                        return self._stop_retrying(ctx)
+                    log.debug("under attempt limit, will sleep")
+                    timing.sleep = yield _SLEEP, ctx
+                    if deadline is not None and time.monotonic() >= deadline:
+                        timing.stop_reason = "deadline"
+                        return self._stop_retrying(ctx)
+                else:
+                    timing.stop_reason = "max_retries"
+            finally:
+                self._record_attempt(req, ctx, checker, timing, stream=stream)
+        if resp is None:
+            raise ValueError("Somehow, retries ended without a response")
+        log.warning("request reached max retries, done (fail, response)")
+        return resp
 
     def request(
         self,
@@ -337,49 +978,285 @@ class RequestsTransport:
         :return: ``requests.Response`` object
         """
         log.debug("starting request for %s", url)
-        resp: requests.Response | None = None
         req = self._encode(method, url, query_params, data, headers, encoding)
-        checker = RetryCheckRunner(self.retry_checks)
-        log.debug("transport request state initialized")
-        for attempt in range(self.max_retries + 1):
-            log.debug("transport request retry cycle. attempt=%d", attempt)
-            # add Authorization header, or (if it's a NullAuthorizer) possibly
-            # explicitly remove the Authorization header
-            # done fresh for each request, to handle potential for refreshed credentials
-            self._set_authz_header(authorizer, req)
+        return self._send_with_retries(
+            req, authorizer, allow_redirects=allow_redirects, stream=stream
+        )
 
-            ctx = RetryContext(attempt, authorizer=authorizer)
+    def _send_with_retries(
+        self,
+        req: requests.Request,
+        authorizer: GlobusAuthorizer | None,
+        *,
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Send an encoded request, retrying it for as long as the retry checks and the
+        limits of the transport allow, unless it can use a shared response.
+        """
+        cached, coalescing_key = self._check_shared_response(
+            req, authorizer, stream=stream
+        )
+        if cached is not None:
+            return cached
+        send = functools.partial(
+            self._run_retry_steps,
+            req,
+            authorizer,
+            allow_redirects=allow_redirects,
+            stream=stream,
+        )
+        if coalescing_key is not None:
+            coalescer = t.cast(RequestCoalescer, self.request_coalescer)
+            return coalescer.run(coalescing_key, send)
+        return send()
+
+    def _run_retry_steps(
+        self,
+        req: requests.Request,
+        authorizer: GlobusAuthorizer | None,
+        *,
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Run the steps of the retry loop of a request in the calling thread.
+        """
+        steps = self._retry_steps(req, authorizer, stream=stream)
+        result: t.Any = None
+        error: BaseException | None = None
+        while True:
             try:
-                log.debug("request about to send")
-                resp = ctx.response = self.session.send(
-                    req.prepare(),
-                    timeout=self.http_timeout,
-                    verify=self.verify_ssl,
-                    allow_redirects=allow_redirects,
-                    stream=stream,
+                kind, arg = (
+                    steps.throw(error) if error is not None else steps.send(result)
                 )
-            except requests.RequestException as err:
-                log.debug("request hit error (RequestException)")
-                ctx.exception = err
-                if attempt >= self.max_retries or not checker.should_retry(ctx):
-                    log.warning("request done (fail, error)")
-                    raise exc.convert_request_exception(err)
-                log.debug("request may retry (should-retry=true)")
-            else:
-                log.debug("request success, still check should-retry")
-                if not checker.should_retry(ctx):
-                    log.debug("request done (success)")
-                    return resp
-                log.debug("request may retry, will check attempts")
-
-            # the request will be retried, so sleep...
-            if attempt < self.max_retries:
-                log.debug("under attempt limit, will sleep")
-                self._retry_sleep(ctx)
-        if resp is None:
-            raise ValueError("Somehow, retries ended without a response")
-        log.warning("request reached max retries, done (fail, response)")
-        return resp
+            except StopIteration as stop:
+                return t.cast(requests.Response, stop.value)
+            result, error = None, None
+            try:
+                if kind == _ACQUIRE:
+                    t.cast(AdaptiveRateLimiter, self.rate_limiter).acquire(arg)
+                elif kind == _SEND:
+                    result = self._authorize_and_send(
+                        authorizer,
+                        req,
+                        allow_redirects=allow_redirects,
+                        stream=stream,
+                        deadline=arg,
+                    )
+                else:
+                    result = self._retry_sleep(arg)
+            except BaseException as err:
+                error = err
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        query_params: dict[str, t.Any] | None = None,
+        data: (
+            dict[str, t.Any] | list[t.Any] | utils.PayloadWrapper | str | bytes | None
+        ) = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+        authorizer: GlobusAuthorizer | None = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send an HTTP request from within a running ``asyncio`` event loop.
+
+        This has the same behaviors as ``request()`` -- the same encoders, retry checks,
+        and authorizer handling are used -- but never blocks the event loop.
+        Each attempt is sent on the ``async_executor`` of the transport, and sleeps
+        between retries are done with ``asyncio.sleep``, so a waiting retry does not
+        occupy a thread. The number of attempts which are in flight at once is
+        bounded by the size of the executor.
+
+        :param url: URL for the request
+        :param method: HTTP request method, as an all caps string
+        :param query_params: Parameters to be encoded as a query string
+        :param headers: HTTP headers to add to the request
+        :param data: Data to send as the request body. May pass through encoding.
+        :param encoding: A way to encode request data. "json", "form", and "text"
+            are all valid values. Custom encodings can be used only if they are
+            registered with the transport. By default, strings get "text" behavior and
+            all other objects get "json".
+        :param authorizer: The authorizer which is used to get or update authorization
+            information for the request
+        :param allow_redirects: Follow Location headers on redirect response
+            automatically. Defaults to ``True``
+        :param stream: Do not immediately download the response content. Defaults to
+            ``False``
+
+        :return: ``requests.Response`` object
+        """
+        log.debug("starting async request for %s", url)
+        req = self._encode(method, url, query_params, data, headers, encoding)
+        return await self._send_with_retries_async(
+            req, authorizer, allow_redirects=allow_redirects, stream=stream
+        )
+
+    async def _send_with_retries_async(
+        self,
+        req: requests.Request,
+        authorizer: GlobusAuthorizer | None,
+        *,
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        """
+        The ``asyncio`` version of ``_send_with_retries()``.
+        """
+        cached: requests.Response | None = None
+        coalescing_key: tuple[str, str, str] | None = None
+        if self.response_cache is not None or self.request_coalescer is not None:
+            # getting the Authorization header and reading the cache may block
+            cached, coalescing_key = await asyncio.get_running_loop().run_in_executor(
+                self.async_executor,
+                functools.partial(
+                    self._check_shared_response, req, authorizer, stream=stream
+                ),
+            )
+        if cached is not None:
+            return cached
+        send = functools.partial(
+            self._run_retry_steps_async,
+            req,
+            authorizer,
+            allow_redirects=allow_redirects,
+            stream=stream,
+        )
+        if coalescing_key is not None:
+            coalescer = t.cast(RequestCoalescer, self.request_coalescer)
+            return await coalescer.run_async(coalescing_key, send)
+        return await send()
+
+    async def _run_retry_steps_async(
+        self,
+        req: requests.Request,
+        authorizer: GlobusAuthorizer | None,
+        *,
+        allow_redirects: bool,
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Run the steps of the retry loop of a request without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        steps = self._retry_steps(req, authorizer, stream=stream)
+        result: t.Any = None
+        error: BaseException | None = None
+        while True:
+            try:
+                kind, arg = (
+                    steps.throw(error) if error is not None else steps.send(result)
+                )
+            except StopIteration as stop:
+                return t.cast(requests.Response, stop.value)
+            result, error = None, None
+            try:
+                if kind == _ACQUIRE:
+                    limiter = t.cast(AdaptiveRateLimiter, self.rate_limiter)
+                    await limiter.acquire_async(arg)
+                elif kind == _SEND:
+                    result = await loop.run_in_executor(
+                        self.async_executor,
+                        functools.partial(
+                            self._authorize_and_send,
+                            authorizer,
+                            req,
+                            allow_redirects=allow_redirects,
+                            stream=stream,
+                            deadline=arg,
+                        ),
+                    )
+                else:
+                    result = await self._retry_sleep_async(arg)
+            except BaseException as err:
+                error = err
+
+    def compile_request(
+        self,
+        method: str,
+        url: str,
+        query_params: dict[str, t.Any] | None = None,
+        data: (
+            dict[str, t.Any] | list[t.Any] | utils.PayloadWrapper | str | bytes | None
+        ) = None,
+        headers: dict[str, str] | None = None,
+        encoding: str | None = None,
+    ) -> RequestTemplate:
+        """
+        Encode and prepare a request once, as a ``RequestTemplate`` which may be sent
+        many times with ``send_template()``. This is useful for requests which are
+        sent repeatedly, like the requests of a polling loop.
+
+        The URL may contain path parameters in ``str.format`` style, e.g.
+        ``{task_id}``, which are filled in each time the template is sent.
+        The headers of the transport are captured when the template is compiled.
+
+        The parameters are the same as those of ``request()``.
+
+        :return: ``RequestTemplate`` object
+        """
+        path_params = _path_param_names(url)
+        req = self._encode(method, url, query_params, data, headers, encoding)
+        return RequestTemplate.from_request(req, path_params)
+
+    def send_template(
+        self,
+        template: RequestTemplate,
+        path_params: t.Mapping[str, t.Any] | None = None,
+        *,
+        authorizer: GlobusAuthorizer | None = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request from a ``RequestTemplate``, with the same retry handling as
+        ``request()``.
+
+        :param template: The template to send, from ``compile_request()``
+        :param path_params: The values of the path parameters of the template
+        :param authorizer: The authorizer which is used to get or update authorization
+            information for the request
+        :param allow_redirects: Follow Location headers on redirect response
+            automatically. Defaults to ``True``
+        :param stream: Do not immediately download the response content. Defaults to
+            ``False``
+
+        :return: ``requests.Response`` object
+        """
+        req = template.build(path_params)
+        log.debug("starting templated request for %s", req.url)
+        return self._send_with_retries(
+            req, authorizer, allow_redirects=allow_redirects, stream=stream
+        )
+
+    async def send_template_async(
+        self,
+        template: RequestTemplate,
+        path_params: t.Mapping[str, t.Any] | None = None,
+        *,
+        authorizer: GlobusAuthorizer | None = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send a request from a ``RequestTemplate`` from within a running ``asyncio``
+        event loop, with the same behaviors as ``request_async()``.
+
+        The parameters are the same as those of ``send_template()``.
+
+        :return: ``requests.Response`` object
+        """
+        req = template.build(path_params)
+        log.debug("starting async templated request for %s", req.url)
+        return await self._send_with_retries_async(
+            req, authorizer, allow_redirects=allow_redirects, stream=stream
+        )
 
     # decorator which lets you add a check to a retry policy
     def register_retry_check(self, func: RetryCheck) -> RetryCheck:
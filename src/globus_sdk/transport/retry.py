@@ -13,6 +13,16 @@ log = logging.getLogger(__name__)
 C = t.TypeVar("C", bound=t.Callable[..., t.Any])
 
 
+def _parse_retry_after(response: requests.Response) -> int | None:
+    val = response.headers.get("Retry-After")
+    if not val:
+        return None
+    try:
+        return int(val)
+    except ValueError:
+        return None
+
+
 class RetryContext:
     """
     The RetryContext is an object passed to retry checks in order to determine whether
@@ -27,6 +37,8 @@ class RetryContext:
     :param response: The response on a successful request
     :param exception: The error raised when trying to send the request
     :param authorizer: The authorizer object from the client making the request
+    :param deadline: The time, as a value of ``time.monotonic()``, by which the request
+        must complete, if the transport has a ``request_deadline``
     """
 
     def __init__(
@@ -36,6 +48,7 @@ class RetryContext:
         authorizer: GlobusAuthorizer | None = None,
         response: requests.Response | None = None,
         exception: Exception | None = None,
+        deadline: float | None = None,
     ) -> None:
         # retry attempt number
         self.attempt = attempt
@@ -47,6 +60,8 @@ class RetryContext:
         self.exception = exception
         # the retry delay or "backoff" before retrying
         self.backoff: float | None = None
+        # the end-to-end deadline for the request, if there is one
+        self.deadline = deadline
 
 
 class RetryCheckResult(enum.Enum):
@@ -122,8 +137,11 @@ class RetryCheckRunner:
         for check in checks:
             self._checks.append(check)
             self._check_data[check] = {}
+        # the check which requested a retry in the latest call to should_retry
+        self.last_retry_check: RetryCheck | None = None
 
     def should_retry(self, context: RetryContext) -> bool:
+        self.last_retry_check = None
         for check in self._checks:
             flags = getattr(check, "_retry_check_flags", RetryCheckFlags.NONE)
 
@@ -142,6 +160,7 @@ class RetryCheckRunner:
             elif result is RetryCheckResult.do_not_retry:
                 return False
             else:
+                self.last_retry_check = check
                 return True
 
         # fallthrough: don't retry any request which isn't marked for retry
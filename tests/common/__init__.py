@@ -6,13 +6,14 @@ Not so disorganized as a "utils" module and not so refined as a public package.
 from .consents import ConsentTest, ScopeRepr, make_consent_forest
 from .constants import GO_EP1_ID, GO_EP2_ID
 from .globus_responses import register_api_route, register_api_route_fixture_file
-from .response_mock import PickleableMockResponse
+from .response_mock import PickleableMockResponse, make_requests_response
 
 __all__ = [
     "ConsentTest",
     "GO_EP1_ID",
     "GO_EP2_ID",
     "make_consent_forest",
+    "make_requests_response",
     "PickleableMockResponse",
     "register_api_route",
     "register_api_route_fixture_file",
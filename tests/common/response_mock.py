@@ -4,6 +4,19 @@ from unittest import mock
 import requests
 
 
+def make_requests_response(status_code=200, headers=None, url=None):
+    """
+    Build a real, bodiless ``requests.Response``, for tests of transport components
+    which only look at the status, headers, or URL of a response.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    if url is not None:
+        response.url = url
+    return response
+
+
 class PickleableMockResponse(mock.NonCallableMock):
     """
     Custom Mock class which implements __setstate__ and __getstate__ so that it
@@ -41,6 +54,11 @@ class PickleableMockResponse(mock.NonCallableMock):
         self._json_body = json_body
 
         self.text = text or (json.dumps(json_body) if json_body else "")
+        # the body, as it would be received, for decoding with the SDK's JSON codec
+        self.encoding = "utf-8"
+        self.content = (
+            json.dumps(json_body) if json_body is not None else self.text
+        ).encode("utf-8")
 
     def json(self):
         if self._json_body is not None:
@@ -50,7 +68,7 @@ class PickleableMockResponse(mock.NonCallableMock):
 
     def __getstate__(self):
         """Custom getstate discards most of the magical mock stuff"""
-        keys = ["headers", "text", "_json_body", "status_code"]
+        keys = ["headers", "text", "encoding", "content", "_json_body", "status_code"]
         return {k: self.__dict__[k] for k in keys}
 
     def __setstate__(self, state):
@@ -1,3 +1,4 @@
+import globus_sdk
 from globus_sdk._testing import RegisteredResponse, load_response
 
 
@@ -45,3 +46,20 @@ def test_stream_true(client):
     # forcing JSON evaluation still works as expected (this must force the download /
     # evaluation of content)
     assert res["foo"] == "bar"
+
+
+def test_clients_share_connection_pools():
+    pools = globus_sdk.transport.ConnectionPoolRegistry()
+
+    class CustomClient(globus_sdk.BaseClient):
+        service_name = "foo"
+
+    c1 = CustomClient(transport_params={"connection_pools": pools})
+    c2 = CustomClient(transport_params={"connection_pools": pools})
+
+    load_response(RegisteredResponse(path="https://foo.api.globus.org/bar", json={}))
+    assert c1.get("/bar").http_status == 200
+    assert c2.get("/bar").http_status == 200
+
+    url = "https://foo.api.globus.org/bar"
+    assert c1.transport._get_session(url) is c2.transport._get_session(url)
@@ -0,0 +1,199 @@
+import asyncio
+import concurrent.futures
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, get_last_request, load_response
+
+
+@pytest.fixture
+def mock_async_sleep():
+    with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock) as m:
+        yield m
+
+
+@pytest.mark.parametrize("method", ["get", "post", "put", "patch", "delete"])
+def test_async_http_methods(client, method):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar",
+            method=method.upper(),
+            json={"baz": 1},
+        )
+    )
+
+    res = asyncio.run(getattr(client, f"{method}_async")("/bar"))
+    assert isinstance(res, globus_sdk.GlobusHTTPResponse)
+    assert res.http_status == 200
+    assert res["baz"] == 1
+    assert get_last_request().method == method.upper()
+
+
+def test_async_request_encodes_data(client):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", method="POST", json={"baz": 1}
+        )
+    )
+
+    asyncio.run(client.post_async("/bar", data={"x": 1, "y": globus_sdk.MISSING}))
+
+    last_req = get_last_request()
+    assert last_req.headers["Content-Type"] == "application/json"
+    assert last_req.body == b'{"x": 1}'
+
+
+def test_async_requests_run_concurrently(client):
+    for i in range(5):
+        load_response(
+            RegisteredResponse(path=f"https://foo.api.globus.org/bar{i}", json={"i": i})
+        )
+
+    async def main():
+        return await asyncio.gather(*(client.get_async(f"/bar{i}") for i in range(5)))
+
+    results = asyncio.run(main())
+    assert [r["i"] for r in results] == list(range(5))
+
+
+def test_async_error_raises_api_error(client, mock_async_sleep):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", status=404, json={"code": "NotFound"}
+        )
+    )
+
+    with pytest.raises(globus_sdk.GlobusAPIError) as excinfo:
+        asyncio.run(client.get_async("/bar"))
+    assert excinfo.value.http_status == 404
+    mock_async_sleep.assert_not_called()
+
+
+def test_async_retry_sleeps_without_blocking(client, mocksleep, mock_async_sleep):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", status=503, body="Uh-oh!"
+        )
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    res = asyncio.run(client.get_async("/bar"))
+    assert res["baz"] == 1
+
+    # the retry was done via an asyncio sleep, not a blocking one
+    mock_async_sleep.assert_awaited_once()
+    mocksleep.assert_not_called()
+
+
+def test_async_retry_respects_max_sleep(client, mock_async_sleep):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar",
+            status=429,
+            headers={"Retry-After": "60"},
+            body="Slow down!",
+        )
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    with client.transport.tune(max_sleep=3):
+        asyncio.run(client.get_async("/bar"))
+    mock_async_sleep.assert_awaited_once_with(3)
+
+
+def test_async_persistent_connection_error(client, mock_async_sleep):
+    for _i in range(6):
+        load_response(
+            RegisteredResponse(
+                path="https://foo.api.globus.org/bar",
+                body=requests.ConnectionError("foo-err"),
+            )
+        )
+
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        asyncio.run(client.get_async("/bar"))
+    assert mock_async_sleep.await_count == 5
+
+
+def test_async_retry_with_authorizer(client, mock_async_sleep):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", status=401, body="Unauthorized"
+        )
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    dummy_authz_calls = []
+
+    class DummyAuthorizer(globus_sdk.authorizers.GlobusAuthorizer):
+        def get_authorization_header(self):
+            dummy_authz_calls.append("set_authz")
+            return f"Bearer token{len(dummy_authz_calls)}"
+
+        def handle_missing_authorization(self):
+            dummy_authz_calls.append("handle_missing")
+            return True
+
+    client.authorizer = DummyAuthorizer()
+
+    res = asyncio.run(client.get_async("/bar"))
+    assert res["baz"] == 1
+    assert dummy_authz_calls == ["set_authz", "handle_missing", "set_authz"]
+    assert get_last_request().headers["Authorization"] == "Bearer token3"
+
+
+def test_async_request_without_automatic_authorization(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    client.authorizer = globus_sdk.AccessTokenAuthorizer("sometoken")
+
+    asyncio.run(client.get_async("/bar", automatic_authorization=False))
+    assert "Authorization" not in get_last_request().headers
+
+
+def test_async_attempts_are_sent_on_the_transport_executor(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    thread_names = []
+    send = client.transport._send
+
+    def recording_send(*args, **kwargs):
+        thread_names.append(threading.current_thread().name)
+        return send(*args, **kwargs)
+
+    with mock.patch.object(client.transport, "_send", recording_send):
+        asyncio.run(client.get_async("/bar"))
+    assert len(thread_names) == 1
+    assert thread_names[0].startswith("globus-sdk-async")
+
+
+def test_async_attempts_use_a_given_executor(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="custom-executor"
+    )
+    transport = globus_sdk.transport.RequestsTransport(async_executor=executor)
+    assert transport.async_executor is executor
+    client.transport = transport
+
+    res = asyncio.run(client.get_async("/bar"))
+    assert res["baz"] == 1
+
+    # an executor which was passed in is owned by the caller, and stays usable
+    transport.close()
+    assert executor.submit(lambda: 1).result() == 1
+    executor.shutdown()
@@ -0,0 +1,92 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, get_last_request, load_response
+
+
+def test_compiled_request_sends_with_path_params(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/task/1", json={"id": 1})
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/task/2", json={"id": 2})
+    )
+    get_task = client.compile_request(
+        "GET", "/task/{task_id}", query_params={"fields": "id"}, headers={"X": "y"}
+    )
+
+    assert get_task.send(task_id=1)["id"] == 1
+    response = get_task.send(task_id=2)
+
+    assert isinstance(response, globus_sdk.GlobusHTTPResponse)
+    assert response["id"] == 2
+    last_req = get_last_request()
+    assert last_req.url == "https://foo.api.globus.org/task/2?fields=id"
+    assert last_req.headers["X"] == "y"
+
+
+def test_compiled_request_resolves_authorizer_for_each_send(client):
+    load_response(RegisteredResponse(path="https://foo.api.globus.org/bar", json={}))
+    get_bar = client.compile_request("GET", "bar")
+
+    client.authorizer = globus_sdk.AccessTokenAuthorizer("first")
+    get_bar.send()
+    assert get_last_request().headers["Authorization"] == "Bearer first"
+
+    client.authorizer = globus_sdk.AccessTokenAuthorizer("second")
+    get_bar.send()
+    assert get_last_request().headers["Authorization"] == "Bearer second"
+
+
+def test_compiled_request_without_automatic_authorization(client):
+    load_response(RegisteredResponse(path="https://foo.api.globus.org/bar", json={}))
+    client.authorizer = globus_sdk.AccessTokenAuthorizer("token")
+    get_bar = client.compile_request("GET", "bar", automatic_authorization=False)
+
+    get_bar.send()
+
+    assert "Authorization" not in get_last_request().headers
+
+
+def test_compiled_request_raises_api_errors(client):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar",
+            status=404,
+            json={"code": "NotFound", "message": "no such thing"},
+        )
+    )
+    get_bar = client.compile_request("GET", "bar")
+
+    with pytest.raises(globus_sdk.GlobusAPIError) as excinfo:
+        get_bar.send()
+    assert excinfo.value.code == "NotFound"
+
+
+def test_compiled_request_is_traced_under_its_template(client):
+    load_response(RegisteredResponse(path="https://foo.api.globus.org/task/1", json={}))
+    get_task = client.compile_request("GET", "/task/{task_id}")
+
+    with mock.patch("globus_sdk._tracing.request_span") as request_span:
+        get_task.send(task_id=1)
+
+    request_span.assert_called_once_with(
+        "GET", "https://foo.api.globus.org/task/{task_id}", None
+    )
+
+
+def test_compiled_request_send_async(client):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", method="POST", json={"ok": True}
+        )
+    )
+    post_bar = client.compile_request("POST", "bar", data={"x": 1})
+
+    async def send_twice():
+        return await asyncio.gather(post_bar.send_async(), post_bar.send_async())
+
+    assert [r["ok"] for r in asyncio.run(send_twice())] == [True, True]
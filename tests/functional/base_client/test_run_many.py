@@ -0,0 +1,86 @@
+import functools
+import threading
+
+import pytest
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, get_last_request, load_response
+
+
+def test_run_many_preserves_order(client):
+    for i in range(20):
+        load_response(
+            RegisteredResponse(path=f"https://foo.api.globus.org/bar{i}", json={"i": i})
+        )
+
+    results = client.run_many(
+        (functools.partial(client.get, f"/bar{i}") for i in range(20)),
+        max_workers=4,
+    )
+    assert [r["i"] for r in results] == list(range(20))
+
+
+def test_run_many_collects_errors(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/ok", json={"ok": True})
+    )
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/missing",
+            status=404,
+            json={"code": "NotFound", "message": "no such thing"},
+        )
+    )
+
+    results = client.run_many(
+        [
+            lambda: client.get("/ok"),
+            lambda: client.get("/missing"),
+            lambda: client.get("/ok"),
+        ]
+    )
+    assert results[0]["ok"] is True
+    assert isinstance(results[1], globus_sdk.GlobusAPIError)
+    assert results[1].http_status == 404
+    assert results[2]["ok"] is True
+
+
+def test_run_many_retries_via_transport(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", status=503, json={})
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    (result,) = client.run_many([lambda: client.get("/bar")])
+    assert result["baz"] == 1
+    assert get_last_request().url == "https://foo.api.globus.org/bar"
+
+
+def test_run_many_bounds_parallelism(client):
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def call():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.01)
+        with lock:
+            running -= 1
+        return True
+
+    assert client.run_many([call] * 9, max_workers=3) == [True] * 9
+    assert peak <= 3
+
+
+def test_run_many_empty(client):
+    assert client.run_many([]) == []
+
+
+def test_run_many_rejects_bad_max_workers(client):
+    with pytest.raises(globus_sdk.GlobusSDKUsageError):
+        client.run_many([lambda: 1], max_workers=0)
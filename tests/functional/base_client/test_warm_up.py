@@ -0,0 +1,97 @@
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, get_last_request, load_response
+from globus_sdk.transport import ConnectionPoolRegistry, ResponseCache
+
+
+def _head_requests():
+    return [call.request for call in responses.calls if call.request.method == "HEAD"]
+
+
+def test_warm_up_sends_head_to_base_url(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/", method="HEAD", body="")
+    )
+
+    client.warm_up(connections=3)
+
+    heads = _head_requests()
+    assert len(heads) == 3
+    assert all(r.url == "https://foo.api.globus.org/" for r in heads)
+    assert heads[0].headers["User-Agent"] == client.transport.user_agent
+
+
+def test_warm_up_uses_pooled_sessions():
+    pools = ConnectionPoolRegistry()
+    transport = globus_sdk.transport.RequestsTransport(connection_pools=pools)
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/", method="HEAD", body="")
+    )
+    load_response(
+        RegisteredResponse(path="https://bar.api.globus.org/", method="HEAD", body="")
+    )
+
+    transport.warm_up(
+        ["https://foo.api.globus.org/", "https://bar.api.globus.org/"] * 2
+    )
+
+    # duplicate URLs are only warmed up once
+    assert len(_head_requests()) == 2
+    assert len(pools._sessions) == 2
+
+
+def test_warm_up_ignores_errors(client):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/",
+            method="HEAD",
+            body=requests.ConnectionError("oops"),
+        )
+    )
+
+    client.warm_up()
+
+
+def test_auth_warm_up_prefetches_metadata():
+    ac = globus_sdk.AuthClient(
+        transport_params={"response_cache": ResponseCache(default_ttl=60)}
+    )
+    load_response(
+        RegisteredResponse(service="auth", path="/", method="HEAD", body="", status=404)
+    )
+    load_response(
+        RegisteredResponse(
+            service="auth",
+            path="/.well-known/openid-configuration",
+            json={"jwks_uri": "https://auth.globus.org/jwk.json"},
+        )
+    )
+    load_response(
+        RegisteredResponse(service="auth", path="/jwk.json", json={"keys": []})
+    )
+
+    ac.warm_up(prefetch_metadata=True)
+    assert get_last_request().url == "https://auth.globus.org/jwk.json"
+
+    # the metadata is now served from the cache
+    ac.get_openid_configuration()
+    assert get_last_request().url == "https://auth.globus.org/jwk.json"
+
+
+@pytest.mark.parametrize(
+    "make_client",
+    [globus_sdk.AuthClient, lambda: globus_sdk.NativeAppAuthClient("client-id")],
+)
+def test_auth_warm_up_skips_metadata_without_a_cache(make_client):
+    client = make_client()
+    load_response(
+        RegisteredResponse(service="auth", path="/", method="HEAD", body="", status=404)
+    )
+
+    with pytest.warns(RuntimeWarning, match="no ResponseCache"):
+        client.warm_up(prefetch_metadata=True)
+    # only the connection was warmed up
+    assert [call.request.method for call in responses.calls] == ["HEAD"]
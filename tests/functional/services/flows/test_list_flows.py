@@ -1,4 +1,7 @@
+import asyncio
+import threading
 import urllib.parse
+from unittest import mock
 
 import pytest
 
@@ -72,6 +75,44 @@ def test_list_flows_paginated(flows_client, by_pages):
         assert len(items) == total_items
 
 
+def test_list_flows_paginated_prefetch(flows_client):
+    meta = load_response(flows_client.list_flows, case="paginated").metadata
+
+    pages = list(flows_client.paginated.list_flows().prefetch(2))
+
+    assert [page["marker"] for page in pages] == meta["expect_markers"]
+    assert sum(len(page["flows"]) for page in pages) == meta["total_items"]
+
+
+def test_list_flows_paginated_async(flows_client):
+    meta = load_response(flows_client.list_flows, case="paginated").metadata
+
+    async def list_flows():
+        paginator = flows_client.paginated.list_flows()
+        return [flow async for flow in paginator.items_async()]
+
+    assert len(asyncio.run(list_flows())) == meta["total_items"]
+
+
+def test_list_flows_paginated_async_uses_transport_executor(flows_client):
+    load_response(flows_client.list_flows, case="paginated")
+    thread_names = set()
+    send = flows_client.transport._send
+
+    def recording_send(*args, **kwargs):
+        thread_names.add(threading.current_thread().name)
+        return send(*args, **kwargs)
+
+    async def list_flows():
+        paginator = flows_client.paginated.list_flows()
+        return [flow async for flow in paginator.items_async()]
+
+    with mock.patch.object(flows_client.transport, "_send", recording_send):
+        asyncio.run(list_flows())
+    assert thread_names
+    assert all(name.startswith("globus-sdk-async") for name in thread_names)
+
+
 @pytest.mark.parametrize(
     "orderby_style, orderby_value",
     [
@@ -224,6 +224,50 @@ def test_endpoint_search_multipage_iter_items(client):
     assert count_objects == sum(len(x["DATA"]) for x in MULTIPAGE_SEARCH_RESULTS)
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_task_list_parallel_pages(client, ordered):
+    # pages after the first are matched by their offset, so register them first
+    for offset in range(100, 500, 100):
+        register_api_route(
+            "transfer",
+            "/task_list",
+            json={
+                "DATA_TYPE": "task_list",
+                "offset": offset,
+                "limit": 100,
+                "total": 450,
+                "DATA": [
+                    _mk_task_doc(x) for x in range(offset, min(offset + 100, 450))
+                ],
+            },
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"offset": str(offset)}, strict_match=False
+                )
+            ],
+        )
+    register_api_route(
+        "transfer",
+        "/task_list",
+        json={**MULTIPAGE_OFFSET_TASK_LIST_RESULTS[0], "total": 450},
+    )
+
+    paginator = client.paginated.task_list().parallel(3, ordered=ordered)
+    labels = [task["label"] for task in paginator.items()]
+
+    expect = [f"autogen transfer {x}" for x in range(450)]
+    if ordered:
+        assert labels == expect
+    else:
+        assert sorted(labels) == sorted(expect)
+    limits = sorted(
+        (call.request.params.get("offset"), call.request.params["limit"])
+        for call in responses.calls
+        if "offset" in call.request.params
+    )
+    assert limits == [("100", "100"), ("200", "100"), ("300", "100"), ("400", "50")]
+
+
 # multiple pages of results, very stubby
 SHARED_ENDPOINT_RESULTS = [
     {
@@ -0,0 +1,103 @@
+"""
+Benchmark the JSON backends supported by the SDK.
+
+Documents are taken from the registered ``_testing`` response fixtures. A large
+document, like a big page of results, is also made by repeating the entries of a
+fixture.
+
+Run with a list of backends to compare, e.g.
+
+    python json_benchmark.py stdlib orjson msgspec ujson
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import sys
+import timeit
+import typing as t
+
+import globus_sdk._testing.data
+from globus_sdk import _json
+from globus_sdk._testing import get_response_set
+from globus_sdk._testing.models import RegisteredResponse, ResponseList
+
+LARGE_DOCUMENT_SIZE = 100_000
+
+
+def _iter_fixture_documents() -> t.Iterator[t.Any]:
+    for module_info in pkgutil.walk_packages(
+        globus_sdk._testing.data.__path__, prefix="globus_sdk._testing.data."
+    ):
+        module = importlib.import_module(module_info.name)
+        response_set = getattr(module, "RESPONSES", None)
+        if response_set is None:
+            continue
+        for item in response_set:
+            responses = item.responses if isinstance(item, ResponseList) else [item]
+            for response in responses:
+                if isinstance(response, RegisteredResponse) and response.json:
+                    yield response.json
+
+
+def _large_document() -> dict[str, t.Any]:
+    # a page of successful transfers, with its entries repeated to the target size
+    page = get_response_set("transfer.endpoint_manager_task_successful_transfers")
+    fixture = page.lookup("default")
+    assert isinstance(fixture, RegisteredResponse) and isinstance(fixture.json, dict)
+    entries = fixture.json["DATA"]
+    repeated = (entries * (LARGE_DOCUMENT_SIZE // len(entries) + 1))[
+        :LARGE_DOCUMENT_SIZE
+    ]
+    return {**fixture.json, "DATA": repeated}
+
+
+def _best(func: t.Callable[[], t.Any], number: int) -> float:
+    return min(timeit.repeat(func, repeat=5, number=number)) / number
+
+
+def main() -> None:
+    backends = sys.argv[1:] or ["stdlib", "orjson", "msgspec", "ujson"]
+    documents = list(_iter_fixture_documents())
+    large = _large_document()
+    encoded_fixtures = [_json.JSONCodec().dumps(doc) for doc in documents]
+    encoded_large = _json.JSONCodec().dumps(large)
+    print(
+        f"{len(documents)} fixture documents "
+        f"({sum(len(x) for x in encoded_fixtures)} bytes), "
+        f"large document of {LARGE_DOCUMENT_SIZE} entries ({len(encoded_large)} bytes)"
+    )
+    print()
+
+    baseline: dict[str, float] = {}
+    for backend in backends:
+        try:
+            codec = _json.load_codec(backend)
+        except ImportError:
+            print(f"{backend}: not installed, skipping")
+            print()
+            continue
+
+        timings = {
+            "decode fixtures": _best(
+                lambda: [codec.loads(x) for x in encoded_fixtures], 20
+            ),
+            "encode fixtures": _best(lambda: [codec.dumps(x) for x in documents], 20),
+            "decode large": _best(lambda: codec.loads(encoded_large), 1),
+            "encode large": _best(lambda: codec.dumps(large), 1),
+        }
+        print(f"{backend}:")
+        for name, timing in timings.items():
+            baseline.setdefault(name, timing)
+            speedup = baseline[name] / timing
+            print(f"  {name}: best={timing:.6f}s speedup={speedup:.2f}x")
+        print()
+    print(
+        f"Timings are the best of 5 runs. Speedups are relative to {backends[0]}, "
+        "the first backend given."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Benchmark the overhead which the SDK adds to each call, by replaying responses
+without a network.
+
+Client workloads are run against the registered ``_testing`` response fixtures,
+through a ``ReplayTransport``. The time of each call is then the time spent in the
+SDK (encoding requests, running retry checks, wrapping responses, and paging) and in
+``requests``, with no network I/O. As a baseline, the same responses are also
+replayed through a bare ``requests`` session.
+
+Recordings made with ``RecordingTransport`` may be replayed as additional workloads,
+which send every recorded request again, e.g.
+
+    python replay_benchmark.py task_list.json.gz
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import typing as t
+import uuid
+
+import requests
+
+import globus_sdk
+from globus_sdk._testing import (
+    RegisteredResponse,
+    ReplayTransport,
+    ResponseList,
+    get_response_set,
+    load_recording,
+)
+from globus_sdk._testing.recording import _ReplayAdapter, _ReplayRoutes
+
+ClientT = t.TypeVar("ClientT", bound=globus_sdk.BaseClient)
+
+
+class Workload:
+    def __init__(
+        self,
+        name: str,
+        responses: RegisteredResponse | ResponseList,
+        make_client: t.Callable[[ReplayTransport], t.Callable[[], t.Any]],
+    ) -> None:
+        self.name = name
+        self.responses = (
+            responses.responses if isinstance(responses, ResponseList) else [responses]
+        )
+        self.make_client = make_client
+
+    def run_sdk(self, number: int) -> float:
+        transport = ReplayTransport(replay=self.responses)
+        call = self.make_client(transport)
+
+        def run() -> None:
+            transport.reset()
+            call()
+
+        return _best(run, number)
+
+    def run_baseline(self, number: int) -> float:
+        # send the same requests with a bare session, by replaying what the SDK sent
+        sent: list[requests.PreparedRequest] = []
+        transport = ReplayTransport(replay=self.responses)
+        adapter = transport.session.get_adapter("https://")
+        original_send = adapter.send
+
+        def capture(request: requests.PreparedRequest, **kwargs: t.Any) -> t.Any:
+            sent.append(request)
+            return original_send(request, **kwargs)
+
+        adapter.send = capture  # type: ignore[method-assign,assignment]
+        self.make_client(transport)()
+
+        routes = _ReplayRoutes(self.responses)
+        session = requests.Session()
+        session.mount("https://", _ReplayAdapter(routes))
+
+        def run() -> None:
+            routes.reset()
+            for request in sent:
+                session.send(request).content
+
+        return _best(run, number)
+
+
+def _replay_client(
+    client_class: type[ClientT], transport: ReplayTransport, **kwargs: t.Any
+) -> ClientT:
+    # a client whose transport is the given one
+    client = client_class(**kwargs)
+    client.transport = transport
+    return client
+
+
+def _fixture(set_id: t.Any, case: str = "default") -> RegisteredResponse | ResponseList:
+    return get_response_set(set_id).lookup(case)
+
+
+def _workloads() -> list[Workload]:
+    tc = globus_sdk.TransferClient
+    flows = globus_sdk.FlowsClient
+    endpoint = _fixture(tc.get_endpoint)
+    submission = _fixture(tc.submit_transfer)
+    identities = _fixture(globus_sdk.AuthClient.get_identities)
+    flow_pages = _fixture(flows.list_flows, "paginated")
+
+    def get_endpoint(transport: ReplayTransport) -> t.Callable[[], t.Any]:
+        client = _replay_client(tc, transport)
+        return lambda: client.get_endpoint(endpoint.metadata["endpoint_id"])
+
+    def get_endpoint_compiled(transport: ReplayTransport) -> t.Callable[[], t.Any]:
+        client = _replay_client(tc, transport)
+        request = client.compile_request("GET", "endpoint/{endpoint_id}")
+        return lambda: request.send(endpoint_id=endpoint.metadata["endpoint_id"])
+
+    def submit_transfer(transport: ReplayTransport) -> t.Callable[[], t.Any]:
+        client = _replay_client(tc, transport)
+        source, destination = uuid.uuid4(), uuid.uuid4()
+
+        def call() -> t.Any:
+            data = globus_sdk.TransferData(
+                source_endpoint=source,
+                destination_endpoint=destination,
+                submission_id=submission.metadata["submission_id"],
+            )
+            for i in range(100):
+                data.add_item(f"/source/file{i}", f"/destination/file{i}")
+            return client.submit_transfer(data)
+
+        return call
+
+    def get_identities(transport: ReplayTransport) -> t.Callable[[], t.Any]:
+        client = _replay_client(globus_sdk.AuthClient, transport)
+        return lambda: client.get_identities(usernames=["foo@globusid.org"]).data
+
+    def list_flows(transport: ReplayTransport) -> t.Callable[[], t.Any]:
+        client = _replay_client(flows, transport)
+        return lambda: list(client.paginated.list_flows().items())
+
+    return [
+        Workload("transfer get_endpoint", endpoint, get_endpoint),
+        Workload(
+            "transfer get_endpoint (compiled request)", endpoint, get_endpoint_compiled
+        ),
+        Workload("transfer submit_transfer (100 items)", submission, submit_transfer),
+        Workload("auth get_identities", identities, get_identities),
+        Workload("flows list_flows (3 pages)", flow_pages, list_flows),
+    ]
+
+
+def _recording_workload(path: str) -> Workload:
+    recording = load_recording(path)
+
+    def make_client(transport: ReplayTransport) -> t.Callable[[], t.Any]:
+        # recorded retries are sent again as requests of their own
+        transport.max_retries = 0
+
+        def call() -> None:
+            for response in recording.responses:
+                transport.request(response.method, response.full_url)
+
+        return call
+
+    return Workload(f"recording {path}", recording, make_client)
+
+
+def _best(func: t.Callable[[], t.Any], number: int) -> float:
+    return min(timeit.repeat(func, repeat=5, number=number)) / number
+
+
+def main() -> None:
+    workloads = _workloads() + [_recording_workload(path) for path in sys.argv[1:]]
+    for workload in workloads:
+        sdk = workload.run_sdk(200)
+        baseline = workload.run_baseline(200)
+        print(f"{workload.name}:")
+        print(f"  sdk call: best={sdk * 1e6:.1f}us")
+        print(f"  bare requests: best={baseline * 1e6:.1f}us")
+        print(f"  sdk overhead: {(sdk - baseline) * 1e6:.1f}us")
+        print()
+    print(
+        "Timings are the best of 5 runs, per call. The overhead is the difference "
+        "between a call through the SDK and sending the same requests with requests."
+    )
+
+
+if __name__ == "__main__":
+    main()
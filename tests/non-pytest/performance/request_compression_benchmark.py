@@ -0,0 +1,142 @@
+"""
+Benchmark gzip compression of request bodies, when submitting large transfers.
+
+Transfers are submitted to a local stand-in for the Transfer service, which accepts
+``POST /transfer`` and reports how many bytes of body it received. The stand-in
+reads bodies at a limited rate, to simulate the upload bandwidth of a batch node.
+
+Run with the number of items in each transfer and the upload bandwidth in megabytes
+per second, e.g.
+
+    python request_compression_benchmark.py 100000 10
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.server
+import json
+import sys
+import threading
+import time
+import typing as t
+import uuid
+
+import globus_sdk
+
+READ_SIZE = 65536
+
+
+class _StandInHandler(http.server.BaseHTTPRequestHandler):
+    server: _StandInServer
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        pass
+
+    def _read(self, size: int) -> bytes:
+        data = self.rfile.read(size)
+        self.server.bytes_received += len(data)
+        time.sleep(len(data) / self.server.bandwidth)
+        return data
+
+    def _read_body(self) -> bytes:
+        if "Content-Length" in self.headers:
+            remaining = int(self.headers["Content-Length"])
+            parts = []
+            while remaining:
+                parts.append(self._read(min(remaining, READ_SIZE)))
+                remaining -= len(parts[-1])
+            return b"".join(parts)
+        # a chunked body
+        parts = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            data = self._read(size)
+            self.rfile.readline()
+            if not size:
+                return b"".join(parts)
+            parts.append(data)
+
+    def _reply(self, document: dict[str, t.Any]) -> None:
+        body = json.dumps(document).encode()
+        self.send_response(202)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._reply({"value": str(uuid.uuid4())})
+
+    def do_POST(self) -> None:
+        body = self._read_body()
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        document = json.loads(body)
+        self._reply(
+            {
+                "code": "Accepted",
+                "task_id": str(uuid.uuid4()),
+                "submission_id": document["submission_id"],
+            }
+        )
+
+
+class _StandInServer(http.server.ThreadingHTTPServer):
+    def __init__(self, bandwidth: float) -> None:
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.bandwidth = bandwidth
+        self.bytes_received = 0
+
+
+def _transfer_data(num_items: int) -> globus_sdk.TransferData:
+    tdata = globus_sdk.TransferData(
+        source_endpoint=str(uuid.uuid4()), destination_endpoint=str(uuid.uuid4())
+    )
+    for i in range(num_items):
+        tdata.add_item(
+            f"/projects/experiment/run-{i // 1000:04d}/frame-{i:08d}.h5",
+            f"/archive/experiment/run-{i // 1000:04d}/frame-{i:08d}.h5",
+        )
+    return tdata
+
+
+def main() -> None:
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    bandwidth = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+
+    server = _StandInServer(bandwidth * 1_000_000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    tdata = _transfer_data(num_items)
+    tdata["submission_id"] = str(uuid.uuid4())
+    print(f"{num_items} items, {bandwidth} MB/s upload bandwidth")
+    print()
+
+    configurations: dict[str, dict[str, t.Any]] = {
+        "uncompressed": {},
+        "gzip": {"request_compression_threshold": 1024},
+        "gzip, streamed": {
+            "request_compression_threshold": 1024,
+            "stream_json_bodies": True,
+        },
+    }
+    baseline: float | None = None
+    for name, transport_params in configurations.items():
+        client = globus_sdk.TransferClient(
+            base_url=base_url, transport_params=transport_params
+        )
+        server.bytes_received = 0
+        start = time.perf_counter()
+        client.submit_transfer(tdata)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{name}:")
+        print(f"  bytes on wire: {server.bytes_received}")
+        print(f"  submit latency: {elapsed:.3f}s speedup={baseline / elapsed:.2f}x")
+        print()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
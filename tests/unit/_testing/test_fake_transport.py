@@ -0,0 +1,107 @@
+import json
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import (
+    FakeTransport,
+    RegisteredResponse,
+    get_last_request,
+    load_response,
+)
+
+URL = "https://foo.api.globus.org/bar"
+
+
+class FakeFlowsClient(globus_sdk.FlowsClient):
+    transport_class = FakeTransport
+
+
+@pytest.fixture(autouse=True)
+def no_adapters(monkeypatch):
+    # fail if anything reaches the adapter which `responses` mocks
+    def fail(*args, **kwargs):
+        raise AssertionError("fake transport used a requests adapter")
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", fail)
+
+
+def test_fake_transport_resolves_registered_responses():
+    load_response(
+        RegisteredResponse(path=URL, method="POST", json={"x": 1}, headers={"A": "b"})
+    )
+    transport = FakeTransport()
+
+    response = transport.request("POST", URL, data={"y": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"x": 1}
+    assert response.headers["a"] == "b"
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.url == URL
+    assert list(response.iter_content(1)) == [bytes([c]) for c in b'{"x": 1}']
+
+    last_req = get_last_request()
+    assert last_req.method == "POST"
+    assert json.loads(last_req.body) == {"y": 2}
+    assert responses.calls[-1].response is response
+
+
+def test_fake_transport_serves_responses_in_order(mocksleep):
+    load_response(RegisteredResponse(path=URL, status=503, body="busy"))
+    load_response(RegisteredResponse(path=URL, json={"x": 1}))
+
+    assert FakeTransport().request("GET", URL).json() == {"x": 1}
+    assert mocksleep.call_count == 1
+    assert len(responses.calls) == 2
+
+
+def test_fake_transport_uses_matchers():
+    pages = load_response(globus_sdk.FlowsClient.list_flows, case="paginated")
+
+    flows = list(FakeFlowsClient().paginated.list_flows().items())
+
+    assert len(flows) == pages.metadata["total_items"]
+    assert get_last_request().params == {"marker": "fake_marker_1"}
+
+
+def test_fake_transport_raises_exception_bodies():
+    load_response(RegisteredResponse(path=URL, body=requests.ConnectionError("oops")))
+
+    with pytest.raises(globus_sdk.NetworkError):
+        FakeTransport(max_retries=0).request("GET", URL)
+    assert isinstance(responses.calls[-1].response, requests.ConnectionError)
+
+
+def test_fake_transport_without_a_match():
+    with pytest.raises(globus_sdk.NetworkError) as excinfo:
+        FakeTransport(max_retries=0).request("GET", URL)
+    assert "doesn't match any registered mock" in str(
+        excinfo.value.underlying_exception
+    )
+
+
+def test_fake_transport_supports_callbacks():
+    responses.add_callback(
+        responses.GET, URL, callback=lambda request: (201, {"X": "y"}, "made")
+    )
+
+    response = FakeTransport().request("GET", URL)
+
+    assert (response.status_code, response.text) == (201, "made")
+    assert response.headers["X"] == "y"
+
+
+def test_fake_transport_with_a_custom_mock():
+    requests_mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    load_response(
+        RegisteredResponse(path=URL, json={"custom": True}),
+        requests_mock=requests_mock,
+    )
+
+    transport = FakeTransport(requests_mock=requests_mock)
+
+    assert transport.request("GET", URL).json() == {"custom": True}
+    assert get_last_request(requests_mock=requests_mock).url == URL
@@ -0,0 +1,163 @@
+import gzip
+import json
+
+import pytest
+import requests
+
+import globus_sdk
+from globus_sdk._testing import (
+    RecordingTransport,
+    RegisteredResponse,
+    ReplayTransport,
+    ResponseList,
+    dump_recording,
+    get_response_set,
+    load_recording,
+    load_response,
+)
+
+URL = "https://foo.api.globus.org/bar"
+
+
+class ReplayFlowsClient(globus_sdk.FlowsClient):
+    transport_class = ReplayTransport
+
+
+def _forbid_network(monkeypatch):
+    # fail if anything reaches the adapter which `responses` mocks
+    def fail(*args, **kwargs):
+        raise AssertionError("replay used the network")
+
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", fail)
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    _forbid_network(monkeypatch)
+
+
+def test_recording_captures_exchanges():
+    load_response(RegisteredResponse(path=URL, status=503, body="busy"))
+    load_response(
+        RegisteredResponse(path=URL, json={"x": 1}, headers={"Set-Cookie": "a=b"})
+    )
+    transport = RecordingTransport()
+
+    response = transport.request("GET", URL, query_params={"q": "1"})
+
+    assert response.json() == {"x": 1}
+    first, second = transport.recording.responses
+    assert (first.full_url, first.status, first.body) == (f"{URL}?q=1", 503, "busy")
+    assert second.status == 200
+    assert json.loads(second.body) == {"x": 1}
+    assert "Set-Cookie" not in second.headers
+    assert second.headers["Content-Type"] == "application/json"
+
+
+def test_recording_keeps_streamed_bodies_readable():
+    load_response(RegisteredResponse(path=URL, body="streamed"))
+    transport = RecordingTransport()
+
+    response = transport.request("GET", URL, stream=True)
+
+    assert response.text == "streamed"
+    assert transport.recording.responses[0].body == "streamed"
+
+
+@pytest.mark.parametrize("filename", ["recording.json", "recording.json.gz"])
+def test_dump_and_load_recording(tmp_path, filename):
+    path = tmp_path / filename
+    dump_recording(
+        [
+            RegisteredResponse(path=URL, json={"x": 1}),
+            RegisteredResponse(path=URL, method="POST", status=201, body="\udcff"),
+        ],
+        path,
+    )
+
+    if filename.endswith(".gz"):
+        assert json.loads(gzip.decompress(path.read_bytes()))["version"] == 1
+    loaded = load_recording(path)
+    assert isinstance(loaded, ResponseList)
+    first, second = loaded.responses
+    assert (first.full_url, first.method, first.json) == (URL, "GET", {"x": 1})
+    assert (second.method, second.status, second.body) == ("POST", 201, "\udcff")
+
+
+def test_load_recording_rejects_unknown_versions(tmp_path):
+    path = tmp_path / "recording.json"
+    path.write_text(json.dumps({"version": 99, "responses": []}))
+
+    with pytest.raises(ValueError, match="unsupported recording format version"):
+        load_recording(path)
+
+
+def test_record_then_replay(tmp_path, monkeypatch):
+    load_response(RegisteredResponse(path=URL, json={"x": 1}))
+    recorder = RecordingTransport()
+    recorder.request("GET", URL)
+    recorder.save(tmp_path / "recording.json")
+    _forbid_network(monkeypatch)
+
+    replayer = ReplayTransport(replay=load_recording(tmp_path / "recording.json"))
+    response = replayer.request("GET", URL)
+
+    assert response.json() == {"x": 1}
+    assert response.headers["Content-Type"] == "application/json"
+
+
+def test_replay_serves_in_order_and_repeats_last(no_network, mocksleep):
+    transport = ReplayTransport(
+        replay=[
+            RegisteredResponse(path=URL, status=500, body="oops"),
+            RegisteredResponse(path=URL, json={"x": 1}),
+        ]
+    )
+
+    # the first response is retried, using the transport's retry checks
+    assert transport.request("GET", URL).json() == {"x": 1}
+    assert mocksleep.call_count == 1
+    assert transport.request("GET", URL).json() == {"x": 1}
+
+    transport.reset()
+    transport.max_retries = 0
+    assert transport.request("GET", URL).status_code == 500
+
+
+def test_replay_matches_query_strings(no_network):
+    transport = ReplayTransport(
+        replay=[
+            RegisteredResponse(path=f"{URL}?page=1", json={"page": 1}),
+            RegisteredResponse(path=f"{URL}?page=2", json={"page": 2}),
+        ]
+    )
+
+    assert transport.request("GET", URL, query_params={"page": 2}).json() == {"page": 2}
+    assert transport.request("GET", URL, query_params={"page": 1}).json() == {"page": 1}
+
+
+def test_replay_raises_exception_bodies(no_network):
+    transport = ReplayTransport(
+        replay=[RegisteredResponse(path=URL, body=requests.ConnectionError("oops"))],
+        max_retries=0,
+    )
+
+    with pytest.raises(globus_sdk.NetworkError):
+        transport.request("GET", URL)
+
+
+def test_replay_without_a_match(no_network):
+    transport = ReplayTransport(replay=[RegisteredResponse(path=URL, json={})])
+
+    with pytest.raises(LookupError, match="no response to replay for POST"):
+        transport.request("POST", URL)
+
+
+def test_replay_response_set_with_matchers(no_network):
+    # a paginated fixture, whose pages are chosen by `responses` query matchers
+    pages = get_response_set(globus_sdk.FlowsClient.list_flows).lookup("paginated")
+    client = ReplayFlowsClient(transport_params={"replay": pages})
+
+    flows = list(client.paginated.list_flows().items())
+
+    assert len(flows) == pages.metadata["total_items"]
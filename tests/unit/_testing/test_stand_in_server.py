@@ -0,0 +1,194 @@
+import gzip
+import json
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, StandInServer, get_response_set
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def _make_server(**kwargs):
+        server = StandInServer(**kwargs)
+        servers.append(server)
+        server.start()
+        # let requests to the server through the `responses` mock
+        responses.add_passthru(server.url)
+        return server
+
+    yield _make_server
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def server(make_server):
+    return make_server()
+
+
+def test_serves_fixtures(server):
+    tc = globus_sdk.TransferClient(base_url=server.url_for("transfer"))
+    meta = get_response_set(tc.get_endpoint).lookup("default").metadata
+
+    assert tc.get_endpoint(meta["endpoint_id"])["display_name"] == "myserver"
+
+
+def test_prefers_matching_fixtures(server):
+    fc = globus_sdk.FlowsClient(base_url=server.url_for("flows"))
+    pages = get_response_set(fc.list_flows).lookup("paginated").responses
+
+    # the second page matches the marker of the first, and is preferred over the
+    # default response, which matches any request
+    res = fc.list_flows(marker="fake_marker_0")
+
+    assert res.data == pages[1].json
+
+
+def test_unknown_routes_are_not_found(server):
+    response = requests.get(f"{server.url}transfer/v0.10/no-such-route")
+    assert response.status_code == 404
+    assert response.json()["code"] == "NotFound"
+    assert requests.get(f"{server.url}nowhere/").status_code == 404
+
+
+def test_add_response_and_request_bodies(server):
+    server.add_response(
+        RegisteredResponse(
+            service="transfer",
+            path="/v0.10/things",
+            method="POST",
+            json={"created": True},
+            match=[responses.matchers.json_params_matcher({"a": 1})],
+        )
+    )
+    url = f"{server.url}transfer/v0.10/things"
+
+    assert requests.post(url, json={"a": 1}).json() == {"created": True}
+    assert requests.post(url, json={"a": 2}).status_code == 404
+    compressed = requests.post(
+        url,
+        data=gzip.compress(json.dumps({"a": 1}).encode()),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+    )
+    assert compressed.json() == {"created": True}
+    chunked = requests.post(
+        url,
+        data=iter([b'{"a"', b": 1}"]),
+        headers={"Content-Type": "application/json"},
+    )
+    assert chunked.json() == {"created": True}
+
+
+@pytest.mark.parametrize(
+    "style, client_class, method, path, items_key, kwargs, num_pages",
+    [
+        (
+            "limit_offset",
+            globus_sdk.TransferClient,
+            "endpoint_search",
+            "/v0.10/endpoint_search",
+            "DATA",
+            {"filter_fulltext": "x"},
+            # the client requests pages of 100 items
+            4,
+        ),
+        ("marker", globus_sdk.FlowsClient, "list_flows", "/flows", "flows", {}, 7),
+        (
+            "next_token",
+            globus_sdk.TransferClient,
+            "get_shared_endpoint_list",
+            "/v0.10/endpoint/abc/shared_endpoint_list",
+            "shared_endpoints",
+            {"endpoint_id": "abc"},
+            7,
+        ),
+    ],
+)
+def test_listings(
+    server, style, client_class, method, path, items_key, kwargs, num_pages
+):
+    service = "transfer" if client_class is globus_sdk.TransferClient else "flows"
+    items = [{"id": i} for i in range(345)]
+    server.add_listing(
+        service, path, items=items, items_key=items_key, style=style, page_size=50
+    )
+    client = client_class(base_url=server.url_for(service))
+
+    paginator = getattr(client.paginated, method)(**kwargs)
+
+    assert list(paginator.items()) == items
+    assert server.stats()["requests"] == num_pages
+
+
+def test_injected_errors_are_retried(make_server, mocksleep):
+    server = make_server(faults={503: 1.0}, retry_after=3)
+    tc = globus_sdk.TransferClient(
+        base_url=server.url_for("transfer"), transport_params={"max_retries": 1}
+    )
+
+    with pytest.raises(globus_sdk.TransferAPIError) as excinfo:
+        tc.get_submission_id()
+
+    assert excinfo.value.http_status == 503
+    assert excinfo.value.headers["Retry-After"] == "3"
+    assert mocksleep.call_args.args[0] == 3
+    assert server.stats() == {
+        "requests": 2,
+        "status_codes": {503: 2},
+        "faults": {503: 2},
+    }
+
+
+def test_injected_connection_resets(make_server):
+    server = make_server(faults={"reset": 1.0})
+    tc = globus_sdk.TransferClient(
+        base_url=server.url_for("transfer"), transport_params={"max_retries": 0}
+    )
+
+    with pytest.raises(globus_sdk.NetworkError):
+        tc.get_submission_id()
+    assert server.stats()["faults"] == {"reset": 1}
+
+
+def test_faults_are_seeded(make_server):
+    def run(seed):
+        server = make_server(faults={500: 0.5}, seed=seed)
+        url = f"{server.url}transfer/v0.10/submission_id"
+        return [requests.get(url).status_code for _ in range(20)]
+
+    assert run(7) == run(7)
+
+
+def test_latency(make_server, mocksleep):
+    server = make_server(latency=lambda rng: 0.25)
+    requests.get(f"{server.url}transfer/v0.10/submission_id")
+    mocksleep.assert_called_once_with(0.25)
+
+
+def test_environ_points_clients_at_server(server, monkeypatch):
+    for name, value in server.environ().items():
+        monkeypatch.setenv(name, value)
+
+    tc = globus_sdk.TransferClient()
+
+    assert tc.base_url == server.url_for("transfer") + "v0.10/"
+    assert "value" in tc.get_submission_id()
+
+
+def test_rejects_bad_fault_probabilities():
+    with pytest.raises(ValueError):
+        StandInServer(faults={500: 0.7, 503: 0.7}, load_fixtures=False)
+
+
+def test_unknown_services():
+    server = StandInServer(load_fixtures=False)
+    try:
+        with pytest.raises(LookupError):
+            server.url_for("nope")
+    finally:
+        server.stop()
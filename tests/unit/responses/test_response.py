@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 import requests
 
+from globus_sdk import _json
 from globus_sdk.response import ArrayResponse, GlobusHTTPResponse, IterableResponse
 
 _TestResponse = namedtuple("_TestResponse", ("data", "r"))
@@ -356,3 +357,43 @@ def test_http_headers_from_response():
 
     r3 = GlobusHTTPResponse(r2)  # wrap another response
     assert r3.headers["content-length"] == "5"
+
+
+def test_json_is_parsed_lazily_and_once():
+    r = _response({"foo": 1})
+    with mock.patch(
+        "globus_sdk._json.loads_response", wraps=_json.loads_response
+    ) as loads:
+        res = GlobusHTTPResponse(r, client=mock.Mock())
+        assert res.http_status == 200
+        assert res.binary_content == b'{"foo": 1}'
+        loads.assert_not_called()
+
+        assert res["foo"] == 1
+        assert res.get("foo") == 1
+        assert res.data == {"foo": 1}
+        loads.assert_called_once()
+
+
+def test_wrapped_responses_share_parsed_json():
+    r = _response({"foo": [1, 2]})
+    with mock.patch(
+        "globus_sdk._json.loads_response", wraps=_json.loads_response
+    ) as loads:
+        inner = GlobusHTTPResponse(r, client=mock.Mock())
+        outer = ArrayResponse(inner)
+        loads.assert_not_called()
+
+        assert outer["foo"] == [1, 2]
+        assert inner.data is outer.data
+        loads.assert_called_once()
+
+
+def test_non_json_warning_is_deferred_until_data_is_used(caplog):
+    r = _response(b"foo: bar, baz: buzz")
+    res = GlobusHTTPResponse(r, client=mock.Mock())
+    assert res.text == "foo: bar, baz: buzz"
+    assert "did not parse as JSON" not in caplog.text
+
+    assert res.data is None
+    assert "did not parse as JSON" in caplog.text
@@ -1,3 +1,4 @@
+import json
 import uuid
 from unittest import mock
 
@@ -65,8 +66,8 @@ def test_decoding_passes_audience(audience_value):
 
 def test_setting_oidc_config_on_default_decoder_unpacks_data():
     oidc_config = {"x": 1}
-    raw_response = mock.Mock(spec=requests.Response)
-    raw_response.json.return_value = oidc_config
+    raw_response = requests.Response()
+    raw_response._content = json.dumps(oidc_config).encode("utf-8")
     response = globus_sdk.GlobusHTTPResponse(raw_response, client=mock.Mock())
 
     decoder = globus_sdk.IDTokenDecoder(mock.Mock())
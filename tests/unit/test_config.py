@@ -211,3 +211,12 @@ def test_service_url_from_env_var():
                 globus_sdk.config.get_webapp_url()
                 == f"https://app.{env}.globuscs.info/"
             )
+
+
+def test_get_json_backend():
+    with mock.patch.dict(os.environ):
+        os.environ.pop("GLOBUS_SDK_JSON_BACKEND", None)
+        assert globus_sdk.config.get_json_backend() == "stdlib"
+        os.environ["GLOBUS_SDK_JSON_BACKEND"] = "ORJSON"
+        assert globus_sdk.config.get_json_backend() == "orjson"
+        assert globus_sdk.config.get_json_backend("ujson") == "ujson"
@@ -0,0 +1,125 @@
+import json
+import math
+from unittest import mock
+
+import pytest
+import requests
+
+from globus_sdk import _json
+from globus_sdk.transport import JSONRequestEncoder
+
+BACKENDS = ["stdlib", "orjson", "msgspec", "ujson"]
+
+
+@pytest.fixture(params=BACKENDS)
+def codec(request):
+    if request.param != "stdlib":
+        pytest.importorskip(request.param)
+    codec = _json.load_codec(request.param)
+    with mock.patch.object(_json, "_CODEC", codec):
+        yield codec
+
+
+def _response(content, encoding="utf-8"):
+    r = requests.Response()
+    r._content = content
+    r.encoding = encoding
+    return r
+
+
+def test_codec_round_trip(codec):
+    doc = {"DATA": [{"name": "foo", "size": 1, "ok": True, "x": None}], "é": 1.5}
+    encoded = codec.dumps(doc)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == doc
+    assert codec.loads(encoded) == doc
+    assert codec.loads(encoded.decode("utf-8")) == doc
+
+
+def test_codec_falls_back_to_stdlib(codec):
+    # integers beyond 64 bits, non-string keys, and NaN are handled differently (or
+    # not at all) by some backends, and are handed to the stdlib
+    big = 2**70
+    assert codec.loads(str(big).encode()) == big
+    assert json.loads(codec.dumps({"n": big})) == {"n": big}
+    assert json.loads(codec.dumps({1: "a"})) == {"1": "a"}
+    assert math.isnan(codec.loads(b'{"x": NaN}')["x"])
+
+
+def test_codec_raises_value_error_on_invalid_json(codec):
+    for document in (b"", b"<html>", b'{"a": '):
+        with pytest.raises(ValueError):
+            codec.loads(document)
+
+
+class _FakeMsgspecError(Exception):
+    pass
+
+
+def _fake_msgspec():
+    # a stand-in for msgspec, whose decoder fails on every document, and whose
+    # errors (like those of msgspec) are not ValueErrors
+    decoder = mock.Mock()
+    decoder.decode.side_effect = _FakeMsgspecError("malformed")
+    return mock.Mock(
+        json=mock.Mock(Decoder=mock.Mock(return_value=decoder)),
+        EncodeError=_FakeMsgspecError,
+        DecodeError=_FakeMsgspecError,
+    )
+
+
+def test_msgspec_decode_errors_are_value_errors():
+    with mock.patch.dict("sys.modules", {"msgspec": _fake_msgspec()}):
+        codec = _json.load_codec("msgspec")
+
+    # a document which msgspec fails on is handed to the stdlib
+    assert codec.loads(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        codec.loads(b"<html>")
+    with mock.patch.object(_json, "_CODEC", codec):
+        with pytest.raises(ValueError):
+            _json.loads_response(_response(b"<html>502 Bad Gateway</html>"))
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        _json.load_codec("simplejson")
+
+
+class _FailingCodec(_json.JSONCodec):
+    def __init__(self):
+        raise ImportError("no such module")
+
+
+def test_auto_backend_uses_first_installed():
+    with mock.patch.object(_json, "_AUTO_ORDER", ("nosuchmodule", "orjson")):
+        with mock.patch.dict(_json._CODEC_CLASSES, {"nosuchmodule": _FailingCodec}):
+            pytest.importorskip("orjson")
+            assert _json.load_codec("auto").name == "orjson"
+    with mock.patch.object(_json, "_AUTO_ORDER", ()):
+        assert _json.load_codec("auto").name == "stdlib"
+
+
+def test_codec_is_loaded_from_config(monkeypatch):
+    pytest.importorskip("ujson")
+    monkeypatch.setenv("GLOBUS_SDK_JSON_BACKEND", "ujson")
+    with mock.patch.object(_json, "_CODEC", None):
+        assert _json.get_codec().name == "ujson"
+
+
+def test_loads_response(codec):
+    assert _json.loads_response(_response(b'{"a": "\xc3\xa9"}')) == {"a": "é"}
+    # a body in a declared non-UTF-8 encoding is decoded as text
+    latin = _response('{"a": "é"}'.encode("latin-1"), encoding="latin-1")
+    assert _json.loads_response(latin) == {"a": "é"}
+    with pytest.raises(ValueError):
+        _json.loads_response(_response(b"<html>"))
+
+
+def test_json_encoder_uses_codec(codec):
+    req = JSONRequestEncoder().encode(
+        "POST", "https://foo.api.globus.org/", None, {"a": [1, 2]}, {}
+    )
+    prepared = req.prepare()
+    assert prepared.body == codec.dumps({"a": [1, 2]})
+    assert prepared.headers["Content-Type"] == "application/json"
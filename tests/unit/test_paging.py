@@ -1,10 +1,23 @@
+import asyncio
+import csv
+import io
+import itertools
 import json
+import threading
+import time
 from unittest import mock
 
 import pytest
 import requests
 
-from globus_sdk.paging import HasNextPaginator
+from globus_sdk import GlobusSDKUsageError
+from globus_sdk.paging import (
+    HasNextPaginator,
+    LimitOffsetTotalPaginator,
+    NullableMarkerPaginator,
+    Paginator,
+)
+from globus_sdk.paging._export import export_items
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.services.transfer.response import IterableTransferResponse
 
@@ -15,6 +28,9 @@ class PagingSimulator:
     def __init__(self, n) -> None:
         self.n = n  # the number of simulated items
 
+    def make_item(self, i):
+        return {"value": i}
+
     def simulate_get(self, *args, **params):
         """
         Simulates a paginated response from a Globus API get supporting limit,
@@ -28,7 +44,7 @@ class PagingSimulator:
         # fill data field
         data["DATA"] = []
         for i in range(offset, min(self.n, offset + limit)):
-            data["DATA"].append({"value": i})
+            data["DATA"].append(self.make_item(i))
         # fill has_next_page field
         data["has_next_page"] = (offset + limit) < self.n
 
@@ -64,3 +80,551 @@ def test_has_next_paginator(paging_simulator):
     # confirm results
     for item, expected in zip(all_items(), range(N)):
         assert item["value"] == expected
+
+
+def _has_next_paginator(method, page_size=10):
+    return HasNextPaginator(
+        method,
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=1000,
+        page_size=page_size,
+        items_key="DATA",
+        client_args=[],
+        client_kwargs={},
+    )
+
+
+def _wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        threading.Event().wait(0.01)
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "globus-sdk-prefetch"]
+
+
+@pytest.mark.parametrize("depth", [1, 3, 10])
+def test_prefetch_yields_all_pages_in_order(paging_simulator, depth):
+    paginator = _has_next_paginator(paging_simulator.simulate_get).prefetch(depth)
+
+    assert [item["value"] for item in paginator.items()] == list(range(N))
+    _wait_for(lambda: not _prefetch_threads())
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+def test_prefetch_fetches_a_bounded_number_of_pages_ahead(paging_simulator, depth):
+    method = mock.Mock(side_effect=paging_simulator.simulate_get)
+    pages = _has_next_paginator(method, page_size=1).prefetch(depth).pages()
+
+    next(pages)
+    _wait_for(lambda: method.call_count == 1 + depth)
+    threading.Event().wait(0.05)
+    assert method.call_count == 1 + depth
+
+    next(pages)
+    _wait_for(lambda: method.call_count == 2 + depth)
+    pages.close()
+
+
+def test_prefetch_raises_errors_to_the_consumer(paging_simulator):
+    def get(*args, **params):
+        if params.get("offset", 0) >= 20:
+            raise ValueError("page failed")
+        return paging_simulator.simulate_get(*args, **params)
+
+    pages = _has_next_paginator(get).prefetch(3).pages()
+
+    assert [page["offset"] for page in itertools.islice(pages, 2)] == [0, 10]
+    with pytest.raises(ValueError, match="page failed"):
+        next(pages)
+
+
+def test_prefetch_raises_base_exceptions_to_the_consumer(paging_simulator):
+    class Interrupted(BaseException):
+        pass
+
+    def get(*args, **params):
+        if params.get("offset", 0) >= 10:
+            raise Interrupted()
+        return paging_simulator.simulate_get(*args, **params)
+
+    pages = _has_next_paginator(get).prefetch(2).pages()
+
+    assert next(pages)["offset"] == 0
+    with pytest.raises(Interrupted):
+        next(pages)
+    _wait_for(lambda: not _prefetch_threads())
+
+
+def test_prefetch_stops_when_iteration_stops_early(paging_simulator):
+    method = mock.Mock(side_effect=paging_simulator.simulate_get)
+    paginator = _has_next_paginator(method, page_size=1).prefetch(2)
+
+    for _page in paginator:
+        break
+
+    _wait_for(lambda: not _prefetch_threads())
+    # the first page, and the pages fetched ahead of it
+    assert method.call_count <= 3
+
+
+def test_prefetch_rejects_negative_depth(paging_simulator):
+    with pytest.raises(ValueError):
+        _has_next_paginator(paging_simulator.simulate_get).prefetch(-1)
+
+
+class TotalPagingSimulator(PagingSimulator):
+    def __init__(self, n, max_page_size=None) -> None:
+        super().__init__(n)
+        self.max_page_size = max_page_size
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def simulate_get(self, *args, **params):
+        if self.max_page_size is not None:
+            params["limit"] = min(params["limit"], self.max_page_size)
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # give concurrent requests a chance to overlap
+            threading.Event().wait(0.005)
+            response = super().simulate_get(*args, **params)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        response.data["total"] = self.n
+        return response
+
+
+def _total_paginator(method, max_total_results=1000, page_size=10):
+    return LimitOffsetTotalPaginator(
+        method,
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=max_total_results,
+        page_size=page_size,
+        items_key="DATA",
+        client_args=[],
+        client_kwargs={},
+    )
+
+
+@pytest.mark.parametrize("n", [0, 5, 10, 25, 100])
+@pytest.mark.parametrize("max_workers", [1, 2, 4])
+def test_parallel_limit_offset_pages_in_order(n, max_workers):
+    simulator = TotalPagingSimulator(n)
+    paginator = _total_paginator(simulator.simulate_get).parallel(max_workers)
+
+    assert [item["value"] for item in paginator.items()] == list(range(n))
+    assert simulator.max_in_flight <= max_workers
+
+
+def test_parallel_limit_offset_pages_as_completed():
+    simulator = TotalPagingSimulator(100)
+    paginator = _total_paginator(simulator.simulate_get).parallel(4, ordered=False)
+
+    pages = list(paginator)
+
+    assert pages[0]["offset"] == 0
+    assert sorted(page["offset"] for page in pages) == list(range(0, 100, 10))
+    assert 1 < simulator.max_in_flight <= 4
+
+
+def test_parallel_limit_offset_respects_max_total_results():
+    simulator = TotalPagingSimulator(100)
+    method = mock.Mock(side_effect=simulator.simulate_get)
+    paginator = _total_paginator(method, max_total_results=35).parallel(4)
+
+    assert [item["value"] for item in paginator.items()] == list(range(35))
+    windows = sorted(
+        (c.kwargs.get("offset", 0), c.kwargs["limit"]) for c in method.call_args_list
+    )
+    assert windows == [(0, 10), (10, 10), (20, 10), (30, 5)]
+
+
+def test_parallel_limit_offset_follows_capped_page_sizes():
+    # the service returns at most 4 items per page, though 10 are requested
+    simulator = TotalPagingSimulator(25, max_page_size=4)
+    paginator = _total_paginator(simulator.simulate_get).parallel(3)
+
+    assert [item["value"] for item in paginator.items()] == list(range(25))
+
+
+def test_parallel_limit_offset_raises_errors_and_stops():
+    simulator = TotalPagingSimulator(1000)
+
+    def get(*args, **params):
+        if params.get("offset") == 30:
+            raise ValueError("page failed")
+        return simulator.simulate_get(*args, **params)
+
+    method = mock.Mock(side_effect=get)
+    pages = _total_paginator(method).parallel(2).pages()
+
+    assert [page["offset"] for page in itertools.islice(pages, 3)] == [0, 10, 20]
+    with pytest.raises(ValueError, match="page failed"):
+        next(pages)
+    # no more than the pages in flight when the error was raised were requested
+    assert method.call_count <= 6
+
+
+def test_parallel_rejects_invalid_max_workers():
+    with pytest.raises(ValueError):
+        _total_paginator(TotalPagingSimulator(1).simulate_get).parallel(0)
+
+
+async def _collect(async_iterable):
+    return [x async for x in async_iterable]
+
+
+def test_async_pages_and_items(paging_simulator):
+    paginator = _has_next_paginator(paging_simulator.simulate_get)
+
+    pages = asyncio.run(_collect(paginator))
+    assert [page["offset"] for page in pages] == [0, 10, 20]
+
+    paginator = _has_next_paginator(paging_simulator.simulate_get)
+    items = asyncio.run(_collect(paginator.items_async()))
+    assert [item["value"] for item in items] == list(range(N))
+
+
+def test_async_pages_are_fetched_off_of_the_event_loop(paging_simulator):
+    threads = set()
+
+    def get(*args, **params):
+        threads.add(threading.get_ident())
+        return paging_simulator.simulate_get(*args, **params)
+
+    asyncio.run(_collect(_has_next_paginator(get).pages_async()))
+
+    assert threading.get_ident() not in threads
+
+
+def test_async_listings_run_concurrently():
+    simulators = [TotalPagingSimulator(50) for _ in range(3)]
+    in_flight = [0]
+    max_in_flight = [0]
+    lock = threading.Lock()
+
+    def tracked(simulator):
+        def get(*args, **params):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            try:
+                return simulator.simulate_get(*args, **params)
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+
+        return get
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                _collect(_total_paginator(tracked(simulator)).items_async())
+                for simulator in simulators
+            )
+        )
+
+    results = asyncio.run(main())
+
+    assert [[item["value"] for item in r] for r in results] == [list(range(50))] * 3
+    assert max_in_flight[0] > 1
+
+
+def test_async_iteration_raises_errors(paging_simulator):
+    def get(*args, **params):
+        if params.get("offset", 0) >= 10:
+            raise ValueError("page failed")
+        return paging_simulator.simulate_get(*args, **params)
+
+    async def main():
+        pages = []
+        with pytest.raises(ValueError, match="page failed"):
+            async for page in _has_next_paginator(get):
+                pages.append(page)
+        return pages
+
+    assert [page["offset"] for page in asyncio.run(main())] == [0]
+
+
+def test_async_iteration_stops_early(paging_simulator):
+    method = mock.Mock(side_effect=paging_simulator.simulate_get)
+
+    async def main():
+        async for _page in _has_next_paginator(method):
+            break
+
+    asyncio.run(main())
+    assert method.call_count == 1
+
+
+def test_items_async_requires_items_key(paging_simulator):
+    paginator = _has_next_paginator(paging_simulator.simulate_get)
+    paginator.items_key = None
+
+    with pytest.raises(ValueError, match="items_key"):
+        asyncio.run(_collect(paginator.items_async()))
+
+
+class MarkerPagingSimulator(PagingSimulator):
+    def simulate_get(self, *args, marker=None, **params):
+        offset = int(marker or 0)
+        response = super().simulate_get(*args, offset=offset, limit=10)
+        next_offset = offset + 10
+        response.data["marker"] = str(next_offset) if next_offset < self.n else None
+        return response
+
+
+def _marker_paginator(method):
+    return NullableMarkerPaginator(
+        method, items_key="DATA", client_args=[], client_kwargs={}
+    )
+
+
+def test_checkpoint_reports_position_after_each_page():
+    paginator = _marker_paginator(MarkerPagingSimulator(N).simulate_get)
+    assert paginator.checkpoint() == {"marker": None, "exhausted": False}
+
+    checkpoints = [paginator.checkpoint() for _page in paginator]
+
+    assert checkpoints == [
+        {"marker": "10", "exhausted": False},
+        {"marker": "20", "exhausted": False},
+        {"marker": None, "exhausted": True},
+    ]
+
+
+@pytest.mark.parametrize(
+    "make_paginator",
+    [
+        lambda: _marker_paginator(MarkerPagingSimulator(N).simulate_get),
+        lambda: _has_next_paginator(PagingSimulator(N).simulate_get),
+        lambda: _total_paginator(TotalPagingSimulator(N).simulate_get),
+        lambda: _total_paginator(TotalPagingSimulator(N).simulate_get).parallel(2),
+    ],
+)
+def test_resume_from_checkpoint(make_paginator):
+    first = make_paginator()
+    pages = first.pages()
+    seen = [item["value"] for item in next(pages)["DATA"]]
+    pages.close()
+    # the checkpoint survives serialization
+    checkpoint = json.loads(json.dumps(first.checkpoint()))
+
+    resumed = make_paginator().resume(checkpoint)
+    seen.extend(item["value"] for item in resumed.items())
+
+    assert seen == list(range(N))
+    assert resumed.checkpoint()["exhausted"] is True
+    # resuming from the end yields nothing
+    assert list(make_paginator().resume(resumed.checkpoint())) == []
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_on_checkpoint_is_called_once_each_page_is_processed(prefetch):
+    events = []
+    paginator = (
+        _marker_paginator(MarkerPagingSimulator(N).simulate_get)
+        .prefetch(prefetch)
+        .resume(on_checkpoint=lambda c: events.append(("checkpoint", c["marker"])))
+    )
+
+    for page in paginator:
+        events.append(("processed", page["offset"]))
+
+    assert events == [
+        ("processed", 0),
+        ("checkpoint", "10"),
+        ("processed", 10),
+        ("checkpoint", "20"),
+        ("processed", 20),
+        ("checkpoint", None),
+    ]
+
+
+def test_on_checkpoint_is_not_called_for_an_unprocessed_page():
+    checkpoints = []
+    paginator = _marker_paginator(MarkerPagingSimulator(N).simulate_get).resume(
+        on_checkpoint=checkpoints.append
+    )
+
+    with pytest.raises(RuntimeError):
+        for page in paginator:
+            if page["offset"] == 10:
+                raise RuntimeError("worker died")
+
+    assert checkpoints == [{"marker": "10", "exhausted": False}]
+
+
+@pytest.mark.parametrize("checkpoint", [{}, {"marker": "10"}, {"offset": 10}])
+def test_resume_rejects_invalid_checkpoints(checkpoint):
+    paginator = _marker_paginator(MarkerPagingSimulator(N).simulate_get)
+
+    with pytest.raises(ValueError, match="Invalid checkpoint"):
+        paginator.resume(checkpoint)
+
+
+class NestedPagingSimulator(PagingSimulator):
+    def make_item(self, i):
+        owner = {"id": i, "name": f"user{i}"} if i % 2 else None
+        return {"value": i, "owner": owner, "tags": ["a", "b"]}
+
+
+@pytest.mark.parametrize("suffix", [".ndjson", ".jsonl"])
+def test_export_items_to_ndjson(tmp_path, suffix):
+    path = tmp_path / f"items{suffix}"
+    paginator = _has_next_paginator(NestedPagingSimulator(N).simulate_get)
+
+    assert paginator.export_items(path) == N
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        NestedPagingSimulator(N).make_item(i) for i in range(N)
+    ]
+
+
+def test_export_items_with_fields_and_flattening(tmp_path):
+    path = tmp_path / "items.ndjson"
+    paginator = _has_next_paginator(NestedPagingSimulator(N).simulate_get)
+
+    paginator.export_items(path, fields=["owner.name", "value"])
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows[:2] == [
+        {"owner.name": None, "value": 0},
+        {"owner.name": "user1", "value": 1},
+    ]
+
+    paginator = _has_next_paginator(NestedPagingSimulator(N).simulate_get)
+    paginator.export_items(path, flatten=True, separator="/")
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows[1] == {
+        "value": 1,
+        "owner/id": 1,
+        "owner/name": "user1",
+        "tags": ["a", "b"],
+    }
+
+
+def test_export_items_to_csv(tmp_path):
+    path = tmp_path / "items.csv"
+    paginator = _has_next_paginator(NestedPagingSimulator(N).simulate_get)
+
+    assert paginator.export_items(path, flatten=True) == N
+
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    # the columns are the fields of the items of the first page
+    assert rows[0] == ["value", "owner", "tags", "owner.id", "owner.name"]
+    assert rows[1][:2] + rows[1][3:] == ["0", "", "", ""]
+    assert rows[2][:2] + rows[2][3:] == ["1", "", "1", "user1"]
+    # nested values are written as JSON
+    assert json.loads(rows[1][2]) == json.loads(rows[2][2]) == ["a", "b"]
+    assert len(rows) == N + 1
+
+
+def test_export_items_to_csv_after_an_empty_page():
+    buffer = io.StringIO()
+    pages = [{"DATA": []}, {"DATA": [{"a": 1, "b": 2}]}, {"DATA": [{"a": 3}]}]
+
+    assert export_items(pages, "DATA", buffer, format="csv") == 2
+
+    # the columns are taken from the first page which has items
+    assert buffer.getvalue().splitlines() == ["a,b", "1,2", "3,"]
+
+
+def test_export_items_to_csv_rejects_fields_after_the_first_page():
+    buffer = io.StringIO()
+    pages = [{"DATA": [{"a": 1}]}, {"DATA": [{"a": 2, "b": 3}]}]
+
+    with pytest.raises(GlobusSDKUsageError, match="'b'"):
+        export_items(pages, "DATA", buffer, format="csv")
+
+    # with explicit fields, other fields are not written
+    buffer = io.StringIO()
+    assert export_items(pages, "DATA", buffer, format="csv", fields=["a"]) == 2
+    assert buffer.getvalue().splitlines() == ["a", "1", "2"]
+
+
+def test_export_items_to_a_file_object(paging_simulator):
+    buffer = io.StringIO()
+
+    _has_next_paginator(paging_simulator.simulate_get).export_items(
+        buffer, format="csv"
+    )
+
+    assert buffer.getvalue().splitlines() == ["value"] + [str(i) for i in range(N)]
+    # file objects which are passed in are not closed
+    assert not buffer.closed
+
+
+def test_export_items_writes_each_page_as_it_is_fetched(tmp_path, paging_simulator):
+    path = tmp_path / "items.ndjson"
+    lines_before_each_get = []
+
+    def get(*args, **params):
+        if path.exists():
+            lines_before_each_get.append(len(path.read_text().splitlines()))
+        return paging_simulator.simulate_get(*args, **params)
+
+    _has_next_paginator(get).export_items(path)
+
+    assert lines_before_each_get == [0, 10, 20]
+
+
+def test_export_items_to_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "items.parquet"
+    paginator = _has_next_paginator(NestedPagingSimulator(N).simulate_get)
+
+    assert paginator.export_items(path, fields=["value", "owner.name"]) == N
+
+    parquet_file = pq.ParquetFile(path)
+    # each page is a row group
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().to_pylist()[:2] == [
+        {"value": 0, "owner.name": None},
+        {"value": 1, "owner.name": "user1"},
+    ]
+
+
+def test_export_items_to_parquet_requires_pyarrow(tmp_path, paging_simulator):
+    paginator = _has_next_paginator(paging_simulator.simulate_get)
+
+    with mock.patch.dict("sys.modules", {"pyarrow": None}):
+        with pytest.raises(ImportError, match="requires the 'pyarrow' library"):
+            paginator.export_items(tmp_path / "items.parquet")
+
+
+@pytest.mark.parametrize(
+    "destination, format",
+    [("items.txt", None), (io.StringIO(), None), ("items.csv", "xml")],
+)
+def test_export_items_rejects_unknown_formats(tmp_path, destination, format):
+    if isinstance(destination, str):
+        destination = tmp_path / destination
+    paginator = _has_next_paginator(PagingSimulator(N).simulate_get)
+
+    with pytest.raises(ValueError):
+        paginator.export_items(destination, format=format)
+
+
+def test_export_items_requires_items_key(tmp_path, paging_simulator):
+    paginator = _has_next_paginator(paging_simulator.simulate_get)
+    paginator.items_key = None
+
+    with pytest.raises(ValueError, match="'items_key' is not set"):
+        paginator.export_items(tmp_path / "items.ndjson")
+
+
+def test_paginator_subclass_must_support_checkpoints():
+    class NoPositionPaginator(Paginator):
+        def pages(self):
+            yield from ()
+
+    with pytest.raises(TypeError, match="_get_position"):
+        NoPositionPaginator(lambda: None, client_args=(), client_kwargs={})
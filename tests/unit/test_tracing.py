@@ -0,0 +1,179 @@
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+import globus_sdk
+from globus_sdk import _tracing
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.authorizers.renewing import RenewingAuthorizer
+from globus_sdk.paging import MarkerPaginator, has_paginator
+
+TASK_ID = "a5d1d3ca-3a47-11ef-9c56-0242ac110002"
+URL = f"https://foo.api.globus.org/v1/task/{TASK_ID}"
+
+
+class TracedClient(globus_sdk.BaseClient):
+    service_name = "foo"
+    base_path = "/v1/"
+    scopes = globus_sdk.scopes.ScopeBuilder("foo.api.globus.org")
+
+    @has_paginator(MarkerPaginator, items_key="data")
+    def list_things(self, *, marker=None):
+        return self.get("/things", query_params={"marker": marker} if marker else None)
+
+
+class MockRenewer(RenewingAuthorizer):
+    def _get_token_response(self):
+        return mock.Mock()
+
+    def _extract_token_data(self, res):
+        return {"expires_at_seconds": int(time.time()) + 1000, "access_token": "tok"}
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    pytest.importorskip("opentelemetry.trace")
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(_tracing, "_TRACER", provider.get_tracer("globus_sdk"))
+    return exporter
+
+
+@pytest.fixture
+def client():
+    return TracedClient()
+
+
+def _by_name(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+@pytest.mark.parametrize(
+    "url, template",
+    [
+        (URL, "/v1/task/{id}"),
+        ("https://foo.api.globus.org/v1/endpoint/123/acl", "/v1/endpoint/{id}/acl"),
+        ("https://foo.api.globus.org/v1/things?marker=abc", "/v1/things"),
+    ],
+)
+def test_route_template(url, template):
+    assert _tracing.route_template(url) == template
+
+
+def test_request_span_has_attempt_child(client, spans):
+    load_response(RegisteredResponse(path=URL, json={"status": "ACTIVE"}))
+
+    client.get(f"/task/{TASK_ID}")
+
+    by_name = _by_name(spans)
+    request_span = by_name["GET /v1/task/{id}"]
+    attempt_span = by_name["GET"]
+    assert attempt_span.parent.span_id == request_span.context.span_id
+    assert request_span.attributes["globus.resource_server"] == "foo.api.globus.org"
+    assert request_span.attributes["http.response.status_code"] == 200
+    assert request_span.attributes["globus.retry_count"] == 0
+    assert attempt_span.attributes["url.full"] == URL
+    assert attempt_span.attributes["http.response.status_code"] == 200
+    assert attempt_span.end_time >= attempt_span.start_time
+
+
+def test_retries_are_child_spans(client, spans):
+    load_response(RegisteredResponse(path=URL, status=503, body="oops"))
+    load_response(RegisteredResponse(path=URL, json={"status": "ACTIVE"}))
+
+    client.get(f"/task/{TASK_ID}")
+
+    request_span = _by_name(spans)["GET /v1/task/{id}"]
+    attempt_spans = [s for s in spans.get_finished_spans() if s.name == "GET"]
+    assert request_span.attributes["globus.retry_count"] == 1
+    assert len(attempt_spans) == 2
+    assert attempt_spans[0].attributes["error.type"] == "503"
+    assert attempt_spans[0].attributes["globus.retry_reason"] == (
+        "default_check_retry_after_header"
+    )
+    assert attempt_spans[1].attributes["http.request.resend_count"] == 1
+
+
+def test_error_response_marks_span_as_error(client, spans):
+    load_response(RegisteredResponse(path=URL, status=404, json={"code": "NotFound"}))
+
+    with pytest.raises(globus_sdk.GlobusAPIError):
+        client.get(f"/task/{TASK_ID}")
+
+    request_span = _by_name(spans)["GET /v1/task/{id}"]
+    assert not request_span.status.is_ok
+    assert request_span.attributes["http.response.status_code"] == 404
+    assert request_span.events[0].name == "exception"
+
+
+def test_async_request_span(client, spans):
+    load_response(RegisteredResponse(path=URL, json={"status": "ACTIVE"}))
+
+    asyncio.run(client.get_async(f"/task/{TASK_ID}"))
+
+    by_name = _by_name(spans)
+    assert by_name["GET"].parent.span_id == by_name["GET /v1/task/{id}"].context.span_id
+
+
+def test_pages_span(client, spans):
+    things_url = "https://foo.api.globus.org/v1/things"
+    load_response(
+        RegisteredResponse(
+            path=things_url,
+            json={"data": [1], "has_next_page": True, "marker": "m1"},
+        )
+    )
+    load_response(
+        RegisteredResponse(path=things_url, json={"data": [2], "has_next_page": False})
+    )
+
+    assert list(client.paginated.list_things().items()) == [1, 2]
+
+    pages_span = _by_name(spans)["TracedClient.list_things pages"]
+    request_spans = [
+        s for s in spans.get_finished_spans() if s.name == "GET /v1/things"
+    ]
+    assert pages_span.attributes["globus.page_count"] == 2
+    assert len(request_spans) == 2
+    assert all(s.parent.span_id == pages_span.context.span_id for s in request_spans)
+
+
+def test_token_refresh_span(spans):
+    MockRenewer()
+
+    assert "MockRenewer refresh" in _by_name(spans)
+
+
+def test_run_many_calls_share_the_callers_trace(client, spans):
+    load_response(RegisteredResponse(path=URL, json={"status": "ACTIVE"}))
+
+    with _tracing.span("parent") as parent:
+        client.run_many([lambda: client.get(f"/task/{TASK_ID}")] * 3)
+
+    request_spans = [
+        s for s in spans.get_finished_spans() if s.name == "GET /v1/task/{id}"
+    ]
+    assert len(request_spans) == 3
+    assert all(
+        s.parent.span_id == parent.get_span_context().span_id for s in request_spans
+    )
+
+
+def test_no_tracing_without_opentelemetry(client, monkeypatch):
+    monkeypatch.setattr(_tracing, "_TRACE_MODULE", False)
+    monkeypatch.setattr(_tracing, "_TRACER", None)
+    load_response(RegisteredResponse(path=URL, json={"status": "ACTIVE"}))
+
+    assert _tracing.get_tracer() is None
+    assert client.get(f"/task/{TASK_ID}")["status"] == "ACTIVE"
+    with _tracing.span("nothing") as nothing:
+        assert nothing is None
@@ -0,0 +1,26 @@
+from unittest import mock
+
+import pytest
+
+
+class FakeClock:
+    """
+    A stand-in for ``time.monotonic``, whose time only moves when a test sets or
+    advances ``now``.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with mock.patch("time.monotonic", fake):
+        yield fake
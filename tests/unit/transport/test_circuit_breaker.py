@@ -0,0 +1,146 @@
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.transport import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RequestsTransport,
+    RetryCheckResult,
+    RetryContext,
+)
+from tests.common import make_requests_response
+
+URL = "https://foo.api.globus.org/bar"
+
+
+def _ctx(status=None, exception=None, url=URL):
+    ctx = RetryContext(0)
+    if status is not None:
+        ctx.response = make_requests_response(status, url=url)
+    else:
+        ctx.exception = exception
+    return ctx
+
+
+def _open_circuit(breaker, url=URL):
+    for _ in range(breaker.minimum_requests):
+        breaker.record(url, _ctx(503, url=url))
+
+
+def test_circuit_opens_after_failure_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=0.5, minimum_requests=4)
+
+    breaker.record(URL, _ctx(200))
+    breaker.record(URL, _ctx(500))
+    breaker.record(URL, _ctx(200))
+    assert breaker.state(URL) is CircuitState.closed
+    breaker.record(URL, _ctx(exception=requests.ConnectionError()))
+    assert breaker.state(URL) is CircuitState.open
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request(URL)
+    assert excinfo.value.host == "foo.api.globus.org"
+    assert excinfo.value.retry_after == breaker.reset_timeout
+
+
+def test_circuits_are_per_host(clock):
+    breaker = CircuitBreaker(minimum_requests=2)
+    _open_circuit(breaker)
+
+    assert breaker.state(URL) is CircuitState.open
+    assert breaker.state("https://other.api.globus.org/") is CircuitState.closed
+    breaker.before_request("https://other.api.globus.org/")
+
+
+def test_non_failure_statuses_do_not_open_circuit(clock):
+    breaker = CircuitBreaker(minimum_requests=2)
+    for status in (400, 401, 404, 429):
+        breaker.record(URL, _ctx(status))
+    assert breaker.state(URL) is CircuitState.closed
+
+
+def test_old_outcomes_leave_the_window(clock):
+    breaker = CircuitBreaker(failure_threshold=0.5, minimum_requests=2, window=10)
+    breaker.record(URL, _ctx(500))
+    clock.now += 11
+    breaker.record(URL, _ctx(500))
+    assert breaker.state(URL) is CircuitState.closed
+
+
+def test_half_open_probe_success_closes_circuit(clock):
+    breaker = CircuitBreaker(minimum_requests=2, reset_timeout=30)
+    _open_circuit(breaker)
+
+    clock.now += 30
+    assert breaker.state(URL) is CircuitState.half_open
+    # one probe is allowed, but not a second
+    breaker.before_request(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    breaker.record(URL, _ctx(200))
+    assert breaker.state(URL) is CircuitState.closed
+    breaker.before_request(URL)
+
+
+def test_half_open_probe_failure_reopens_circuit(clock):
+    breaker = CircuitBreaker(minimum_requests=2, reset_timeout=30)
+    _open_circuit(breaker)
+
+    clock.now += 30
+    breaker.before_request(URL)
+    breaker.record(URL, _ctx(502))
+    assert breaker.state(URL) is CircuitState.open
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request(URL)
+    assert excinfo.value.retry_after == 30
+
+
+def test_retry_check_stops_retries_on_open_circuit(clock):
+    breaker = CircuitBreaker(minimum_requests=2)
+
+    assert breaker(_ctx(503)) is RetryCheckResult.no_decision
+    _open_circuit(breaker)
+    assert breaker(_ctx(503)) is RetryCheckResult.do_not_retry
+
+    err = requests.ConnectionError(request=requests.Request("GET", URL).prepare())
+    assert breaker(_ctx(exception=err)) is RetryCheckResult.do_not_retry
+
+
+def test_transport_registers_breaker_first():
+    breaker = CircuitBreaker()
+    transport = RequestsTransport(circuit_breaker=breaker)
+    assert transport.retry_checks[0] is breaker
+
+
+def test_transport_fails_fast_when_circuit_is_open(mocksleep):
+    breaker = CircuitBreaker(minimum_requests=3)
+    transport = RequestsTransport(circuit_breaker=breaker)
+    for _ in range(6):
+        load_response(RegisteredResponse(path=URL, status=503, body="Uh-oh!"))
+
+    # the third failure opens the circuit, which stops retrying
+    res = transport.request("GET", URL)
+    assert res.status_code == 503
+    assert len(responses.calls) == 3
+    assert mocksleep.call_count == 2
+
+    # and now requests fail without being sent
+    with pytest.raises(CircuitOpenError):
+        transport.request("GET", URL)
+    assert len(responses.calls) == 3
+
+
+def test_client_raises_circuit_open_error():
+    breaker = CircuitBreaker(minimum_requests=1)
+    _open_circuit(breaker, url="https://transfer.api.globus.org/v0.10/task/foo")
+    tc = globus_sdk.TransferClient(transport_params={"circuit_breaker": breaker})
+
+    with pytest.raises(CircuitOpenError):
+        tc.get_task("foo")
+    assert len(responses.calls) == 0
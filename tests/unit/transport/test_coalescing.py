@@ -0,0 +1,173 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+import globus_sdk
+from globus_sdk.authorizers import AccessTokenAuthorizer
+from globus_sdk.transport import (
+    AdaptiveRateLimiter,
+    RequestCoalescer,
+    RequestsTransport,
+)
+
+URL = "https://foo.api.globus.org/bar"
+
+
+class BlockingSend:
+    """
+    A fake for ``Session.send`` which blocks until released, and then returns a
+    response or raises an error.
+    """
+
+    def __init__(self, error=None):
+        self.release = threading.Event()
+        self.prepared_requests = []
+        self.error = error
+
+    def __call__(self, prepared, **kwargs):
+        self.prepared_requests.append(prepared)
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'{{"url": "{prepared.url}"}}'.encode()
+        response.raw = mock.Mock()
+        return response
+
+
+def _wait_for_waiters(coalescer, count):
+    for _ in range(500):
+        with coalescer._lock:
+            if sum(call.waiters for call in coalescer._calls.values()) >= count:
+                return
+        time.sleep(0.01)
+    raise AssertionError("callers did not join the in-flight request")
+
+
+def _run_concurrently(func, count):
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=count)
+    return executor, [executor.submit(func) for _ in range(count)]
+
+
+@pytest.fixture
+def fake_send():
+    return BlockingSend()
+
+
+@pytest.fixture
+def coalescer():
+    return RequestCoalescer()
+
+
+def _transport(fake_send, coalescer, **kwargs):
+    transport = RequestsTransport(request_coalescer=coalescer, **kwargs)
+    transport.session.send = fake_send
+    return transport
+
+
+def test_identical_requests_share_one_call(fake_send, coalescer):
+    transport = _transport(fake_send, coalescer)
+
+    executor, futures = _run_concurrently(lambda: transport.request("GET", URL), 5)
+    _wait_for_waiters(coalescer, 4)
+    fake_send.release.set()
+    results = [f.result() for f in futures]
+    executor.shutdown()
+
+    assert len(fake_send.prepared_requests) == 1
+    assert all(r.json() == {"url": URL} for r in results)
+    # each caller has its own response object
+    assert len({id(r) for r in results}) == 5
+    assert coalescer._calls == {}
+
+
+def test_different_identities_are_not_coalesced(fake_send, coalescer):
+    transport = _transport(fake_send, coalescer)
+    fake_send.release.set()
+
+    def call(token):
+        return transport.request("GET", URL, authorizer=AccessTokenAuthorizer(token))
+
+    call("tok1")
+    call("tok2")
+    assert len(fake_send.prepared_requests) == 2
+    keys = {coalescer.get_key(p) for p in fake_send.prepared_requests}
+    assert len(keys) == 2
+
+
+def test_unsafe_methods_are_not_coalesced(fake_send, coalescer):
+    transport = _transport(fake_send, coalescer)
+
+    executor, futures = _run_concurrently(
+        lambda: transport.request("POST", URL, data={}), 3
+    )
+    for _ in range(500):
+        if len(fake_send.prepared_requests) == 3:
+            break
+        time.sleep(0.01)
+    fake_send.release.set()
+    for f in futures:
+        f.result()
+    executor.shutdown()
+    assert len(fake_send.prepared_requests) == 3
+
+
+def test_error_is_shared_by_all_callers(coalescer):
+    fake_send = BlockingSend(error=requests.ConnectionError("oops"))
+    transport = _transport(fake_send, coalescer, max_retries=0)
+
+    executor, futures = _run_concurrently(lambda: transport.request("GET", URL), 3)
+    _wait_for_waiters(coalescer, 2)
+    fake_send.release.set()
+    for f in futures:
+        with pytest.raises(globus_sdk.NetworkError):
+            f.result()
+    executor.shutdown()
+    assert len(fake_send.prepared_requests) == 1
+
+
+def test_waiters_are_not_paced_or_recorded(fake_send, coalescer):
+    limiter = mock.Mock(spec=AdaptiveRateLimiter)
+    transport = _transport(fake_send, coalescer, rate_limiter=limiter)
+
+    executor, futures = _run_concurrently(lambda: transport.request("GET", URL), 5)
+    _wait_for_waiters(coalescer, 4)
+    fake_send.release.set()
+    for f in futures:
+        f.result()
+    executor.shutdown()
+
+    # only the request which was sent took a token and reported its outcome
+    assert limiter.acquire.call_count == 1
+    assert limiter.record_response.call_count == 1
+    snapshot = transport.metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["attempts"] == 1
+
+
+def test_async_identical_requests_share_one_call(fake_send, coalescer):
+    transport = _transport(fake_send, coalescer)
+
+    async def main():
+        tasks = [
+            asyncio.ensure_future(transport.request_async("GET", URL)) for _ in range(5)
+        ]
+        for _ in range(500):
+            with coalescer._lock:
+                if sum(call.waiters for call in coalescer._calls.values()) >= 4:
+                    break
+            await asyncio.sleep(0.01)
+        fake_send.release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(main())
+    assert len(fake_send.prepared_requests) == 1
+    assert all(r.json() == {"url": URL} for r in results)
+    assert len({id(r) for r in results}) == 5
+    assert transport.metrics.snapshot()["attempts"] == 1
@@ -0,0 +1,95 @@
+import gzip
+import json
+
+import pytest
+import requests
+import responses
+
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.transport import JSONRequestEncoder, RequestsTransport
+from globus_sdk.transport._compression import compress_request_body
+
+URL = "https://foo.api.globus.org/bar"
+DATA = {"DATA": [{"source_path": f"/src/file{i}"} for i in range(1000)]}
+DOCUMENT = json.dumps(DATA).encode()
+
+
+def _prepare(stream=False, data=DATA):
+    encoder = JSONRequestEncoder(stream=stream)
+    return encoder.encode("POST", URL, params={}, data=data, headers={}).prepare()
+
+
+def _body_bytes(prepared):
+    if isinstance(prepared.body, bytes):
+        return prepared.body
+    return b"".join(prepared.body)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_body_over_threshold_is_compressed(stream):
+    prepared = _prepare(stream=stream)
+    compress_request_body(prepared, threshold=1024, level=6)
+
+    assert prepared.headers["Content-Encoding"] == "gzip"
+    compressed = _body_bytes(prepared)
+    assert len(compressed) < len(DOCUMENT) / 5
+    assert gzip.decompress(compressed) == DOCUMENT
+    if stream:
+        assert "Content-Length" not in prepared.headers
+        # the compressed stream can be sent again
+        assert gzip.decompress(_body_bytes(prepared)) == DOCUMENT
+    else:
+        assert prepared.headers["Content-Length"] == str(len(compressed))
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_body_under_threshold_is_not_compressed(stream):
+    prepared = _prepare(stream=stream, data={"x": 1})
+    compress_request_body(prepared, threshold=1024, level=6)
+
+    assert "Content-Encoding" not in prepared.headers
+    assert "Transfer-Encoding" not in prepared.headers
+    assert prepared.body == b'{"x": 1}'
+    assert prepared.headers["Content-Length"] == "8"
+
+
+def test_single_use_iterator_body_is_compressed():
+    chunks = [DOCUMENT[i : i + 100] for i in range(0, len(DOCUMENT), 100)]
+    prepared = requests.Request("POST", URL, data=iter(chunks)).prepare()
+    compress_request_body(prepared, threshold=1024, level=6)
+
+    assert prepared.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(_body_bytes(prepared)) == DOCUMENT
+
+
+def test_already_encoded_body_is_not_compressed():
+    prepared = requests.Request(
+        "POST", URL, data=DOCUMENT, headers={"Content-Encoding": "br"}
+    ).prepare()
+    compress_request_body(prepared, threshold=0, level=6)
+    assert prepared.body == DOCUMENT
+
+
+def test_transport_compresses_bodies(mocksleep):
+    transport = RequestsTransport(request_compression_threshold=1024)
+    load_response(RegisteredResponse(path=URL, method="POST", status=500, body=""))
+    load_response(RegisteredResponse(path=URL, method="POST", json={}))
+    load_response(RegisteredResponse(path=URL, json={}))
+    transport.request("POST", URL, data=DATA)
+    transport.request("GET", URL, query_params={"x": 1})
+
+    # the compressed body was sent on both attempts
+    assert len(responses.calls) == 3
+    for call in responses.calls[:2]:
+        assert call.request.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(call.request.body) == DOCUMENT
+    assert "Content-Encoding" not in responses.calls[2].request.headers
+
+
+def test_transport_does_not_compress_by_default():
+    transport = RequestsTransport()
+    load_response(RegisteredResponse(path=URL, method="POST", json={}))
+    transport.request("POST", URL, data=DATA)
+
+    assert "Content-Encoding" not in responses.calls[0].request.headers
+    assert responses.calls[0].request.body == DOCUMENT
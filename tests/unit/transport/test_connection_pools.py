@@ -0,0 +1,81 @@
+import concurrent.futures
+from unittest import mock
+
+import pytest
+
+from globus_sdk.transport import ConnectionPoolRegistry, RequestsTransport
+
+
+def test_sessions_are_keyed_by_host():
+    registry = ConnectionPoolRegistry()
+
+    a1 = registry.get_session("https://a.example.org/foo")
+    a2 = registry.get_session("https://A.example.org/bar?x=1")
+    b = registry.get_session("https://b.example.org/foo")
+    a_http = registry.get_session("http://a.example.org/foo")
+
+    assert a1 is a2
+    assert a1 is not b
+    assert a1 is not a_http
+
+
+def test_pool_sizes_are_applied_to_adapters():
+    registry = ConnectionPoolRegistry(pool_connections=3, pool_maxsize=25)
+    session = registry.get_session("https://a.example.org/")
+
+    adapter = session.get_adapter("https://a.example.org/")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 25
+    assert session.get_adapter("http://a.example.org/")._pool_maxsize == 25
+
+
+def test_concurrent_lookups_create_one_session():
+    registry = ConnectionPoolRegistry()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(
+            executor.map(
+                lambda _: registry.get_session("https://a.example.org/"), range(64)
+            )
+        )
+
+    assert all(s is sessions[0] for s in sessions)
+
+
+def test_default_registry_is_shared():
+    assert ConnectionPoolRegistry.get_default() is ConnectionPoolRegistry.get_default()
+
+
+def test_close_closes_sessions_and_allows_reuse():
+    registry = ConnectionPoolRegistry()
+    session = registry.get_session("https://a.example.org/")
+
+    with mock.patch.object(session, "close") as mock_close:
+        registry.close()
+        mock_close.assert_called_once_with()
+
+    assert registry.get_session("https://a.example.org/") is not session
+
+
+@pytest.mark.parametrize("use_registry", (True, False))
+def test_transport_session_selection(use_registry):
+    registry = ConnectionPoolRegistry()
+    transport = RequestsTransport(connection_pools=registry if use_registry else None)
+
+    session = transport._get_session("https://a.example.org/foo")
+    if use_registry:
+        assert session is registry.get_session("https://a.example.org/")
+        # no session of the transport's own is created
+        assert transport._session is None
+    else:
+        assert session is transport.session
+
+
+def test_transport_close_does_not_close_shared_sessions():
+    registry = ConnectionPoolRegistry()
+    transport = RequestsTransport(connection_pools=registry)
+    shared_session = transport._get_session("https://a.example.org/foo")
+
+    with mock.patch.object(shared_session, "close") as mock_close:
+        transport.close()
+        mock_close.assert_not_called()
@@ -0,0 +1,161 @@
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from globus_sdk.authorizers import AccessTokenAuthorizer
+from globus_sdk.transport import HedgingPolicy, RequestsTransport, RetryBudget
+
+URL = "https://foo.api.globus.org/bar"
+
+
+def _response(body):
+    r = requests.Response()
+    r.status_code = 200
+    r._content = body.encode()
+    r.raw = mock.Mock()
+    return r
+
+
+class FakeSend:
+    """
+    A fake for ``Session.send`` whose first call blocks until released, and whose
+    later calls return immediately.
+    """
+
+    def __init__(self, primary_error=None, hedge_error=None):
+        self.release = threading.Event()
+        self.prepared_requests = []
+        self.responses = []
+        self.primary_error = primary_error
+        self.hedge_error = hedge_error
+        self._lock = threading.Lock()
+
+    def __call__(self, prepared, **kwargs):
+        with self._lock:
+            self.prepared_requests.append(prepared)
+            is_primary = len(self.prepared_requests) == 1
+        if is_primary:
+            self.release.wait(5)
+            error, body = self.primary_error, "primary"
+        else:
+            error, body = self.hedge_error, "hedge"
+        if error is not None:
+            raise error
+        response = _response(body)
+        self.responses.append(response)
+        return response
+
+
+@pytest.fixture
+def fake_send():
+    return FakeSend()
+
+
+def _transport(fake_send, policy, **kwargs):
+    transport = RequestsTransport(hedging=policy, max_retries=0, **kwargs)
+    transport.session.send = fake_send
+    return transport
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"percentile": 0}, {"percentile": 100}, {"delay": 1, "percentile": -1}],
+)
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        HedgingPolicy(**kwargs)
+
+
+def test_policy_delay_from_percentile():
+    policy = HedgingPolicy(percentile=90, min_samples=10)
+    for i in range(1, 10):
+        policy.record_latency(i / 10)
+    # too few samples, and there is no fixed delay
+    assert policy.get_delay() is None
+    policy.record_latency(1.0)
+    assert policy.get_delay() == 0.9
+
+    fixed = HedgingPolicy(delay=0.5, percentile=90, min_samples=10)
+    assert fixed.get_delay() == 0.5
+
+
+def test_policy_applies_to_methods():
+    policy = HedgingPolicy(delay=1)
+    assert policy.applies_to("GET")
+    assert policy.applies_to("get")
+    assert not policy.applies_to("POST")
+    assert HedgingPolicy(delay=1, methods=("GET", "post")).applies_to("POST")
+
+
+def test_fast_response_is_not_hedged(fake_send):
+    fake_send.release.set()
+    transport = _transport(fake_send, HedgingPolicy(delay=5))
+
+    res = transport.request("GET", URL)
+    assert res.text == "primary"
+    assert len(fake_send.prepared_requests) == 1
+
+
+def test_slow_response_is_hedged(fake_send):
+    policy = HedgingPolicy(delay=0.01)
+    transport = _transport(fake_send, policy)
+    authorizer = AccessTokenAuthorizer("sometoken")
+
+    res = transport.request("GET", URL, authorizer=authorizer)
+    assert res.text == "hedge"
+    # both copies of the request were authorized
+    assert len(fake_send.prepared_requests) == 2
+    for prepared in fake_send.prepared_requests:
+        assert prepared.headers["Authorization"] == "Bearer sometoken"
+
+    # once the slow primary completes, its response is released
+    fake_send.release.set()
+    policy.get_executor().shutdown(wait=True)
+    loser = fake_send.responses[1]
+    assert loser.text == "primary"
+    loser.raw.release_conn.assert_called_once()
+
+
+def test_unhedged_method_is_sent_directly(fake_send):
+    fake_send.release.set()
+    policy = HedgingPolicy(delay=0)
+    transport = _transport(fake_send, policy)
+
+    transport.request("POST", URL, data={"x": 1})
+    assert len(fake_send.prepared_requests) == 1
+    assert policy._executor is None
+
+
+def test_error_from_hedge_waits_for_primary():
+    fake_send = FakeSend(hedge_error=requests.ConnectionError("oops"))
+    transport = _transport(fake_send, HedgingPolicy(delay=0.01))
+
+    threading.Timer(0.05, fake_send.release.set).start()
+    res = transport.request("GET", URL)
+    assert res.text == "primary"
+
+
+def test_error_from_both_copies_raises_primary_error():
+    fake_send = FakeSend(
+        primary_error=requests.ConnectTimeout("primary"),
+        hedge_error=requests.ConnectionError("hedge"),
+    )
+    transport = _transport(fake_send, HedgingPolicy(delay=0.01))
+
+    threading.Timer(0.05, fake_send.release.set).start()
+    with pytest.raises(requests.ConnectTimeout):
+        transport._send(
+            transport._encode("GET", URL), allow_redirects=True, stream=False
+        )
+
+
+def test_exhausted_retry_budget_prevents_hedging(fake_send):
+    budget = RetryBudget(ratio=0, min_retries=0)
+    transport = _transport(fake_send, HedgingPolicy(delay=0.01), retry_budget=budget)
+
+    threading.Timer(0.05, fake_send.release.set).start()
+    res = transport.request("GET", URL)
+    assert res.text == "primary"
+    assert len(fake_send.prepared_requests) == 1
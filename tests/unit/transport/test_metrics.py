@@ -0,0 +1,246 @@
+import asyncio
+import pickle
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.transport import (
+    AttemptMetrics,
+    RequestsTransport,
+    RetryBudget,
+    TransportMetrics,
+)
+
+URL = "https://foo.api.globus.org/bar"
+
+
+def _attempt(**kwargs):
+    params = {
+        "method": "GET",
+        "url": URL,
+        "host": "foo.api.globus.org",
+        "attempt": 0,
+        "status": 200,
+        "error": None,
+        "time_to_first_byte": 0.01,
+        "total_time": 0.02,
+        "request_bytes": None,
+        "response_bytes": 10,
+        "retry_reason": None,
+        "sleep": None,
+    }
+    params.update(kwargs)
+    return AttemptMetrics(**params)
+
+
+@pytest.fixture
+def attempts():
+    return []
+
+
+@pytest.fixture
+def transport(attempts):
+    transport = RequestsTransport()
+    transport.metrics.add_listener(attempts.append)
+    return transport
+
+
+def test_successful_request_is_recorded(transport, attempts):
+    load_response(RegisteredResponse(path=URL, method="POST", json={"x": 1}))
+
+    transport.request("POST", URL, data={"y": 2})
+
+    (attempt,) = attempts
+    assert attempt.method == "POST"
+    assert attempt.url == URL
+    assert attempt.host == "foo.api.globus.org"
+    assert attempt.status == 200
+    assert attempt.error is None
+    assert attempt.request_bytes == len(b'{"y": 2}')
+    assert attempt.response_bytes == len(b'{"x": 1}')
+    assert attempt.time_to_first_byte is not None
+    assert attempt.total_time >= 0
+    assert not attempt.retried
+
+    snapshot = transport.metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["attempts"] == 1
+    assert snapshot["retries"] == 0
+    assert snapshot["status_codes"] == {200: 1}
+    assert snapshot["hosts"]["foo.api.globus.org"]["latency"]["count"] == 1
+
+
+def test_text_request_bytes_are_the_size_of_the_encoded_body(transport, attempts):
+    load_response(RegisteredResponse(path=URL, method="POST", json={"x": 1}))
+
+    transport.request("POST", URL, data="héllo ✓", encoding="text")
+
+    (attempt,) = attempts
+    assert attempt.request_bytes == len("héllo ✓".encode("utf-8"))
+
+
+def test_retries_are_recorded(transport, attempts, mocksleep):
+    load_response(RegisteredResponse(path=URL, status=500, body="Uh-oh!"))
+    load_response(RegisteredResponse(path=URL, json={"x": 1}))
+
+    transport.request("GET", URL)
+
+    first, second = attempts
+    assert first.status == 500
+    assert first.retry_reason == "default_check_transient_error"
+    assert first.retried
+    assert first.sleep == mocksleep.call_args.args[0]
+    assert second.attempt == 1
+    assert second.status == 200
+    assert second.retry_reason is None
+    assert not second.retried
+
+    snapshot = transport.metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["attempts"] == 2
+    assert snapshot["retries"] == 1
+    assert snapshot["retry_reasons"] == {"default_check_transient_error": 1}
+    assert snapshot["status_codes"] == {500: 1, 200: 1}
+    assert snapshot["hosts"]["foo.api.globus.org"]["retries"] == 1
+
+
+def test_errors_are_recorded(attempts):
+    transport = RequestsTransport(max_retries=1)
+    transport.metrics.add_listener(attempts.append)
+    load_response(
+        RegisteredResponse(path=URL, body=requests.ConnectionError("oops")),
+    )
+    load_response(
+        RegisteredResponse(path=URL, body=requests.ConnectionError("oops again")),
+    )
+
+    with pytest.raises(globus_sdk.NetworkError):
+        transport.request("GET", URL)
+
+    first, second = attempts
+    assert first.error == second.error == "ConnectionError"
+    assert first.status is None
+    assert first.time_to_first_byte is None
+    assert first.retry_reason == "default_check_request_exception"
+    assert first.retried
+    # no checks run after the last attempt
+    assert second.retry_reason is None
+    assert not second.retried
+    assert transport.metrics.snapshot()["errors"] == 2
+
+
+@pytest.mark.parametrize(
+    "transport_params, stop_reason",
+    [
+        ({"max_retries": 0}, "max_retries"),
+        (
+            {"retry_budget": RetryBudget(ratio=0, min_retries=0)},
+            "retry_budget",
+        ),
+        ({"request_deadline": 1}, "deadline"),
+    ],
+)
+def test_stopped_retries_are_recorded(attempts, transport_params, stop_reason):
+    transport = RequestsTransport(**transport_params)
+    transport.metrics.add_listener(attempts.append)
+    load_response(
+        RegisteredResponse(
+            path=URL, status=503, headers={"Retry-After": "5"}, body="Uh-oh!"
+        )
+    )
+
+    assert transport.request("GET", URL).status_code == 503
+
+    (attempt,) = attempts
+    # a retry was requested, but not made
+    assert attempt.retry_reason is None
+    assert attempt.stop_reason == stop_reason
+    assert not attempt.retried
+    snapshot = transport.metrics.snapshot()
+    assert snapshot["retries"] == 0
+    assert snapshot["retry_reasons"] == {}
+    assert snapshot["stop_reasons"] == {stop_reason: 1}
+
+
+def test_async_requests_are_recorded(transport, attempts):
+    load_response(RegisteredResponse(path=URL, json={"x": 1}))
+
+    asyncio.run(transport.request_async("GET", URL))
+
+    (attempt,) = attempts
+    assert attempt.status == 200
+    assert transport.metrics.snapshot()["requests"] == 1
+
+
+def test_metrics_may_be_shared():
+    metrics = TransportMetrics()
+    load_response(RegisteredResponse(path=URL, json={"x": 1}))
+
+    for _ in range(2):
+        RequestsTransport(metrics=metrics).request("GET", URL)
+
+    assert metrics.snapshot()["requests"] == 2
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = TransportMetrics(latency_buckets=(0.1, 1.0))
+    for total_time in (0.05, 0.5, 0.5, 5.0):
+        metrics.record_attempt(_attempt(total_time=total_time))
+
+    latency = metrics.snapshot()["hosts"]["foo.api.globus.org"]["latency"]
+    assert latency["buckets"] == {0.1: 1, 1.0: 3, float("inf"): 4}
+    assert latency["count"] == 4
+    assert latency["sum"] == pytest.approx(6.05)
+
+
+def test_listener_errors_are_ignored(caplog):
+    metrics = TransportMetrics()
+    seen = []
+
+    @metrics.add_listener
+    def bad_listener(attempt):
+        raise ValueError("oops")
+
+    metrics.add_listener(seen.append)
+    metrics.record_attempt(_attempt())
+
+    assert len(seen) == 1
+    assert "error in transport metrics listener" in caplog.text
+
+
+def test_remove_listener_and_reset():
+    seen = []
+    metrics = TransportMetrics(listeners=[seen.append])
+    metrics.record_attempt(_attempt())
+    metrics.remove_listener(seen.append)
+    metrics.record_attempt(_attempt())
+    assert len(seen) == 1
+    assert metrics.snapshot()["attempts"] == 2
+
+    metrics.reset()
+    assert metrics.snapshot()["attempts"] == 0
+    assert metrics.snapshot()["hosts"] == {}
+
+
+def test_metrics_are_picklable():
+    metrics = TransportMetrics(listeners=[lambda attempt: None])
+    metrics.record_attempt(_attempt())
+
+    restored = pickle.loads(pickle.dumps(metrics))
+    assert restored.snapshot() == metrics.snapshot()
+    restored.record_attempt(_attempt())
+    assert restored.snapshot()["attempts"] == 2
+
+
+def test_streamed_response_size_uses_content_length(transport, attempts):
+    responses.add(
+        responses.GET, URL, body=b"0123456789", headers={"Content-Length": "10"}
+    )
+
+    transport.request("GET", URL, stream=True)
+
+    (attempt,) = attempts
+    assert attempt.response_bytes == 10
@@ -0,0 +1,173 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.transport import (
+    AdaptiveRateLimiter,
+    RateLimitedError,
+    RequestsTransport,
+)
+from tests.common import make_requests_response
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_rate": 0},
+        {"max_rate": 1, "min_rate": 2},
+        {"max_rate": 1, "decrease_factor": 1},
+        {"max_rate": 1, "burst": 0},
+    ],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(**kwargs)
+
+
+def test_requests_are_paced_at_rate(clock, mocksleep):
+    limiter = AdaptiveRateLimiter(max_rate=4)
+
+    delays = [limiter._reserve() for _ in range(4)]
+    assert delays == [0.0, 0.25, 0.5, 0.75]
+
+    # once time passes, the schedule catches up
+    clock.now += 10
+    assert limiter._reserve() == 0.0
+
+
+def test_burst_allows_requests_without_delay(clock):
+    limiter = AdaptiveRateLimiter(max_rate=2, burst=3)
+
+    delays = [limiter._reserve() for _ in range(5)]
+    assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+
+def test_acquire_sleeps_for_delay(clock, mocksleep):
+    limiter = AdaptiveRateLimiter(max_rate=2)
+    limiter.acquire()
+    mocksleep.assert_not_called()
+    limiter.acquire()
+    mocksleep.assert_called_once_with(0.5)
+
+
+def test_acquire_async_does_not_block(clock, mocksleep):
+    limiter = AdaptiveRateLimiter(max_rate=2)
+
+    async def main():
+        with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock) as m:
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+            return m
+
+    async_sleep = asyncio.run(main())
+    async_sleep.assert_awaited_once_with(0.5)
+    mocksleep.assert_not_called()
+
+
+def test_throttling_decreases_rate_once_per_cooldown(clock):
+    limiter = AdaptiveRateLimiter(max_rate=10, decrease_factor=0.5)
+
+    limiter.record_response(make_requests_response(429))
+    assert limiter.rate == 5
+    # a second throttle from the same burst of requests is ignored
+    limiter.record_response(make_requests_response(503))
+    assert limiter.rate == 5
+
+    clock.now += limiter.DECREASE_COOLDOWN
+    limiter.record_response(make_requests_response(429))
+    assert limiter.rate == 2.5
+
+
+def test_rate_does_not_go_below_min(clock):
+    limiter = AdaptiveRateLimiter(max_rate=1, min_rate=0.75)
+    limiter.record_response(make_requests_response(429))
+    assert limiter.rate == 0.75
+
+
+def test_success_increases_rate_up_to_max(clock):
+    limiter = AdaptiveRateLimiter(max_rate=10, initial_rate=9, additive_increase=0.5)
+
+    limiter.record_response(make_requests_response(200))
+    assert limiter.rate == 9.5
+    limiter.record_response(make_requests_response(404))
+    assert limiter.rate == 10
+    limiter.record_response(make_requests_response(200))
+    assert limiter.rate == 10
+
+
+def test_retry_after_pauses_all_requests(clock):
+    limiter = AdaptiveRateLimiter(max_rate=100, burst=10)
+
+    limiter.record_response(make_requests_response(429, {"Retry-After": "5"}))
+    # the first request after the pause may go at the end of the pause
+    assert limiter._reserve() == pytest.approx(5.0)
+    # and later ones are paced, rather than all going at once
+    assert limiter._reserve() == pytest.approx(5.02)
+
+
+def test_transport_paces_attempts_and_learns_from_responses(mocksleep):
+    limiter = AdaptiveRateLimiter(max_rate=10)
+    transport = RequestsTransport(rate_limiter=limiter)
+
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar",
+            status=429,
+            headers={"Retry-After": "1"},
+            body="Slow down!",
+        )
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    with mock.patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+        res = transport.request("GET", "https://foo.api.globus.org/bar")
+    assert res.status_code == 200
+
+    # each attempt went through the limiter, and the 429 reduced the rate
+    # (and the 200 increased it again, slightly)
+    assert acquire.call_count == 2
+    assert limiter.rate == pytest.approx(5.1)
+
+
+def test_retry_after_pause_is_capped(clock):
+    limiter = AdaptiveRateLimiter(max_rate=100, max_pause=10)
+
+    limiter.record_response(make_requests_response(429, {"Retry-After": "3600"}))
+
+    assert limiter._reserve() == pytest.approx(10.0)
+
+
+def test_acquire_fails_fast_past_deadline(clock, mocksleep):
+    limiter = AdaptiveRateLimiter(max_rate=100)
+    limiter.record_response(make_requests_response(429, {"Retry-After": "5"}))
+
+    with pytest.raises(RateLimitedError) as excinfo:
+        limiter.acquire(deadline=clock.now + 2)
+    assert excinfo.value.delay == pytest.approx(5.0)
+    mocksleep.assert_not_called()
+
+    # no token was taken, so a later request waits only for the pause
+    limiter.acquire(deadline=clock.now + 6)
+    mocksleep.assert_called_once_with(pytest.approx(5.0))
+
+
+def test_acquire_async_fails_fast_past_deadline(clock):
+    limiter = AdaptiveRateLimiter(max_rate=100)
+    limiter.record_response(make_requests_response(429, {"Retry-After": "5"}))
+
+    with pytest.raises(RateLimitedError):
+        asyncio.run(limiter.acquire_async(deadline=clock.now + 2))
+
+
+def test_transport_does_not_wait_on_limiter_past_deadline(mocksleep):
+    limiter = AdaptiveRateLimiter(max_rate=10)
+    limiter.record_response(make_requests_response(429, {"Retry-After": "5"}))
+    transport = RequestsTransport(rate_limiter=limiter, request_deadline=1)
+
+    with pytest.raises(RateLimitedError):
+        transport.request("GET", "https://foo.api.globus.org/bar")
+    mocksleep.assert_not_called()
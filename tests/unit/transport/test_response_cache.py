@@ -0,0 +1,219 @@
+import asyncio
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.authorizers import AccessTokenAuthorizer
+from globus_sdk.transport import (
+    AdaptiveRateLimiter,
+    CacheEntry,
+    CircuitBreaker,
+    FileCacheStorage,
+    MemoryCacheStorage,
+    RequestsTransport,
+    ResponseCache,
+)
+
+URL = "https://foo.api.globus.org/v0.10/endpoint/abc"
+
+
+@pytest.fixture
+def clock():
+    now = [1_000_000.0]
+    with mock.patch("time.time", side_effect=lambda: now[0]):
+        yield now
+
+
+def _entry(body=b"{}"):
+    return CacheEntry(
+        status_code=200,
+        headers={"ETag": '"v1"'},
+        content=body,
+        url=URL,
+        expires_at=0,
+    )
+
+
+def _transport(**kwargs):
+    return RequestsTransport(response_cache=ResponseCache(**kwargs))
+
+
+def test_memory_storage_evicts_least_recently_used():
+    storage = MemoryCacheStorage(max_entries=2)
+    storage.set("a", _entry(b"a"))
+    storage.set("b", _entry(b"b"))
+    storage.get("a")
+    storage.set("c", _entry(b"c"))
+    assert storage.get("b") is None
+    assert storage.get("a").content == b"a"
+    assert storage.get("c").content == b"c"
+
+
+def test_file_storage_round_trip(tmp_path):
+    storage = FileCacheStorage(tmp_path / "cache")
+    storage.set("a", _entry(b"\x00data"))
+
+    # a second storage on the same directory sees the entry
+    entry = FileCacheStorage(tmp_path / "cache").get("a")
+    assert entry.content == b"\x00data"
+    assert entry.etag == '"v1"'
+
+    (tmp_path / "cache" / "b.json").write_text("not json")
+    assert storage.get("b") is None
+    assert not (tmp_path / "cache" / "b.json").exists()
+
+    storage.clear()
+    assert storage.get("a") is None
+
+
+def test_max_age_response_is_served_from_cache(clock):
+    transport = _transport()
+    load_response(
+        RegisteredResponse(
+            path=URL, json={"x": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+    )
+
+    first = transport.request("GET", URL)
+    second = transport.request("GET", URL)
+    assert len(responses.calls) == 1
+    assert second.status_code == 200
+    assert second.json() == first.json() == {"x": 1}
+
+    clock[0] += 61
+    transport.request("GET", URL)
+    assert len(responses.calls) == 2
+
+
+def test_cache_hit_skips_rate_limiter_breaker_and_metrics(clock):
+    limiter = mock.Mock(spec=AdaptiveRateLimiter)
+    breaker = mock.Mock(spec=CircuitBreaker)
+    transport = _transport()
+    load_response(
+        RegisteredResponse(
+            path=URL, json={"x": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    transport.request("GET", URL)
+    transport.rate_limiter = limiter
+    transport.circuit_breaker = breaker
+
+    res = transport.request("GET", URL)
+    assert res.json() == {"x": 1}
+    assert len(responses.calls) == 1
+    limiter.acquire.assert_not_called()
+    breaker.before_request.assert_not_called()
+    snapshot = transport.metrics.snapshot()
+    assert snapshot["requests"] == 1
+    assert snapshot["attempts"] == 1
+
+
+def test_async_cache_hit_is_served_before_any_attempt(clock):
+    transport = _transport()
+    load_response(
+        RegisteredResponse(
+            path=URL, json={"x": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+    )
+    transport.request("GET", URL)
+    transport.circuit_breaker = mock.Mock(spec=CircuitBreaker)
+
+    res = asyncio.run(transport.request_async("GET", URL))
+    assert res.json() == {"x": 1}
+    assert len(responses.calls) == 1
+    transport.circuit_breaker.before_request.assert_not_called()
+    assert transport.metrics.snapshot()["attempts"] == 1
+
+
+def test_stale_response_is_revalidated(clock):
+    transport = _transport()
+    load_response(
+        RegisteredResponse(
+            path=URL,
+            json={"x": 1},
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+    )
+    load_response(RegisteredResponse(path=URL, status=304, body=""))
+
+    transport.request("GET", URL)
+    res = transport.request("GET", URL)
+    assert len(responses.calls) == 2
+    revalidation = responses.calls[1].request
+    assert revalidation.headers["If-None-Match"] == '"v1"'
+    assert revalidation.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert res.status_code == 200
+    assert res.json() == {"x": 1}
+
+
+def test_route_ttl_applies_without_caching_headers(clock):
+    transport = _transport(route_ttls={"/v0.10/endpoint/*": 30})
+    other_url = "https://foo.api.globus.org/v0.10/task/abc"
+    load_response(RegisteredResponse(path=URL, json={"x": 1}))
+    load_response(RegisteredResponse(path=other_url, json={"x": 2}))
+
+    for _ in range(2):
+        transport.request("GET", URL)
+        transport.request("GET", other_url)
+    assert [c.request.url for c in responses.calls] == [URL, other_url, other_url]
+
+
+@pytest.mark.parametrize("cache_control", ["no-store", "max-age=60, no-store"])
+def test_no_store_response_is_not_cached(clock, cache_control):
+    transport = _transport(default_ttl=60)
+    load_response(
+        RegisteredResponse(
+            path=URL, json={}, headers={"Cache-Control": cache_control, "ETag": "x"}
+        )
+    )
+    transport.request("GET", URL)
+    transport.request("GET", URL)
+    assert len(responses.calls) == 2
+    assert "If-None-Match" not in responses.calls[1].request.headers
+
+
+def test_entries_are_keyed_by_query_and_identity(clock):
+    transport = _transport(default_ttl=60)
+    load_response(RegisteredResponse(path=URL, json={}))
+
+    transport.request("GET", URL, authorizer=AccessTokenAuthorizer("tok1"))
+    transport.request("GET", URL, authorizer=AccessTokenAuthorizer("tok1"))
+    transport.request("GET", URL, authorizer=AccessTokenAuthorizer("tok2"))
+    transport.request("GET", URL, query_params={"fields": "id"})
+    assert len(responses.calls) == 3
+
+
+def test_keys_accept_bytes_authorization_headers():
+    cache = ResponseCache()
+    as_str = requests.Request("GET", URL, headers={"Authorization": "Bearer x"})
+    as_bytes = requests.Request("GET", URL, headers={"Authorization": b"Bearer x"})
+
+    assert cache.get_key(as_str.prepare()) == cache.get_key(as_bytes.prepare())
+
+
+def test_unsafe_request_invalidates_entry(clock):
+    transport = _transport(default_ttl=60)
+    load_response(RegisteredResponse(path=URL, json={}))
+    load_response(RegisteredResponse(path=URL, method="PUT", json={}))
+
+    transport.request("GET", URL)
+    transport.request("PUT", URL, data={"x": 1})
+    transport.request("GET", URL)
+    assert len(responses.calls) == 3
+
+
+def test_client_returns_cached_globus_http_response(clock):
+    client = globus_sdk.TransferClient(
+        transport_params={"response_cache": ResponseCache(default_ttl=60)}
+    )
+    endpoint_id = load_response(client.get_endpoint).metadata["endpoint_id"]
+
+    first = client.get_endpoint(endpoint_id)
+    second = client.get_endpoint(endpoint_id)
+    assert len(responses.calls) == 1
+    assert isinstance(second, globus_sdk.GlobusHTTPResponse)
+    assert second.data == first.data
@@ -0,0 +1,135 @@
+import asyncio
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.transport import RequestsTransport, RetryBudget
+
+URL = "https://foo.api.globus.org/bar"
+
+
+@pytest.fixture
+def clock(clock, mocksleep):
+    # sleeps between retries move the clock forward
+    mocksleep.side_effect = clock.sleep
+    return clock
+
+
+def _load_errors(n, **kwargs):
+    for _ in range(n):
+        load_response(RegisteredResponse(path=URL, status=500, body="Uh-oh!", **kwargs))
+
+
+def test_budget_allows_min_retries_without_requests(clock):
+    budget = RetryBudget(ratio=0.1, min_retries=2)
+    assert budget.try_acquire_retry()
+    assert budget.try_acquire_retry()
+    assert not budget.try_acquire_retry()
+
+
+def test_budget_grows_with_requests(clock):
+    budget = RetryBudget(ratio=0.5, min_retries=0)
+    assert not budget.try_acquire_retry()
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_acquire_retry()
+    assert budget.try_acquire_retry()
+    assert not budget.try_acquire_retry()
+
+
+def test_budget_window_slides(clock):
+    budget = RetryBudget(ratio=0, window=10, min_retries=1)
+    assert budget.try_acquire_retry()
+    assert not budget.try_acquire_retry()
+    clock.now += 11
+    assert budget.try_acquire_retry()
+
+
+def test_invalid_ratio():
+    with pytest.raises(ValueError):
+        RetryBudget(ratio=-1)
+
+
+def test_transport_stops_retrying_when_budget_is_exhausted(clock):
+    budget = RetryBudget(ratio=0, min_retries=2)
+    transport = RequestsTransport(retry_budget=budget)
+    _load_errors(6)
+
+    res = transport.request("GET", URL)
+    assert res.status_code == 500
+    assert len(responses.calls) == 3
+
+    # the budget is shared by all requests, so the next one gets no retries
+    res = transport.request("GET", URL)
+    assert len(responses.calls) == 4
+
+
+def test_transport_stops_retrying_at_deadline(clock):
+    transport = RequestsTransport(request_deadline=5, retry_backoff=lambda ctx: 2)
+    _load_errors(6)
+
+    res = transport.request("GET", URL)
+    assert res.status_code == 500
+    # attempts at t=0, 2, 4; the third sleep is cut short at the deadline
+    assert len(responses.calls) == 3
+    assert clock.now == 1005
+
+
+def test_transport_does_not_wait_for_retry_after_past_deadline(clock, mocksleep):
+    transport = RequestsTransport(request_deadline=5)
+    load_response(
+        RegisteredResponse(
+            path=URL, status=429, headers={"Retry-After": "8"}, body="Slow down!"
+        )
+    )
+
+    res = transport.request("GET", URL)
+    assert res.status_code == 429
+    assert len(responses.calls) == 1
+    mocksleep.assert_not_called()
+
+
+def test_transport_deadline_raises_last_error(clock):
+    transport = RequestsTransport(request_deadline=3, retry_backoff=lambda ctx: 2)
+    for _ in range(3):
+        responses.add(responses.GET, URL, body=requests.ConnectionError("oops"))
+
+    with pytest.raises(globus_sdk.NetworkError):
+        transport.request("GET", URL)
+    assert len(responses.calls) == 2
+
+
+def test_attempt_timeout_is_reduced_to_fit_deadline(clock):
+    transport = RequestsTransport(http_timeout=60, request_deadline=5)
+    load_response(RegisteredResponse(path=URL, json={"baz": 1}))
+
+    with mock.patch.object(
+        transport.session, "send", wraps=transport.session.send
+    ) as send:
+        transport.request("GET", URL)
+        assert send.call_args.kwargs["timeout"] == 5
+
+        with transport.tune(request_deadline=100):
+            transport.request("GET", URL)
+        assert send.call_args.kwargs["timeout"] == 60
+
+
+def test_async_transport_stops_retrying_at_deadline(clock):
+    transport = RequestsTransport(request_deadline=5, retry_backoff=lambda ctx: 2)
+    _load_errors(6)
+
+    async def fake_sleep(seconds):
+        clock.now += seconds
+
+    async def main():
+        with mock.patch("asyncio.sleep", side_effect=fake_sleep):
+            return await transport.request_async("GET", URL)
+
+    res = asyncio.run(main())
+    assert res.status_code == 500
+    assert len(responses.calls) == 3
+    assert clock.now == 1005
@@ -0,0 +1,141 @@
+import asyncio
+import gzip
+import io
+import json
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import RegisteredResponse, get_last_request, load_response
+from globus_sdk.authorizers import AccessTokenAuthorizer, NullAuthorizer
+from globus_sdk.transport import RequestsTransport, RequestTemplate
+
+BASE_URL = "https://foo.api.globus.org"
+
+
+def test_compile_request_finds_path_params():
+    template = RequestsTransport().compile_request(
+        "GET", f"{BASE_URL}/{{a}}/x/{{b}}/{{a}}", query_params={"q": "1"}
+    )
+
+    assert isinstance(template, RequestTemplate)
+    assert template.path_params == ("a", "b")
+    assert template.url == f"{BASE_URL}/{{a}}/x/{{b}}/{{a}}?q=1"
+
+
+@pytest.mark.parametrize("url", [f"{BASE_URL}/{{}}", f"{BASE_URL}/{{a!r}}"])
+def test_compile_request_rejects_invalid_path_params(url):
+    with pytest.raises(globus_sdk.GlobusSDKUsageError):
+        RequestsTransport().compile_request("GET", url)
+
+
+@pytest.mark.parametrize("body", [io.BytesIO(b"x"), iter([b"x"])])
+def test_templates_reject_one_shot_bodies(body):
+    req = requests.Request("POST", f"{BASE_URL}/bar", data=body)
+
+    with pytest.raises(globus_sdk.GlobusSDKUsageError, match="read once"):
+        RequestTemplate.from_request(req, [])
+
+
+def test_templates_accept_streamed_json_bodies():
+    transport = RequestsTransport(stream_json_bodies=True)
+    template = transport.compile_request("POST", f"{BASE_URL}/bar", data={"x": 1})
+
+    for _ in range(2):
+        body = template.build().prepare().body
+        assert json.loads(b"".join(body)) == {"x": 1}
+
+
+def test_send_template_fills_in_path_params():
+    for task_id in ("a%2Fb%20c", "123"):
+        load_response(
+            RegisteredResponse(
+                path=f"{BASE_URL}/task/{task_id}", method="POST", json={}
+            )
+        )
+    transport = RequestsTransport()
+    template = transport.compile_request(
+        "POST", f"{BASE_URL}/task/{{task_id}}", query_params={"q": "1"}, data={"x": 1}
+    )
+
+    transport.send_template(template, {"task_id": "a/b c"})
+    assert get_last_request().url == f"{BASE_URL}/task/a%2Fb%20c?q=1"
+
+    transport.send_template(template, {"task_id": 123})
+    last_req = get_last_request()
+    assert last_req.url == f"{BASE_URL}/task/123?q=1"
+    assert json.loads(last_req.body) == {"x": 1}
+    assert last_req.headers["User-Agent"] == transport.user_agent
+
+
+@pytest.mark.parametrize(
+    "path_params", [{}, {"task_id": "1", "other": "2"}, {"other": "1"}]
+)
+def test_send_template_rejects_mismatched_path_params(path_params):
+    transport = RequestsTransport()
+    template = transport.compile_request("GET", f"{BASE_URL}/task/{{task_id}}")
+
+    with pytest.raises(globus_sdk.GlobusSDKUsageError, match="do not match"):
+        transport.send_template(template, path_params)
+
+
+def test_send_template_does_not_encode_again():
+    load_response(RegisteredResponse(path=f"{BASE_URL}/bar", method="POST", json={}))
+    transport = RequestsTransport()
+    template = transport.compile_request("POST", f"{BASE_URL}/bar", data={"x": 1})
+
+    with mock.patch.object(transport, "_encode") as encode:
+        for _ in range(3):
+            transport.send_template(template)
+
+    encode.assert_not_called()
+    assert len(responses.calls) == 3
+
+
+def test_send_template_sets_authorization_for_each_attempt(mocksleep):
+    load_response(RegisteredResponse(path=f"{BASE_URL}/bar", status=500, body="no"))
+    load_response(RegisteredResponse(path=f"{BASE_URL}/bar", json={}))
+    authorizer = mock.Mock(wraps=AccessTokenAuthorizer("token"))
+    transport = RequestsTransport()
+    template = transport.compile_request(
+        "GET", f"{BASE_URL}/bar", headers={"Authorization": "Bearer stale"}
+    )
+
+    transport.send_template(template, authorizer=authorizer)
+
+    assert authorizer.get_authorization_header.call_count == 2
+    assert [call.request.headers["Authorization"] for call in responses.calls] == [
+        "Bearer token",
+        "Bearer token",
+    ]
+
+    # without an authorizer, the header of the template is sent
+    transport.send_template(template)
+    assert get_last_request().headers["Authorization"] == "Bearer stale"
+
+    # a NullAuthorizer removes the header
+    transport.send_template(template, authorizer=NullAuthorizer())
+    assert "Authorization" not in get_last_request().headers
+
+
+def test_send_template_compresses_each_send():
+    load_response(RegisteredResponse(path=f"{BASE_URL}/bar", method="POST", json={}))
+    transport = RequestsTransport(request_compression_threshold=1)
+    template = transport.compile_request("POST", f"{BASE_URL}/bar", data={"x": 1})
+
+    for _ in range(2):
+        transport.send_template(template)
+        assert json.loads(gzip.decompress(get_last_request().body)) == {"x": 1}
+
+
+def test_send_template_async():
+    load_response(RegisteredResponse(path=f"{BASE_URL}/task/1", json={"x": 1}))
+    transport = RequestsTransport()
+    template = transport.compile_request("GET", f"{BASE_URL}/task/{{task_id}}")
+
+    response = asyncio.run(transport.send_template_async(template, {"task_id": "1"}))
+
+    assert response.json() == {"x": 1}
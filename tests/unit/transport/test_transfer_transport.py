@@ -1,4 +1,6 @@
-from unittest import mock
+import json
+
+import requests
 
 from globus_sdk.services.transfer.transport import TransferRequestsTransport
 from globus_sdk.transport import RetryCheckRunner, RetryContext
@@ -16,8 +18,8 @@ def test_transfer_does_not_retry_external():
         "request_id": "rhvcR0aHX",
     }
 
-    dummy_response = mock.Mock()
-    dummy_response.json = lambda: body
+    dummy_response = requests.Response()
+    dummy_response._content = json.dumps(body).encode("utf-8")
     dummy_response.status_code = 502
     ctx = RetryContext(1, response=dummy_response)
 
@@ -39,8 +41,8 @@ def test_transfer_does_not_retry_endpoint_error():
         "request_id": "istNh0Zpz",
     }
 
-    dummy_response = mock.Mock()
-    dummy_response.json = lambda: body
+    dummy_response = requests.Response()
+    dummy_response._content = json.dumps(body).encode("utf-8")
     dummy_response.status_code = 502
     ctx = RetryContext(1, response=dummy_response)
 
@@ -51,11 +53,9 @@ def test_transfer_retries_others():
     transport = TransferRequestsTransport()
     checker = RetryCheckRunner(transport.retry_checks)
 
-    def _raise_value_error():
-        raise ValueError()
-
-    dummy_response = mock.Mock()
-    dummy_response.json = _raise_value_error
+    # a body which is not JSON
+    dummy_response = requests.Response()
+    dummy_response._content = b"<html>Bad Gateway</html>"
     dummy_response.status_code = 502
     ctx = RetryContext(1, response=dummy_response)
 
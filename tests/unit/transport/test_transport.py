@@ -2,8 +2,10 @@ import pathlib
 from unittest import mock
 
 import pytest
+import responses
 
-from globus_sdk.transport import RequestsTransport, RetryContext
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.transport import JSONRequestEncoder, RequestsTransport, RetryContext
 from globus_sdk.transport.requests import _exponential_backoff
 
 
@@ -35,6 +37,7 @@ ca_bundle_non_existent = ca_bundle_directory / "bogus.bogus"
         ("max_sleep", 10, 1),
         ("max_retries", 0, 5),
         ("max_retries", 10, 0),
+        ("request_deadline", 30, 5),
     ],
 )
 def test_transport_tuning(param_name, init_value, tune_value):
@@ -118,3 +121,21 @@ def test_transport_close_closes_session():
     with mock.patch.object(transport, "session") as mocked_session:
         transport.close()
         mocked_session.close.assert_called_once_with()
+
+
+def test_transport_can_stream_json_bodies(mocksleep):
+    transport = RequestsTransport(stream_json_bodies=True)
+    assert isinstance(transport.encoders["json"], JSONRequestEncoder)
+    assert transport.encoders["json"].stream
+    # the class-level encoders are not modified
+    assert not RequestsTransport.encoders["json"].stream
+
+    url = "https://foo.api.globus.org/bar"
+    load_response(RegisteredResponse(path=url, method="POST", status=500, body=""))
+    load_response(RegisteredResponse(path=url, method="POST", json={}))
+    transport.request("POST", url, data={"baz": [1, 2]})
+
+    # the body was sent in full on both attempts
+    assert len(responses.calls) == 2
+    for call in responses.calls:
+        assert b"".join(call.request.body) == b'{"baz": [1, 2]}'
@@ -1,11 +1,22 @@
+import enum
+import json
 import uuid
 
 import pytest
 
-from globus_sdk.transport import FormRequestEncoder, JSONRequestEncoder, RequestEncoder
+from globus_sdk.transport import (
+    FormRequestEncoder,
+    JSONRequestEncoder,
+    RequestEncoder,
+    StreamingJSONBody,
+)
 from globus_sdk.utils import MISSING, PayloadWrapper
 
 
+class _Color(enum.Enum):
+    red = "red"
+
+
 @pytest.mark.parametrize("data", ("foo", b"bar"))
 def test_text_request_encoder_accepts_string_data(data):
     encoder = RequestEncoder()
@@ -158,3 +169,64 @@ def test_form_encoder_payload_preparation(
         headers={},
     )
     assert request.data == expected_data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"foo": 1},
+        PayloadWrapper(foo=uuid.UUID(int=1), bar=MISSING),
+        {"foo": ({"bar": uuid.UUID(int=2)},), "baz": [MISSING, 1, MISSING, []]},
+        {"bar": PayloadWrapper(foo=1), "baz": [2, PayloadWrapper(foo=_Color.red)]},
+        {2: 2.5, True: None, None: 'é\n"', "x": {}, "y": [[], {"z": False}]},
+        [None, 1, MISSING, 0],
+        "just a string",
+    ],
+)
+def test_streaming_json_body_matches_prepared_data(data):
+    encoder = JSONRequestEncoder()
+    expected = json.dumps(encoder._prepare_data(data)).encode("utf-8")
+    body = StreamingJSONBody(encoder, data)
+    assert b"".join(body) == expected
+    # the body may be iterated again, as when a request is retried
+    assert b"".join(body) == expected
+
+
+def test_streaming_json_body_is_chunked():
+    data = {"DATA": [{"source_path": f"/~/{i}"} for i in range(1000)]}
+    chunks = list(StreamingJSONBody(JSONRequestEncoder(), data, chunk_size=1024))
+    assert len(chunks) > 10
+    assert all(len(chunk) < 2048 for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == data
+
+
+@pytest.mark.parametrize(
+    "data, error_class",
+    [
+        ({"foo": object()}, TypeError),
+        ({(1, 2): "foo"}, TypeError),
+        ({"foo": float("nan")}, ValueError),
+    ],
+)
+def test_streaming_json_body_rejects_invalid_data(data, error_class):
+    with pytest.raises(error_class):
+        b"".join(StreamingJSONBody(JSONRequestEncoder(), data))
+
+
+def test_streaming_json_encoder_sends_chunked_body():
+    encoder = JSONRequestEncoder(stream=True)
+    request = encoder.encode(
+        "POST", "http://bogus/foo", params={}, data={"foo": MISSING}, headers={}
+    )
+    assert isinstance(request.data, StreamingJSONBody)
+    prepared = request.prepare()
+    assert prepared.headers["Content-Type"] == "application/json"
+    assert prepared.headers["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in prepared.headers
+    assert b"".join(prepared.body) == b"{}"
+
+    # no data means no body, as with the default encoder
+    request = encoder.encode(
+        "GET", "http://bogus/foo", params={}, data=None, headers={}
+    )
+    assert request.prepare().body is None